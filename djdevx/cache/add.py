@@ -16,6 +16,8 @@ from ..utils.installable.tracking import (
     get_installable_names,
     get_installed_names,
 )
+from ..utils.prek.prek import formatting_queue
+from ..utils.tracking import tracking_session
 
 
 def _autocomplete_cache(incomplete: str) -> list[str]:
@@ -34,6 +36,17 @@ def add(
         bool,
         typer.Option("--verbose", "-v", help="Show full pixi output"),
     ] = False,
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", help="Print the install plan without applying it"),
+    ] = False,
+    ruff_only: Annotated[
+        bool,
+        typer.Option(
+            "--ruff-only",
+            help="Format generated Python files with ruff only instead of all prek hooks",
+        ),
+    ] = False,
 ) -> None:
     """Add a cache."""
     installed = get_installed_names(BaseCache)
@@ -64,4 +77,5 @@ def add(
         list_caches_table()
         raise typer.Exit(code=1)
 
-    add_installable(cls, name, verbose=verbose)
+    with tracking_session(), formatting_queue(ruff_only=ruff_only):
+        add_installable(cls, name, verbose=verbose, dry_run=dry_run)
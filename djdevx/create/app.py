@@ -4,6 +4,7 @@ from pathlib import Path
 
 from ..utils.project.project_structure import ProjectStructure
 from ..utils.project.pixi_runner import PixiRunner
+from ..utils.project.url_registry import sync_url_registry
 from ..utils.templates.manager import TemplateManager
 
 
@@ -22,3 +23,4 @@ def startapp(application_name: str) -> None:
         dest_dir=structure.root,
         template_context={"application_name": application_name},
     )
+    sync_url_registry(structure)
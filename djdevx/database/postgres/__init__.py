@@ -5,7 +5,11 @@ import shutil
 from .._base import BaseDatabase
 from .._registry import register
 from ...utils.devcontainer import ServiceConfig, VolumeConfig, DockerComposeManager
-from ...utils.services import PostgresService
+from ...utils.installable.types import InstallParam
+from ...utils.installable.pixi_ops import PixiOps
+from ...utils.services import PgBouncerService, PostgresService
+from ...utils.services.pgbouncer import PGBOUNCER_IMAGE, pool_sizes
+from ...utils.tracking import ProjectTracking
 from ...utils.types.pixi_types import PixiPackageSpec
 
 POSTGRES_ENV_VARIABLES = {
@@ -42,6 +46,29 @@ PGADMIN_DOCKER_SERVICE: ServiceConfig = {
     "depends_on": ["db"],
 }
 
+# Transaction-pooling PgBouncer in front of "db"; the generated settings
+# point the devcontainer at it (see database.py.j2).
+PGBOUNCER_DOCKER_SERVICE: ServiceConfig = {
+    "name": "pgbouncer",
+    "image": PGBOUNCER_IMAGE,
+    "environment": {
+        "DB_HOST": "db",
+        "DB_USER": POSTGRES_ENV_VARIABLES["POSTGRES_USER"],
+        "DB_PASSWORD": POSTGRES_ENV_VARIABLES["POSTGRES_PASSWORD"],
+        "LISTEN_PORT": "5432",
+        "AUTH_TYPE": "scram-sha-256",
+        "POOL_MODE": "transaction",
+        "MAX_CLIENT_CONN": str(pool_sizes()["max_client_conn"]),
+        "DEFAULT_POOL_SIZE": str(pool_sizes()["default_pool_size"]),
+    },
+    "networks": ["devcontainer"],
+    "depends_on": ["db"],
+}
+
+PGBOUNCER_PIXI_PACKAGE = PixiPackageSpec(
+    name="pgbouncer", kind="conda", pixi_feature="dev"
+)
+
 PGADMIN_VOLUMES: list[VolumeConfig] = [
     {
         "name": "pgadmin-data",
@@ -60,24 +87,59 @@ class PostgresDatabase(BaseDatabase):
     display_name: str = "PostgreSQL"
     description: str = "PostgreSQL database provider for Django projects."
     pixi_packages: list[PixiPackageSpec] = [
-        PixiPackageSpec(name="psycopg2-binary", kind="conda"),
+        PixiPackageSpec(name="psycopg", kind="conda"),
+        PixiPackageSpec(name="psycopg-pool", kind="conda"),
         PixiPackageSpec(name="postgresql", kind="conda", pixi_feature="dev"),
     ]
     restore_on_remove: dict[str, str] = {
         "settings/django/database.py": "settings/django/database.py"
     }
+    install_params: list[InstallParam] = [
+        InstallParam(
+            name="pgbouncer",
+            type_=bool,
+            default=False,
+            help="Add a transaction-pooling PgBouncer in front of PostgreSQL",
+            prompt="Add PgBouncer (transaction pooling) in front of PostgreSQL?",
+        ),
+    ]
 
     def after_pixi_install(self) -> None:
         compose = DockerComposeManager(self.structure.root)
         compose.add_service(POSTGRES_DOCKER_SERVICE, POSTGRES_VOLUMES)
         compose.add_service(PGADMIN_DOCKER_SERVICE, PGADMIN_VOLUMES)
+        if self._install_context.get("pgbouncer"):
+            PixiOps(self.structure.root, self.verbose).add_packages(
+                [PGBOUNCER_PIXI_PACKAGE]
+            )
+            compose.add_service(PGBOUNCER_DOCKER_SERVICE, [])
+            ProjectTracking(self.structure.root).set_dev_config(
+                PgBouncerService.name, {"enabled": True}
+            )
 
     def after_pixi_remove(self) -> None:
         compose = DockerComposeManager(self.structure.root)
         compose.remove_service(POSTGRES_DOCKER_SERVICE, POSTGRES_VOLUMES)
         compose.remove_service(PGADMIN_DOCKER_SERVICE, PGADMIN_VOLUMES)
+        if compose.service_exists(PGBOUNCER_DOCKER_SERVICE["name"]):
+            compose.remove_service(PGBOUNCER_DOCKER_SERVICE, [])
+        self._remove_pgbouncer()
         self._wipe_dev_data()
 
+    def _remove_pgbouncer(self) -> None:
+        service = PgBouncerService(self.structure.root)
+        if not service.enabled:
+            return
+        try:
+            service.down()
+        except OSError:
+            pass
+        shutil.rmtree(service.service_dir, ignore_errors=True)
+        PixiOps(self.structure.root, self.verbose).remove_packages(
+            [PGBOUNCER_PIXI_PACKAGE]
+        )
+        ProjectTracking(self.structure.root).remove_dev_config(service.name)
+
     def _wipe_dev_data(self) -> None:
         service = PostgresService(self.structure.root)
         try:
@@ -5,14 +5,16 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Self
 
+import typer
 import yaml
 from dotenv import dotenv_values
 
-from ..settings.source import setup_readline
+from ..settings.source import ResolutionContext, setup_readline
 from ..utils.console import prompts
 from ..utils.console.print import print_console
 from ..utils.project.setting_collector import CollectedSettings, SettingCollector
 from ..utils.project.project_structure import ProjectStructure
+from ..utils.services.pgbouncer import PGBOUNCER_IMAGE, pool_sizes
 
 from ._base import BaseDeployPlugin, DeployParam
 
@@ -128,29 +130,56 @@ class DockerComposePlugin(BaseDeployPlugin):
             prompt="CF_DNS_API_TOKEN (optional, press Enter to skip)",
             hide_input=True,
         ),
+        DeployParam(
+            name="replicas",
+            type_=int,
+            help="Web replicas; sizes the PgBouncer pool (kept in app/.env)",
+            default=0,
+        ),
+        DeployParam(
+            name="pgbouncer",
+            type_=bool,
+            help="Add a PgBouncer sidecar in front of the database (kept in app/.env)",
+            default=None,
+        ),
     ]
 
+    # Settings sources of the current generate / verify run, each read once.
+    _context: ResolutionContext
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
     def generate(self, output_dir: Path, **kwargs: Any) -> None:
         settings = self._collect_settings()
+        self._context = ResolutionContext(ProjectStructure().root)
 
         traefik_email = kwargs.get("traefik_email")
         cloudflare_token = kwargs.get("cloudflare_token")
         domain = kwargs.get("domain")
+        replicas = kwargs.get("replicas") or 0
+        pgbouncer = kwargs.get("pgbouncer")
+        if replicas < 0:
+            print_console.fail(f"--replicas must be a positive integer, got {replicas}")
+            raise typer.Exit(code=1)
 
         inputs = self._resolve_deploy_config(
             output_dir, traefik_email, cloudflare_token
         )
         self._write_env_traefik(output_dir, inputs)
-        self._copy_app_env(output_dir, domain=domain)
+        self._copy_app_env(
+            output_dir, domain=domain, replicas=replicas, pgbouncer=pgbouncer
+        )
         self._write_secret_files(output_dir, settings)
         self._warn_missing_configs(settings)
         self._write(
             output_dir / "app" / "docker-compose.base.yml",
-            self._build_base_compose(settings),
+            self._build_base_compose(
+                settings,
+                replicas=self._web_replicas(output_dir),
+                pgbouncer=self._pgbouncer_sidecar(output_dir),
+            ),
         )
         self._write(
             output_dir / "traefik" / "docker-compose.yml",
@@ -160,6 +189,7 @@ class DockerComposePlugin(BaseDeployPlugin):
 
     def verify(self, output_dir: Path) -> bool:
         settings = self._collect_settings()
+        self._context = ResolutionContext(ProjectStructure().root)
 
         print_console.step(f"Verifying {self.name} deployment in {output_dir} \u2026")
 
@@ -274,7 +304,11 @@ class DockerComposePlugin(BaseDeployPlugin):
         # -- drift: docker-compose.base.yml
         base_yml = output_dir / "app" / "docker-compose.base.yml"
         if traefik_env_ok and inputs is not None and base_yml.exists():
-            expected_yml = self._build_base_compose(settings)
+            expected_yml = self._build_base_compose(
+                settings,
+                replicas=self._web_replicas(output_dir),
+                pgbouncer=self._pgbouncer_sidecar(output_dir),
+            )
             current_yml = base_yml.read_text()
             if current_yml != expected_yml:
                 print_console.diff(
@@ -312,18 +346,17 @@ class DockerComposePlugin(BaseDeployPlugin):
         return collector.collect()
 
     def _resolve_secret_value(self, secret: Any) -> str | None:
-        backend_root = ProjectStructure().root
-        prod_file = backend_root / ".secrets.prod" / secret.name
-        if prod_file.exists():
-            return prod_file.read_text().strip()
-        return None
+        if secret.name not in self._context.prod_secrets:
+            return None
+        prod_file = self._context.backend_root / ".secrets.prod" / secret.name
+        return prod_file.read_text().strip()
 
     @staticmethod
     def _hint_secrets_command() -> str:
         return "ddx settings secrets init prod"
 
     def _resolve_config_value(self, config_var: Any) -> str | None:
-        env_prod = self._read_env_prod()
+        env_prod = self._context.env_prod
         key = config_var.name.upper()
         if key in env_prod:
             val = env_prod[key]
@@ -338,12 +371,27 @@ class DockerComposePlugin(BaseDeployPlugin):
         return "ddx settings configs init prod"
 
     @staticmethod
-    def _read_env_prod() -> dict[str, str | None]:
-        backend_root = ProjectStructure().root
-        env_path = backend_root / ".env.prod"
-        if not env_path.exists():
-            return {}
-        return dotenv_values(env_path)
+    def _pgbouncer_sidecar(output_dir: Path) -> bool:
+        """True if app/.env enables the PgBouncer sidecar (``--pgbouncer``)."""
+        app_env = output_dir / "app" / ".env"
+        values = dotenv_values(app_env) if app_env.exists() else {}
+        return values.get("PGBOUNCER_SIDECAR") == "true"
+
+    @staticmethod
+    def _web_replicas(output_dir: Path) -> int:
+        """The web replica count recorded in app/.env (default 1)."""
+        app_env = output_dir / "app" / ".env"
+        values = dotenv_values(app_env) if app_env.exists() else {}
+        value = values.get("WEB_REPLICAS") or "1"
+        if not value.isdigit() or int(value) < 1:
+            print_console.fail(
+                f"  app/.env  (WEB_REPLICAS must be a positive integer, got {value!r})"
+            )
+            print_console.info(
+                "     Fix it, or run: ddx deployment docker-compose generate --replicas N"
+            )
+            raise typer.Exit(code=1)
+        return int(value)
 
     # ------------------------------------------------------------------
     # Deploy config resolution
@@ -375,8 +423,15 @@ class DockerComposePlugin(BaseDeployPlugin):
         print_console.info(f"  wrote  {env_path}")
 
     @staticmethod
-    def _copy_app_env(output_dir: Path, domain: str | None = None) -> None:
-        content = DockerComposePlugin._build_app_env(output_dir, domain=domain)
+    def _copy_app_env(
+        output_dir: Path,
+        domain: str | None = None,
+        replicas: int = 0,
+        pgbouncer: bool | None = None,
+    ) -> None:
+        content = DockerComposePlugin._build_app_env(
+            output_dir, domain=domain, replicas=replicas, pgbouncer=pgbouncer
+        )
         if content is None:
             return
         app_env = output_dir / "app" / ".env"
@@ -442,7 +497,12 @@ class DockerComposePlugin(BaseDeployPlugin):
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _build_app_env(output_dir: Path, domain: str | None = None) -> str | None:
+    def _build_app_env(
+        output_dir: Path,
+        domain: str | None = None,
+        replicas: int = 0,
+        pgbouncer: bool | None = None,
+    ) -> str | None:
         backend_root = ProjectStructure().root
         env_prod = backend_root / ".env.prod"
         if not env_prod.exists():
@@ -465,7 +525,15 @@ class DockerComposePlugin(BaseDeployPlugin):
                     )
                     domain = None
 
+        web_replicas = replicas or existing_vars.get("WEB_REPLICAS")
+        if pgbouncer is None:
+            pgbouncer = existing_vars.get("PGBOUNCER_SIDECAR") == "true"
+
         content = env_prod.read_text()
+        if pgbouncer:
+            content = f"PGBOUNCER_SIDECAR=true\n{content}"
+        if web_replicas:
+            content = f"WEB_REPLICAS={web_replicas}\n{content}"
         if domain:
             content = f"DOMAIN={domain}\n{content}"
         return content
@@ -534,7 +602,9 @@ class DockerComposePlugin(BaseDeployPlugin):
         return "\n".join(lines) + "\n"
 
     @staticmethod
-    def _build_base_compose(settings: CollectedSettings) -> str:
+    def _build_base_compose(
+        settings: CollectedSettings, replicas: int = 1, pgbouncer: bool = False
+    ) -> str:
         secrets_block: dict = {}
         for secret in settings.secrets:
             secrets_block[secret.name] = {"file": str(Path(".secrets") / secret.name)}
@@ -546,16 +616,64 @@ class DockerComposePlugin(BaseDeployPlugin):
             "traefik.docker.network=traefik-public",
         ]
 
+        # One-shot release step (the image entrypoint's `release` command runs
+        # the migrations); web starts only after it has succeeded, so replicas
+        # never migrate on start.
+        release: dict = {
+            "image": "${IMAGE:-your-app:latest}",
+            "command": ["release"],
+            "restart": "no",
+            "networks": ["traefik-public"],
+        }
         service: dict = {
             "image": "${IMAGE:-your-app:latest}",
             "restart": "unless-stopped",
+            "depends_on": {"release": {"condition": "service_completed_successfully"}},
             "labels": labels,
             "networks": ["traefik-public"],
         }
+        if replicas > 1:
+            service["deploy"] = {"replicas": replicas}
         if secrets_block:
+            release["secrets"] = list(secrets_block.keys())
             service["secrets"] = list(secrets_block.keys())
 
-        compose: dict = {"services": {"web": service}}
+        services: dict = {"release": release}
+        if pgbouncer:
+            # Transaction-pooling sidecar sized for the web replicas; web talks
+            # to it, the release step still migrates against the database.
+            sizes = pool_sizes(replicas)
+            services["pgbouncer"] = {
+                "image": PGBOUNCER_IMAGE,
+                "restart": "unless-stopped",
+                "entrypoint": [
+                    "/bin/sh",
+                    "-c",
+                    'DB_PASSWORD="$$(cat /run/secrets/postgres_password)" '
+                    "exec /entrypoint.sh /usr/bin/pgbouncer /etc/pgbouncer/pgbouncer.ini",
+                ],
+                "environment": {
+                    "DB_HOST": "${POSTGRES_SERVER}",
+                    "DB_PORT": "${POSTGRES_PORT:-5432}",
+                    "DB_USER": "${POSTGRES_USER}",
+                    "LISTEN_PORT": "5432",
+                    "AUTH_TYPE": "scram-sha-256",
+                    "POOL_MODE": "transaction",
+                    "MAX_CLIENT_CONN": str(sizes["max_client_conn"]),
+                    "DEFAULT_POOL_SIZE": str(sizes["default_pool_size"]),
+                },
+                "secrets": ["postgres_password"],
+                "networks": ["traefik-public"],
+            }
+            service["environment"] = {
+                "POSTGRES_SERVER": "pgbouncer",
+                "POSTGRES_PORT": "5432",
+                "POSTGRES_CONNECTION": "pgbouncer",
+            }
+            service["depends_on"]["pgbouncer"] = {"condition": "service_started"}
+        services["web"] = service
+
+        compose: dict = {"services": services}
         if secrets_block:
             compose["secrets"] = secrets_block
         compose["networks"] = {"traefik-public": {"external": True}}
@@ -583,6 +701,8 @@ include:
   - docker-compose.base.yml
 
 services:
+  release:
+    image: your-registry/your-app:latest
   web:
     image: your-registry/your-app:latest
     # ports:
@@ -590,9 +710,10 @@ services:
     # volumes:
     #   - ./staticfiles:/app/staticfiles
     # deploy:
-    #   replicas: 2
+    #   replicas: 2       # or --replicas, which also sizes the PgBouncer pool
     #   resources:
     #     limits:
+    #       cpus: "2"       # the server derives its worker count from these
     #       memory: 512M
 """
 
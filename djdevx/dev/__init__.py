@@ -7,11 +7,13 @@ Postgres/Redis run natively via pixi conda packages; data lives under
 import typer
 
 from .cache import app as cache_app
+from .daemon import app as daemon_app
 from .database import app as database_app
 from .down import down as _down
 from .runserver import runserver as _runserver
 from .start import start as _start
 from .status import status as _status
+from .test import test as _test
 from .up import up as _up
 
 app = typer.Typer(no_args_is_help=True)
@@ -31,5 +33,12 @@ app.command(
 app.command(name="up")(_up)
 app.command(name="down")(_down)
 app.command(name="status")(_status)
+app.command(
+    name="test",
+    context_settings={"ignore_unknown_options": True, "allow_extra_args": True},
+)(_test)
 app.add_typer(database_app, name="database", help="Manage the local dev database")
 app.add_typer(cache_app, name="cache", help="Manage the local dev cache")
+app.add_typer(
+    daemon_app, name="daemon", help="Supervise the dev services in the background"
+)
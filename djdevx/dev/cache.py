@@ -6,7 +6,7 @@ from typing import Optional
 import typer
 
 from ..utils.console.print import print_console
-from ..utils.services import BaseDevService, resolve_cache_dev_service
+from ..utils.services import BaseDevService, DaemonClient, resolve_cache_dev_service
 
 app = typer.Typer(no_args_is_help=True)
 
@@ -40,7 +40,10 @@ def reset() -> None:
 def purge() -> None:
     """Stop the service and delete its data under .pixi/devdata/."""
     service = _get_service()
-    if service.is_up():
+    client = DaemonClient.connect()
+    if client is not None:
+        client.call("down", services=[service.name])  # also ends supervision
+    elif service.is_up():
         service.down()
     shutil.rmtree(service.data_dir, ignore_errors=True)
     print_console.ok(f"{service.display_name} data purged")
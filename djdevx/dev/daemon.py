@@ -0,0 +1,177 @@
+"""ddx dev daemon — optional supervisor that owns the local dev services."""
+
+import subprocess
+import sys
+import time
+from typing import Annotated
+
+import typer
+
+from ..utils.console.print import GREEN_CHECK_MARK, RED_CROSS_MARK, print_console
+from ..utils.project.project_structure import ProjectStructure
+from ..utils.services import (
+    DaemonClient,
+    DaemonError,
+    Supervisor,
+    resolve_dev_services,
+)
+from ..utils.services.base import LOG_TAIL_LINES, _tail
+from ..utils.services.daemon_client import (
+    CONNECT_TIMEOUT,
+    daemon_supported,
+    socket_path,
+)
+
+app = typer.Typer(no_args_is_help=True)
+
+DAEMON_LOG = "daemon.log"
+START_TIMEOUT = 10.0
+START_POLL_INTERVAL = 0.05
+
+
+def _require_support() -> None:
+    if not daemon_supported():
+        print_console.fail("The dev daemon needs Unix domain sockets.")
+        raise typer.Exit(code=1)
+
+
+def _spawn(structure: ProjectStructure, verbose: bool) -> subprocess.Popen:
+    """Re-run this command with ``--foreground`` in a detached session."""
+    log = structure.dev_data_dir / DAEMON_LOG
+    log.parent.mkdir(parents=True, exist_ok=True)
+    args = [sys.executable, "-m", "djdevx", "dev", "daemon", "start", "--foreground"]
+    if verbose:
+        args.append("--verbose")
+    with log.open("ab") as fh:
+        return subprocess.Popen(
+            args,
+            cwd=structure.root,
+            stdin=subprocess.DEVNULL,
+            stdout=fh,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+
+
+def _wait_for_daemon(
+    structure: ProjectStructure, process: subprocess.Popen
+) -> DaemonClient:
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline and process.poll() is None:
+        client = DaemonClient.connect(structure.root)
+        if client is not None:
+            return client
+        time.sleep(START_POLL_INTERVAL)
+    log = structure.dev_data_dir / DAEMON_LOG
+    print_console.fail(f"The dev daemon did not start. Last lines of {log}:")
+    for line in _tail(log):
+        print_console.info(line)
+    raise typer.Exit(code=1)
+
+
+@app.command()
+def start(
+    foreground: Annotated[
+        bool,
+        typer.Option("--foreground", help="Run in this terminal instead of detaching"),
+    ] = False,
+    verbose: Annotated[
+        bool,
+        typer.Option("--verbose", "-v", help="Show full pixi output"),
+    ] = False,
+) -> None:
+    """Start the dev daemon, which brings up and supervises the dev services."""
+    _require_support()
+    client = DaemonClient.connect()
+    if client is not None:
+        pid = client.call("ping", timeout=CONNECT_TIMEOUT)["pid"]
+        print_console.info(f"Dev daemon is already running (pid {pid})")
+        return
+
+    structure = ProjectStructure()
+    if foreground:
+        supervisor = Supervisor(
+            resolve_dev_services(verbose=verbose), socket_path(structure)
+        )
+        try:
+            supervisor.serve()
+        except DaemonError as e:
+            print_console.fail(str(e))
+            raise typer.Exit(code=1)
+        except KeyboardInterrupt:
+            pass
+        return
+
+    print_console.step("Starting the dev daemon...")
+    client = _wait_for_daemon(structure, _spawn(structure, verbose))
+    services = client.call("up")
+    for service in services:
+        print_console.step_done(
+            f"{service['display_name']} is up on port {service['port']}"
+        )
+    print_console.ok(f"Dev daemon started, supervising {len(services)} service(s)")
+
+
+@app.command()
+def stop() -> None:
+    """Stop the dev daemon; the dev services keep running."""
+    client = DaemonClient.connect()
+    if client is None:
+        print_console.info("No dev daemon running.")
+        return
+    pid = client.call("shutdown", timeout=CONNECT_TIMEOUT)["pid"]
+    print_console.ok(f"Dev daemon stopped (pid {pid})")
+
+
+def _client() -> DaemonClient:
+    client = DaemonClient.connect()
+    if client is None:
+        print_console.warning(
+            "No dev daemon running. Start one with `ddx dev daemon start`."
+        )
+        raise typer.Exit(code=1)
+    return client
+
+
+@app.command()
+def status() -> None:
+    """Show the dev daemon and the services it supervises."""
+    state = _client().call("status", timeout=CONNECT_TIMEOUT * 5)
+    print_console.info(f"Dev daemon {state['version']} running (pid {state['pid']})")
+    with print_console.table(
+        "Supervised services",
+        [
+            ("Status", {"width": 8, "justify": "center", "no_wrap": True}),
+            ("Service", {"style": "bold", "min_width": 12, "no_wrap": True}),
+            ("Port", {"justify": "right", "no_wrap": True}),
+            ("Supervised", {"justify": "center", "no_wrap": True}),
+            ("Restarts", {"justify": "right", "no_wrap": True}),
+        ],
+    ) as tbl:
+        for service in state["services"]:
+            tbl.add_row(
+                GREEN_CHECK_MARK if service["up"] else RED_CROSS_MARK,
+                service["display_name"],
+                str(service["port"]),
+                "yes" if service["supervised"] else "no",
+                str(service["restarts"]),
+            )
+
+
+@app.command()
+def logs(
+    follow: Annotated[
+        bool,
+        typer.Option("--follow", "-f", help="Keep streaming new log lines"),
+    ] = False,
+    lines: Annotated[
+        int,
+        typer.Option("--lines", "-n", help="Lines to show from each log first"),
+    ] = LOG_TAIL_LINES,
+) -> None:
+    """Show the aggregated dev service logs."""
+    try:
+        for entry in _client().stream("logs", follow=follow, lines=lines):
+            typer.echo(f"{entry['service']:<8} | {entry['line']}")
+    except KeyboardInterrupt:
+        pass
@@ -1,14 +1,21 @@
 """ddx dev database — manage the local pixi-native dev database."""
 
 import shutil
-from typing import Optional
+from typing import Annotated, Optional
 
 import typer
 
 from ..utils.console.print import print_console
 from ..utils.django.manage_commands import ManageCommands
+from ..utils.django.migration_state import MigrationState
 from ..utils.project.pixi_runner import PixiRunner
-from ..utils.services import BaseDevService, resolve_database_dev_service
+from ..utils.services import (
+    BaseDevService,
+    DaemonClient,
+    PostgresService,
+    resolve_database_dev_service,
+)
+from ..utils.services.postgres import DEFAULT_SNAPSHOT
 
 app = typer.Typer(no_args_is_help=True)
 
@@ -29,31 +36,83 @@ def init() -> None:
     service = _get_service()
     if not service.is_up():
         service.up()
-    service._set_port_env()
+    service.export_connection_env()
     runner = PixiRunner()
     commands = ManageCommands(runner)
     print_console.step("Checking for pending migrations...")
     if commands.migrations_pending():
         print_console.step_done("Migrations pending, applying...")
-        commands.run("migrate")
+        commands.migrate()
         print_console.ok("Migrations applied")
     else:
         print_console.step_done("No pending migrations")
     print_console.ok(f"{service.display_name} is ready")
 
 
+def _get_snapshot_service() -> PostgresService:
+    """Return the running dev database, if it supports snapshots."""
+    service = _get_service()
+    if not isinstance(service, PostgresService):
+        print_console.warning(f"{service.display_name} does not support snapshots.")
+        raise typer.Exit(code=1)
+    service.up()
+    return service
+
+
+SnapshotName = Annotated[str, typer.Argument(help="Snapshot name")]
+
+
 @app.command()
 def reset() -> None:
-    """Flush all data, keeping the service running."""
+    """Restore the default snapshot if one exists, else flush all data.
+
+    Starts the service if it is stopped; it keeps running afterwards.
+    """
     service = _get_service()
+    service.up()
+    service.export_connection_env()
     service.reset()
+    MigrationState().clear()
+
+
+@app.command()
+def snapshot(name: SnapshotName = DEFAULT_SNAPSHOT) -> None:
+    """Save the dev database as a template snapshot (replaces one of the same name)."""
+    _get_snapshot_service().snapshot(name)
+
+
+@app.command()
+def restore(name: SnapshotName = DEFAULT_SNAPSHOT) -> None:
+    """Replace the dev database with a copy of a snapshot."""
+    _get_snapshot_service().restore(name)
+    MigrationState().clear()
+
+
+@app.command()
+def snapshots() -> None:
+    """List the saved snapshots."""
+    names = _get_snapshot_service().snapshots()
+    if names:
+        print_console.list(names)
+    else:
+        print_console.info("No snapshots. Save one with `ddx dev database snapshot`.")
+
+
+@app.command(name="drop-snapshot")
+def drop_snapshot(name: SnapshotName) -> None:
+    """Delete a snapshot."""
+    _get_snapshot_service().drop_snapshot(name)
 
 
 @app.command()
 def purge() -> None:
     """Stop the service and delete its data under .pixi/devdata/."""
     service = _get_service()
-    if service.is_up():
+    client = DaemonClient.connect()
+    if client is not None:
+        client.call("down", services=[service.name])  # also ends supervision
+    elif service.is_up():
         service.down()
     shutil.rmtree(service.data_dir, ignore_errors=True)
+    MigrationState().clear()
     print_console.ok(f"{service.display_name} data purged")
@@ -1,16 +1,26 @@
 """ddx dev down — stop installed database/cache services."""
 
 from ..utils.console.print import print_console
-from ..utils.services import resolve_dev_services
+from ..utils.services import DaemonClient, resolve_dev_services
 
 
 def down() -> None:
-    """Stop installed database/cache services."""
-    services = resolve_dev_services()
-    if not services:
+    """Stop installed database/cache services.
+
+    When the dev daemon is running, it stops them and ends their supervision.
+    """
+    client = DaemonClient.connect()
+    if client is not None:
+        stopped = {s["display_name"]: s["stopped"] for s in client.call("down")}
+    else:
+        stopped = {}
+        for service in resolve_dev_services():
+            stopped[service.display_name] = service.is_up()
+            if stopped[service.display_name]:
+                service.down()
+    if not stopped:
         print_console.info("No database or cache installed.")
         return
-    for service in services:
-        if service.is_up():
-            service.down()
-            print_console.ok(f"{service.display_name} stopped")
+    for display_name, was_stopped in stopped.items():
+        if was_stopped:
+            print_console.ok(f"{display_name} stopped")
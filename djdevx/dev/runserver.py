@@ -31,7 +31,7 @@ def runserver(ctx: typer.Context) -> None:
     if services:
         print_console.step("Setting service port environment variables...")
         for service in services:
-            service._set_port_env()
+            service.export_connection_env()
 
     runner = PixiRunner()
     runner.run_interactive(*server_command(runner), *ctx.args)
@@ -1,5 +1,8 @@
 """ddx dev start — bring up everything then run the dev server."""
 
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Annotated
 
 import typer
@@ -7,7 +10,15 @@ import typer
 from ..utils.console.print import print_console
 from ..utils.django.manage_commands import ManageCommands
 from ..utils.project.pixi_runner import PixiRunner
-from ..utils.services import resolve_cache_dev_service, resolve_database_dev_service
+from ..utils.services import (
+    DaemonClient,
+    PgBouncerService,
+    ServiceScheduler,
+    resolve_cache_dev_service,
+    resolve_database_dev_service,
+    resolve_pgbouncer_dev_service,
+)
+from ..utils.services.resolver import DATABASE_DEV_SERVICES
 from .runserver import server_command
 from ..settings.source import DEV
 
@@ -21,6 +32,99 @@ def _init_settings() -> None:
     secrets_init(DEV)
 
 
+@contextmanager
+def _direct_database_env(
+    database_env: dict[str, str], pooler_env: dict[str, str]
+) -> Iterator[None]:
+    """Point the block at the database itself rather than PgBouncer.
+
+    Migrations take locks and may use server-side cursors, which transaction
+    pooling does not support, so they always connect directly.
+    """
+    keys = set(database_env) | set(pooler_env)
+    saved = {key: os.environ.get(key) for key in keys}
+    for key in pooler_env:
+        os.environ.pop(key, None)
+    os.environ.update(database_env)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _migrate(
+    commands: ManageCommands,
+    skip_migrate: bool,
+    database_env: dict[str, str],
+    pooler_env: dict[str, str],
+) -> None:
+    if skip_migrate:
+        print_console.step_done("Migration check skipped")
+        return
+    with _direct_database_env(database_env, pooler_env):
+        print_console.step("Checking for pending migrations...")
+        if commands.migrations_pending():
+            print_console.step_done("Migrations pending, applying...")
+            commands.migrate()
+            print_console.ok("Migrations applied")
+        else:
+            print_console.step_done("No pending migrations")
+
+
+def _start_with_daemon(
+    client: DaemonClient, commands: ManageCommands, skip_migrate: bool
+) -> None:
+    """Have the dev daemon bring the services up and export their connection env."""
+    print_console.step("Starting dev services through the dev daemon...")
+    envs: dict[str, dict[str, str]] = {}
+    for service in client.call("up"):
+        envs[service["name"]] = service["env"]
+        os.environ.update(service["env"])
+        print_console.step_done(
+            f"{service['display_name']} is up on port {service['port']}"
+        )
+    database_env = next(
+        (env for name, env in envs.items() if name in DATABASE_DEV_SERVICES), {}
+    )
+    _migrate(commands, skip_migrate, database_env, envs.get(PgBouncerService.name, {}))
+
+
+def _start_services(
+    commands: ManageCommands, skip_migrate: bool, verbose: bool
+) -> None:
+    """Start the services directly; migrations wait only on the database."""
+    db_service = resolve_database_dev_service(verbose=verbose)
+    if db_service is not None:
+        print_console.step_done(f"Found database: {db_service.display_name}")
+    else:
+        print_console.step_done("No database configured")
+
+    cache_service = resolve_cache_dev_service(verbose=verbose)
+    if cache_service is not None:
+        print_console.step_done(f"Found cache: {cache_service.display_name}")
+    else:
+        print_console.step_done("No cache configured")
+
+    pooler = resolve_pgbouncer_dev_service(verbose=verbose)
+    if pooler is not None:
+        print_console.step_done(f"Found connection pooler: {pooler.display_name}")
+
+    # Services start concurrently; only migrations wait, and only on the database.
+    # PgBouncer comes last, so its env is exported after the database's.
+    services = [s for s in (db_service, cache_service, pooler) if s is not None]
+    with ServiceScheduler(services) as scheduler:
+        database_env: dict[str, str] = {}
+        if db_service is not None:
+            scheduler.wait(db_service)
+            database_env = db_service.connection_env()
+        pooler_env = pooler.connection_env() if pooler is not None else {}
+        _migrate(commands, skip_migrate, database_env, pooler_env)
+
+
 def start(
     ctx: typer.Context,
     skip_settings: Annotated[
@@ -50,34 +154,11 @@ def start(
     else:
         print_console.step_done("Settings init skipped")
 
-    db_service = resolve_database_dev_service(verbose=verbose)
-    if db_service is not None:
-        print_console.step_done(f"Found database: {db_service.display_name}")
-        if not db_service.is_up():
-            db_service.up()
-        db_service._set_port_env()
-    else:
-        print_console.step_done("No database configured")
-
-    if not skip_migrate:
-        print_console.step("Checking for pending migrations...")
-        if commands.migrations_pending():
-            print_console.step_done("Migrations pending, applying...")
-            commands.run("migrate")
-            print_console.ok("Migrations applied")
-        else:
-            print_console.step_done("No pending migrations")
+    client = DaemonClient.connect()
+    if client is not None:
+        _start_with_daemon(client, commands, skip_migrate)
     else:
-        print_console.step_done("Migration check skipped")
-
-    cache_service = resolve_cache_dev_service(verbose=verbose)
-    if cache_service is not None:
-        print_console.step_done(f"Found cache: {cache_service.display_name}")
-        if not cache_service.is_up():
-            cache_service.up()
-        cache_service._set_port_env()
-    else:
-        print_console.step_done("No cache configured")
+        _start_services(commands, skip_migrate, verbose)
 
     print_console.ok("Starting the dev server ...")
     runner.run_interactive(*server_command(runner), *ctx.args)
@@ -5,13 +5,22 @@ from ..settings.secrets import list_secrets
 from ..utils.console.print import GREEN_CHECK_MARK, RED_CROSS_MARK, print_console
 from ..utils.django.manage_commands import ManageCommands
 from ..utils.project.pixi_runner import PixiRunner
-from ..utils.services import resolve_dev_services
+from ..utils.services import DaemonClient, resolve_dev_services
+from ..utils.services.resolver import DATABASE_DEV_SERVICES
 from ..settings.source import DEV
 
 
 def status() -> None:
     """Show service up/down, migrate state, and settings state."""
-    services = resolve_dev_services()
+    client = DaemonClient.connect()
+    if client is not None:
+        state = client.call("status")
+        print_console.info(
+            f"Services supervised by the dev daemon (pid {state['pid']})"
+        )
+        rows = [(s["up"], s["display_name"], s["name"]) for s in state["services"]]
+    else:
+        rows = [(s.is_up(), s.display_name, s.name) for s in resolve_dev_services()]
     runner = PixiRunner()
     commands = ManageCommands(runner)
 
@@ -23,12 +32,15 @@ def status() -> None:
             ("Type", {"style": "dim", "min_width": 10, "no_wrap": True}),
         ],
     ) as tbl:
-        for service in services:
-            status_mark = GREEN_CHECK_MARK if service.is_up() else RED_CROSS_MARK
-            tbl.add_row(status_mark, service.display_name, service.name)
+        for up, display_name, name in rows:
+            tbl.add_row(GREEN_CHECK_MARK if up else RED_CROSS_MARK, display_name, name)
 
-    migrate_ok = not commands.migrations_pending()
-    print_console.info(f"Migrations: {'up to date' if migrate_ok else 'pending'}")
+    db_rows = [up for up, _, name in rows if name in DATABASE_DEV_SERVICES]
+    if db_rows and not all(db_rows):
+        print_console.info("Migrations: unknown (database is not running)")
+    else:
+        migrate_ok = not commands.migrations_pending()
+        print_console.info(f"Migrations: {'up to date' if migrate_ok else 'pending'}")
 
     list_secrets(DEV)
     list_configs(DEV)
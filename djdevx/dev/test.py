@@ -0,0 +1,89 @@
+"""ddx dev test — run the tests in parallel on per-worker test databases."""
+
+import os
+from typing import Annotated
+
+import typer
+
+from ..utils.console.print import print_console
+from ..utils.django.test_databases import (
+    PYTEST_PLUGINS,
+    TEST_RUNNERS,
+    WorkerDatabases,
+)
+from ..utils.project.pixi_runner import PixiRunner
+from ..utils.services import PostgresService, resolve_database_dev_service
+
+
+def _test_command(test_runner: str, workers: int) -> list[str]:
+    if test_runner == "pytest":
+        return ["run", "pytest", "-n", str(workers), "--reuse-db"]
+    return [
+        "run",
+        "python",
+        "manage.py",
+        "test",
+        "--keepdb",
+        "--parallel",
+        str(workers),
+    ]
+
+
+def test(
+    ctx: typer.Context,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers", "-n", help="Parallel test workers (default: CPU count)"
+        ),
+    ] = 0,
+    test_runner: Annotated[
+        str,
+        typer.Option("--runner", help="Test runner: django or pytest"),
+    ] = "django",
+    rebuild: Annotated[
+        bool,
+        typer.Option("--rebuild", help="Re-migrate and re-clone the test databases"),
+    ] = False,
+    verbose: Annotated[
+        bool,
+        typer.Option("--verbose", "-v", help="Show full pixi output"),
+    ] = False,
+) -> None:
+    """Run the tests in parallel, one cloned test database per worker.
+
+    Any additional arguments are forwarded to the test runner.
+    """
+    if test_runner not in TEST_RUNNERS:
+        print_console.fail(
+            f"Unknown test runner {test_runner!r}; use {' or '.join(TEST_RUNNERS)}."
+        )
+        raise typer.Exit(code=1)
+    service = resolve_database_dev_service(verbose=verbose)
+    if not isinstance(service, PostgresService):
+        print_console.warning("Parallel test databases need the postgres database.")
+        raise typer.Exit(code=1)
+    workers = workers or os.cpu_count() or 1
+
+    runner = PixiRunner(verbose=verbose)
+    if test_runner == "pytest":
+        missing = [p for p in PYTEST_PLUGINS if not runner.has_dependency(p)]
+        if missing:
+            print_console.fail(
+                f"--runner pytest needs {' and '.join(missing)}; "
+                f"add {'them' if len(missing) > 1 else 'it'} with pixi first."
+            )
+            raise typer.Exit(code=1)
+
+    service.up()
+    service.export_connection_env()
+
+    databases = WorkerDatabases(service, runner, workers, test_runner)
+    print_console.step(f"Preparing {workers} test database(s)...")
+    if databases.provision(rebuild):
+        print_console.step_done(f"Cloned {databases.template} for {workers} worker(s)")
+    else:
+        print_console.step_done("Migrations unchanged, reusing the test databases")
+
+    result = runner.run_interactive(*_test_command(test_runner, workers), *ctx.args)
+    raise typer.Exit(code=result.returncode)
@@ -1,18 +1,25 @@
 """ddx dev up — start installed database/cache services."""
 
 from ..utils.console.print import print_console
-from ..utils.services import resolve_dev_services
+from ..utils.services import DaemonClient, ServiceScheduler, resolve_dev_services
 
 
 def up() -> None:
-    """Start installed database/cache services (pixi-native, idempotent)."""
-    services = resolve_dev_services()
-    if not services:
+    """Start installed database/cache services (pixi-native, idempotent).
+
+    When the dev daemon is running, it starts the services and supervises them.
+    """
+    client = DaemonClient.connect()
+    if client is not None:
+        started = {s["display_name"]: s["started"] for s in client.call("up")}
+    else:
+        with ServiceScheduler(resolve_dev_services()) as scheduler:
+            started = {s.display_name: v for s, v in scheduler.wait_all().items()}
+    if not started:
         print_console.info("No database or cache installed.")
         return
-    for service in services:
-        if service.is_up():
-            print_console.info(f"{service.display_name} is already running")
+    for display_name, was_started in started.items():
+        if was_started:
+            print_console.ok(f"{display_name} started")
         else:
-            service.up()
-            print_console.ok(f"{service.display_name} started")
+            print_console.info(f"{display_name} is already running")
@@ -9,7 +9,9 @@ from ._registry import get_feature
 from .list import list_features_table
 from ..utils.console.print import print_console
 from ..utils.installable.orchestrator import remove_installable, select_installed
+from ..utils.installable.pixi_ops import pixi_batch
 from ..utils.installable.tracking import autocomplete_installed
+from ..utils.tracking import tracking_session
 
 
 def _autocomplete_installed_feature(incomplete: str) -> list[str]:
@@ -41,21 +43,24 @@ def remove(
     is_multi = len(names) > 1
     failed = False
 
-    for feature_name in names:
-        try:
-            cls = get_feature(feature_name)
-        except KeyError:
-            if is_multi:
-                print_console.warning(f"Unknown feature '{feature_name}'. Skipping.")
-                failed = True
-                continue
-            print_console.fail(f"Unknown feature '{feature_name}'.")
-            list_features_table()
-            raise typer.Exit(code=1)
-
-        result = remove_installable(cls, feature_name, provider, verbose, is_multi)
-        if not result and not is_multi:
-            raise typer.Exit()
+    with tracking_session(), pixi_batch():
+        for feature_name in names:
+            try:
+                cls = get_feature(feature_name)
+            except KeyError:
+                if is_multi:
+                    print_console.warning(
+                        f"Unknown feature '{feature_name}'. Skipping."
+                    )
+                    failed = True
+                    continue
+                print_console.fail(f"Unknown feature '{feature_name}'.")
+                list_features_table()
+                raise typer.Exit(code=1)
+
+            result = remove_installable(cls, feature_name, provider, verbose, is_multi)
+            if not result and not is_multi:
+                raise typer.Exit()
 
     if is_multi and failed:
         raise typer.Exit(code=1)
@@ -8,8 +8,15 @@ from ._base import BaseFramework
 from ._registry import get_framework
 from .list import list_frameworks_table
 from ..utils.console.print import print_console
-from ..utils.installable.orchestrator import add_installable, select_installable
+from ..utils.installable.orchestrator import (
+    add_installable,
+    run_plan,
+    select_installable,
+)
+from ..utils.installable.plan import InstallPlan
 from ..utils.installable.tracking import autocomplete_installable
+from ..utils.prek.prek import formatting_queue
+from ..utils.tracking import tracking_session
 
 
 def _autocomplete_framework(incomplete: str) -> list[str]:
@@ -28,12 +35,24 @@ def add(
         bool,
         typer.Option("--verbose", "-v", help="Show full pixi output"),
     ] = False,
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", help="Print the install plan without applying it"),
+    ] = False,
+    ruff_only: Annotated[
+        bool,
+        typer.Option(
+            "--ruff-only",
+            help="Format generated Python files with ruff only instead of all prek hooks",
+        ),
+    ] = False,
 ) -> None:
     """Add a CSS/JS framework."""
     names = select_installable(BaseFramework, "framework") if name is None else [name]
     if not names:
         raise typer.Exit()
 
+    plan = InstallPlan(verbose=verbose)
     for fw_name in names:
         try:
             cls = get_framework(fw_name)
@@ -42,4 +61,7 @@ def add(
             list_frameworks_table()
             raise typer.Exit(code=1)
 
-        add_installable(cls, fw_name, verbose=verbose)
+        add_installable(cls, fw_name, verbose=verbose, plan=plan)
+
+    with tracking_session(), formatting_queue(ruff_only=ruff_only):
+        run_plan(plan, dry_run=dry_run)
@@ -9,7 +9,9 @@ from ._registry import get_framework
 from .list import list_frameworks_table
 from ..utils.console.print import print_console
 from ..utils.installable.orchestrator import remove_installable, select_installed
+from ..utils.installable.pixi_ops import pixi_batch
 from ..utils.installable.tracking import autocomplete_installed
+from ..utils.tracking import tracking_session
 
 
 def _autocomplete_installed_framework(incomplete: str) -> list[str]:
@@ -34,12 +36,13 @@ def remove(
     if not names:
         raise typer.Exit()
 
-    for fw_name in names:
-        try:
-            cls = get_framework(fw_name)
-        except KeyError:
-            print_console.fail(f"Unknown framework '{fw_name}'.")
-            list_frameworks_table()
-            raise typer.Exit(code=1)
+    with tracking_session(), pixi_batch():
+        for fw_name in names:
+            try:
+                cls = get_framework(fw_name)
+            except KeyError:
+                print_console.fail(f"Unknown framework '{fw_name}'.")
+                list_frameworks_table()
+                raise typer.Exit(code=1)
 
-        remove_installable(cls, fw_name, verbose=verbose)
+            remove_installable(cls, fw_name, verbose=verbose)
@@ -18,6 +18,14 @@ app = typer.Typer()
 
 DJANGO_VERSION = "6.0"
 
+# Production ASGI servers (docker/serve.py) and the packages each one needs
+# on top of uvicorn.
+SERVER_PACKAGES: dict[str, list[str]] = {
+    "uvicorn": [],
+    "gunicorn": ["gunicorn", "uvicorn-worker"],
+    "granian": ["granian"],
+}
+
 
 @app.callback(invoke_without_command=True)
 def new(
@@ -48,6 +56,12 @@ def new(
             prompt="Please enter the minimum python version for the project",
         ),
     ] = "3.14",
+    server: Annotated[
+        str,
+        typer.Option(
+            help="Production ASGI server: uvicorn, gunicorn (UvicornWorker) or granian"
+        ),
+    ] = "uvicorn",
     git_init: Annotated[
         bool,
         typer.Option(
@@ -60,6 +74,11 @@ def new(
     ] = False,
 ):
     """Create a new Django project."""
+    if server not in SERVER_PACKAGES:
+        print_console.fail(
+            f"Unknown server {server!r}; use one of {', '.join(SERVER_PACKAGES)}."
+        )
+        raise typer.Exit(code=1)
     requirement_check()
 
     print_console.step("Initializing the project ...")
@@ -73,6 +92,7 @@ def new(
         "project_description": project_description,
         "python_version": python_version,
         "django_version": DJANGO_VERSION,
+        "server": server,
     }
 
     template_manager = TemplateManager()
@@ -83,7 +103,7 @@ def new(
     secret_manager = SecretManager(dest_dir)
     secret_manager.write_secret("secret_key", generate_random_password(length=64))
 
-    install_dependencies(dest_dir)
+    install_dependencies(dest_dir, server)
 
     if git_init and not _is_git_repository(dest_dir):
         print_console.step("Initializing the git repository ...")
@@ -95,7 +115,7 @@ def new(
     print_console.step_done("Project is initialized successfully.")
 
 
-def install_dependencies(project_root: Path):
+def install_dependencies(project_root: Path, server: str = "uvicorn"):
     """Install Python dependencies in the specified directory."""
     pixi = PixiRunner(project_root=project_root)
 
@@ -107,6 +127,7 @@ def install_dependencies(project_root: Path):
         "uvicorn",
         "pydantic-settings",
         "email-validator",
+        *SERVER_PACKAGES[server],
     ]
     print_console.step("Installing dependencies ...")
     for pkg in dependencies:
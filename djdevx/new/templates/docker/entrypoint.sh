@@ -1,6 +1,11 @@
 #!/bin/bash
 set -euo pipefail
 
-python manage.py showmigrations | grep '\[ \]' && python manage.py migrate
+# `release` is the one-shot release step: run it once per deployment (see the
+# `release` service of the docker-compose deployment), not in every replica.
+if [[ "${1:-}" == "release" ]]; then
+    exec python manage.py migrate --noinput
+fi
 
-python -m uvicorn applications.asgi:application --host 0.0.0.0 --port 8000 --reload
+# Serve with the [server] profile of djdevx.toml (see serve.py).
+exec python serve.py
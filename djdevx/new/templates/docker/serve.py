@@ -0,0 +1,142 @@
+"""
+Production ASGI server launcher (run by docker/entrypoint.sh).
+
+The server profile comes from the [server] table of djdevx.toml:
+
+    [server]
+    profile = "gunicorn"      # "uvicorn", "gunicorn" (UvicornWorker) or "granian"
+    workers = 4               # default: derived from the CPU and memory limits
+    worker_memory_mb = 256    # memory budget per worker for the derived count
+
+SERVER_PROFILE and WEB_CONCURRENCY in the environment override the file.
+Without an explicit worker count, the launcher starts one worker per CPU the
+container may use (its cgroup CPU quota), capped so that every worker gets
+worker_memory_mb of the cgroup memory limit.
+
+The server replaces this process (exec), so it runs as PID 1 and receives
+the container's stop signal directly.
+"""
+
+import math
+import os
+import sys
+import tomllib
+from pathlib import Path
+
+APP = "applications.asgi:application"
+CONFIG_FILE = Path("djdevx.toml")  # relative to the working directory (/app)
+PROFILES = ("uvicorn", "gunicorn", "granian")
+DEFAULT_PROFILE = "uvicorn"
+DEFAULT_WORKER_MEMORY_MB = 256
+UNLIMITED = 1 << 60  # cgroup v1 reports "no limit" as a huge number
+
+
+def read_config() -> dict:
+    if not CONFIG_FILE.exists():
+        return {}
+    with CONFIG_FILE.open("rb") as fh:
+        return tomllib.load(fh).get("server", {})
+
+
+def _read(path: str) -> str | None:
+    try:
+        return Path(path).read_text().strip()
+    except OSError:
+        return None
+
+
+def cpu_limit() -> int:
+    """CPUs this container may use: the cgroup quota, else the CPU affinity."""
+    cpus = getattr(os, "process_cpu_count", os.cpu_count)() or 1
+    quota = period = None
+    cpu_max = _read("/sys/fs/cgroup/cpu.max")  # cgroup v2: "<quota> <period>"
+    if cpu_max:
+        limit, _, interval = cpu_max.partition(" ")
+        if limit != "max":
+            quota, period = int(limit), int(interval)
+    else:  # cgroup v1
+        limit = _read("/sys/fs/cgroup/cpu/cpu.cfs_quota_us")
+        interval = _read("/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+        if limit and interval and int(limit) > 0:
+            quota, period = int(limit), int(interval)
+    if quota and period:
+        cpus = min(cpus, max(1, math.ceil(quota / period)))
+    return cpus
+
+
+def memory_limit() -> int | None:
+    """The cgroup memory limit in bytes, or None if unlimited."""
+    for path in (
+        "/sys/fs/cgroup/memory.max",
+        "/sys/fs/cgroup/memory/memory.limit_in_bytes",
+    ):
+        value = _read(path)
+        if value and value != "max" and int(value) < UNLIMITED:
+            return int(value)
+    return None
+
+
+def worker_count(config: dict) -> int:
+    explicit = os.environ.get("WEB_CONCURRENCY") or config.get("workers")
+    if explicit:
+        return max(1, int(explicit))
+    workers = cpu_limit()
+    memory = memory_limit()
+    if memory is not None:
+        per_worker = int(config.get("worker_memory_mb", DEFAULT_WORKER_MEMORY_MB))
+        workers = min(workers, memory // (per_worker * 1024 * 1024))
+    return max(1, workers)
+
+
+def server_command(profile: str, workers: int, host: str, port: int) -> list[str]:
+    if profile == "gunicorn":
+        return [
+            "gunicorn",
+            APP,
+            "--worker-class",
+            "uvicorn_worker.UvicornWorker",
+            "--workers",
+            str(workers),
+            "--bind",
+            f"{host}:{port}",
+        ]
+    if profile == "granian":
+        return [
+            "granian",
+            "--interface",
+            "asgi",
+            "--host",
+            host,
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            APP,
+        ]
+    return [
+        "uvicorn",
+        APP,
+        "--host",
+        host,
+        "--port",
+        str(port),
+        "--workers",
+        str(workers),
+        "--proxy-headers",
+    ]
+
+
+def main() -> None:
+    config = read_config()
+    profile = os.environ.get("SERVER_PROFILE") or config.get("profile", DEFAULT_PROFILE)
+    if profile not in PROFILES:
+        sys.exit(f"Unknown server profile {profile!r}; use one of {PROFILES}")
+    host = config.get("host", "0.0.0.0")
+    port = int(config.get("port", 8000))
+    command = server_command(profile, worker_count(config), host, port)
+    print(f"Starting {' '.join(command)}", flush=True)
+    os.execvp(command[0], command)
+
+
+if __name__ == "__main__":
+    main()
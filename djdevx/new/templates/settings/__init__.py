@@ -1,32 +1,11 @@
 from pathlib import Path
 
+from .utils.bundle import exec_settings
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 SETTINGS_DIR = BASE_DIR / "settings"
 
-DJANGO_SETTINGS_DIR = SETTINGS_DIR / "django"
-PACKAGES_SETTINGS_DIR = SETTINGS_DIR / "packages"
-APPS_SETTINGS_DIR = SETTINGS_DIR / "apps"
-
-setting_files = []
-
-setting_files += [
-    str(f)
-    for f in sorted(Path(DJANGO_SETTINGS_DIR).rglob("*.py"))
-    if f.name != "__init__.py"
-]
-setting_files += [
-    str(f)
-    for f in sorted(Path(PACKAGES_SETTINGS_DIR).rglob("*.py"))
-    if f.name != "__init__.py"
-]
-setting_files += [
-    str(f)
-    for f in sorted(Path(APPS_SETTINGS_DIR).rglob("*.py"))
-    if f.name != "__init__.py"
-]
-
-
-for setting_file in setting_files:
-    with open(setting_file) as f:
-        code = compile(f.read(), setting_file, "exec")
-        exec(code)
+# Runs every file in settings/django, settings/packages and settings/apps, in
+# that order, from the compiled bundle in settings/__pycache__ when it is
+# current (see settings/utils/bundle.py).
+exec_settings(globals())
@@ -1,18 +1,23 @@
 import os
+from functools import cache
 from pathlib import Path
 from typing import Any
 
+from dotenv import dotenv_values
+from pydantic.fields import FieldInfo
 from pydantic_core import PydanticUndefined
 from pydantic_settings import (
     BaseSettings,
     InitSettingsSource,
     PydanticBaseSettingsSource,
-    SecretsSettingsSource,
     SettingsConfigDict,
 )
 
 _BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
+# Loaded in order; later files win (backend/.env overrides the Swarm/K8s config).
+_ENV_FILES = (Path("/run/configs/app-config"), _BASE_DIR / ".env")
+
 
 def _detect_is_dev() -> bool:
     """
@@ -35,6 +40,58 @@ def _detect_is_dev() -> bool:
 IS_DEV: bool = _detect_is_dev()
 
 
+@cache
+def _read_env_files() -> dict[str, str]:
+    """Every env file, merged and read once per process (keys lowercased)."""
+    values: dict[str, str] = {}
+    for env_file in _ENV_FILES:
+        if env_file.is_file():
+            for key, value in dotenv_values(env_file, encoding="utf-8").items():
+                if value is not None:
+                    values[key.lower()] = value
+    return values
+
+
+@cache
+def _read_secrets_dir(secrets_dir: Path) -> dict[str, str]:
+    """Every secret file in *secrets_dir*, read once per process (keys lowercased)."""
+    try:
+        paths = [path for path in secrets_dir.iterdir() if path.is_file()]
+    except OSError:
+        return {}
+    return {path.name.lower(): path.read_text().strip() for path in paths}
+
+
+class _SharedSource(PydanticBaseSettingsSource):
+    """
+    Serve fields from a case-insensitive mapping read once per process.
+
+    Each AppBaseSettings subclass would otherwise re-read the env files and
+    secret directories when it is instantiated; every settings module shares
+    one copy instead. Complex values (lists, dicts) are JSON-decoded the same
+    way pydantic's own env and secrets sources do.
+    """
+
+    def __init__(self, settings_cls: type[BaseSettings], values: dict[str, str]):
+        super().__init__(settings_cls)
+        self.values = values
+
+    def get_field_value(
+        self, field: FieldInfo, field_name: str
+    ) -> tuple[Any, str, bool]:
+        return self.values.get(field_name.lower()), field_name, False
+
+    def __call__(self) -> dict[str, Any]:
+        data: dict[str, Any] = {}
+        for field_name, field in self.settings_cls.model_fields.items():
+            value, key, is_complex = self.get_field_value(field, field_name)
+            if value is not None:
+                data[key] = self.prepare_field_value(
+                    field_name, field, value, is_complex
+                )
+        return data
+
+
 class _EnvDefaultsSource(InitSettingsSource):
     """
     Lowest-priority settings source.
@@ -86,11 +143,9 @@ class AppBaseSettings(BaseSettings):
     """
 
     model_config = SettingsConfigDict(
-        # Multi-file dotenv: /run/configs/app-config is loaded first (lower priority),
-        # backend/.env is loaded second and takes priority (personal/CI override).
-        # Missing files are silently skipped by pydantic-settings.
-        env_file=(Path("/run/configs/app-config"), _BASE_DIR / ".env"),
-        env_file_encoding="utf-8",
+        # The env files (/run/configs/app-config, then backend/.env) and the
+        # secret directories are read once per process by _read_env_files()
+        # and _read_secrets_dir(), not by pydantic-settings per subclass.
         case_sensitive=False,
         # Each subclass reads only its own declared fields.  Unrecognised
         # variables from any source are silently skipped so all modules can
@@ -146,7 +201,8 @@ class AppBaseSettings(BaseSettings):
     ) -> tuple[PydanticBaseSettingsSource, ...]:
         sources: list[PydanticBaseSettingsSource] = [
             env_settings,  # os.environ
-            dotenv_settings,  # /run/configs/app-config, then backend/.env
+            # /run/configs/app-config, then backend/.env
+            _SharedSource(settings_cls, _read_env_files()),
         ]
 
         # Secrets dirs are added conditionally to avoid warnings about
@@ -154,14 +210,12 @@ class AppBaseSettings(BaseSettings):
         # over local secrets (backend/.secrets/).
         prod_secrets = Path("/run/secrets")
         if prod_secrets.exists():
-            sources.append(
-                SecretsSettingsSource(settings_cls, secrets_dir=prod_secrets)
-            )
+            sources.append(_SharedSource(settings_cls, _read_secrets_dir(prod_secrets)))
 
         local_secrets = _BASE_DIR / ".secrets"
         if local_secrets.exists():
             sources.append(
-                SecretsSettingsSource(settings_cls, secrets_dir=local_secrets)
+                _SharedSource(settings_cls, _read_secrets_dir(local_secrets))
             )
 
         sources.append(_EnvDefaultsSource(settings_cls))
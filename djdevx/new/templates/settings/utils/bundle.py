@@ -0,0 +1,128 @@
+"""
+Compiled settings bundle.
+
+settings/__init__.py executes every .py file under django/, packages/ and
+apps/ (in that order, alphabetically within each). Instead of reading and
+compiling each file on every process start — every worker, every manage.py
+call — the compiled code objects are cached in one marshalled bundle:
+
+    settings/__pycache__/bundle.<cache tag>.bin
+
+The bundle is keyed by a hash of the files' paths and contents plus the
+bytecode magic number, so adding, removing or editing a settings file (or
+changing Python) rebuilds it on the next start. Like .pyc files, it is not
+written when PYTHONDONTWRITEBYTECODE is set; prebuild it for read-only
+images with:
+
+    python settings/utils/bundle.py          # write the bundle
+    python settings/utils/bundle.py --check  # exit 1 if it is missing or stale
+
+Run it as a script: importing it as settings.utils.bundle would load the
+settings first.
+"""
+
+import hashlib
+import importlib.util
+import marshal
+import os
+import sys
+from pathlib import Path
+from types import CodeType
+from typing import Any
+
+SETTINGS_DIR = Path(__file__).resolve().parent.parent
+SECTIONS = ("django", "packages", "apps")
+BUNDLE_FILE = (
+    SETTINGS_DIR / "__pycache__" / f"bundle.{sys.implementation.cache_tag}.bin"
+)
+_HEADER = len(importlib.util.MAGIC_NUMBER) + hashlib.sha256().digest_size
+
+
+def settings_files() -> list[Path]:
+    """Every settings file, in execution order."""
+    files: list[Path] = []
+    for section in SECTIONS:
+        files += [
+            f
+            for f in sorted((SETTINGS_DIR / section).rglob("*.py"))
+            if f.name != "__init__.py"
+        ]
+    return files
+
+
+def _read_sources(files: list[Path]) -> tuple[bytes, list[bytes]]:
+    """Return the bundle key for *files* and their sources."""
+    digest = hashlib.sha256()
+    sources = []
+    for path in files:
+        source = path.read_bytes()
+        name = str(path).encode()
+        digest.update(b"%d:%s%d:%s" % (len(name), name, len(source), source))
+        sources.append(source)
+    return digest.digest(), sources
+
+
+def _read_bundle(digest: bytes) -> list[CodeType] | None:
+    try:
+        data = BUNDLE_FILE.read_bytes()
+    except OSError:
+        return None
+    if data[:_HEADER] != importlib.util.MAGIC_NUMBER + digest:
+        return None
+    try:
+        return marshal.loads(data[_HEADER:])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+
+def _write_bundle(digest: bytes, codes: list[CodeType]) -> None:
+    BUNDLE_FILE.parent.mkdir(exist_ok=True)
+    tmp = BUNDLE_FILE.with_name(f"{BUNDLE_FILE.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(importlib.util.MAGIC_NUMBER + digest + marshal.dumps(codes))
+    os.replace(tmp, BUNDLE_FILE)
+
+
+def _compile(files: list[Path], sources: list[bytes]) -> list[CodeType]:
+    return [
+        compile(source, str(path), "exec", dont_inherit=True)
+        for path, source in zip(files, sources)
+    ]
+
+
+def load_codes() -> list[CodeType]:
+    """Return the compiled settings files, from the bundle when it is current."""
+    files = settings_files()
+    digest, sources = _read_sources(files)
+    codes = _read_bundle(digest)
+    if codes is None:
+        codes = _compile(files, sources)
+        if not sys.dont_write_bytecode:
+            try:
+                _write_bundle(digest, codes)
+            except OSError:
+                pass  # read-only tree: compile on every start
+    return codes
+
+
+def exec_settings(namespace: dict[str, Any]) -> None:
+    """Execute every settings file into *namespace* (the settings module)."""
+    for code in load_codes():
+        exec(code, namespace)
+
+
+def main(argv: list[str]) -> int:
+    files = settings_files()
+    digest, sources = _read_sources(files)
+    if "--check" in argv:
+        if _read_bundle(digest) is None:
+            print(f"{BUNDLE_FILE} is missing or stale")
+            return 1
+        print(f"{BUNDLE_FILE} is up to date")
+        return 0
+    _write_bundle(digest, _compile(files, sources))
+    print(f"Compiled {len(files)} settings files into {BUNDLE_FILE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
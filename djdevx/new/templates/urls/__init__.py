@@ -1,19 +1,13 @@
 import importlib
-from pathlib import Path
 
-URLS_DIR = Path(__file__).parent
-
-url_files = [str(f) for f in Path(URLS_DIR).rglob("*.py") if f.name != "__init__.py"]
+from .registry import URL_MODULES
 
 urlpatterns = []
 
-for file_path in url_files:
-    relative_path = Path(file_path).relative_to(URLS_DIR).with_suffix("")
-    module_name = f"urls.{'.'.join(relative_path.parts)}"
-
-    try:
-        module = importlib.import_module(module_name)
-        if hasattr(module, "urlpatterns"):
-            urlpatterns += module.urlpatterns
-    except Exception as e:
-        print(f"Error importing {module_name}: {e}")
+# urls/registry.py lists every URL module under urls/ in a fixed, sorted
+# order; djdevx regenerates it when it adds or removes one (`ddx urls sync`
+# after manual changes). An import error fails loudly instead of dropping
+# routes.
+for module_name in URL_MODULES:
+    module = importlib.import_module(module_name)
+    urlpatterns += getattr(module, "urlpatterns", [])
@@ -0,0 +1,6 @@
+"""Generated by djdevx — do not edit; run `ddx urls sync` after changing urls/."""
+
+URL_MODULES: list[str] = [
+    "urls.django.admin",
+    "urls.django.media",
+]
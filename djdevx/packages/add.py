@@ -8,8 +8,15 @@ from ._base import BasePackage
 from ._registry import get_package
 from .list import list_packages_table
 from ..utils.console.print import print_console
-from ..utils.installable.orchestrator import add_installable, select_installable
+from ..utils.installable.orchestrator import (
+    add_installable,
+    run_plan,
+    select_installable,
+)
+from ..utils.installable.plan import InstallPlan
 from ..utils.installable.tracking import autocomplete_installable
+from ..utils.prek.prek import formatting_queue
+from ..utils.tracking import tracking_session
 
 
 def _autocomplete_package(incomplete: str) -> list[str]:
@@ -31,6 +38,17 @@ def add(
         bool,
         typer.Option("--verbose", "-v", help="Show full pixi output"),
     ] = False,
+    dry_run: Annotated[
+        bool,
+        typer.Option("--dry-run", help="Print the install plan without applying it"),
+    ] = False,
+    ruff_only: Annotated[
+        bool,
+        typer.Option(
+            "--ruff-only",
+            help="Format generated Python files with ruff only instead of all prek hooks",
+        ),
+    ] = False,
 ) -> None:
     """Install a package."""
     names = (
@@ -43,6 +61,7 @@ def add(
 
     is_multi = len(names) > 1
     failed = False
+    plan = InstallPlan(verbose=verbose)
 
     for pkg_name in names:
         try:
@@ -57,9 +76,7 @@ def add(
             raise typer.Exit(code=1)
 
         try:
-            result = add_installable(cls, pkg_name, provider, verbose, is_multi)
-            if not result and not is_multi:
-                raise typer.Exit()
+            add_installable(cls, pkg_name, provider, verbose, is_multi, plan=plan)
         except Exception:
             if is_multi:
                 print_console.fail(f"Failed to install {pkg_name}. Skipping.")
@@ -67,5 +84,8 @@ def add(
             else:
                 raise
 
+    with tracking_session(), formatting_queue(ruff_only=ruff_only):
+        run_plan(plan, dry_run=dry_run)
+
     if is_multi and failed:
         raise typer.Exit(code=1)
@@ -11,6 +11,8 @@ class ChannelsSettings(AppBaseSettings):
     redis_port: int = 6379
     redis_db: int = 1
     redis_password: SecretStr
+    # Set by `ddx dev` when the dev Redis listens on a Unix socket.
+    redis_socket: str | None = None
 
     @classmethod
     def get_dev_defaults(cls) -> dict[str, Any]:
@@ -29,6 +31,11 @@ class ChannelsSettings(AppBaseSettings):
 
 _channels = ChannelsSettings()
 
+if _channels.redis_socket:
+    _address = f"unix://{_channels.redis_socket}"
+else:
+    _address = f"redis://{_channels.redis_host}:{_channels.redis_port}"
+
 INSTALLED_APPS.insert(0, "daphne")
 INSTALLED_APPS += [
     "channels",
@@ -41,10 +48,7 @@ CHANNEL_LAYERS = {
         "CONFIG": {
             "hosts": [
                 {
-                    "address": (
-                        _channels.redis_host,
-                        _channels.redis_port,
-                    ),
+                    "address": _address,
                     "username": "default",
                     "password": _channels.redis_password.get_secret_value(),
                     "db": _channels.redis_db,
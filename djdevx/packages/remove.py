@@ -9,7 +9,9 @@ from ._registry import get_package
 from .list import list_packages_table
 from ..utils.console.print import print_console
 from ..utils.installable.orchestrator import remove_installable, select_installed
+from ..utils.installable.pixi_ops import pixi_batch
 from ..utils.installable.tracking import autocomplete_installed
+from ..utils.tracking import tracking_session
 
 
 def _autocomplete_installed_package(incomplete: str) -> list[str]:
@@ -45,21 +47,22 @@ def remove(
     is_multi = len(names) > 1
     failed = False
 
-    for pkg_name in names:
-        try:
-            cls = get_package(pkg_name)
-        except KeyError:
-            if is_multi:
-                print_console.warning(f"Unknown package '{pkg_name}'. Skipping.")
-                failed = True
-                continue
-            print_console.fail(f"Unknown package '{pkg_name}'.")
-            list_packages_table()
-            raise typer.Exit(code=1)
+    with tracking_session(), pixi_batch():
+        for pkg_name in names:
+            try:
+                cls = get_package(pkg_name)
+            except KeyError:
+                if is_multi:
+                    print_console.warning(f"Unknown package '{pkg_name}'. Skipping.")
+                    failed = True
+                    continue
+                print_console.fail(f"Unknown package '{pkg_name}'.")
+                list_packages_table()
+                raise typer.Exit(code=1)
 
-        result = remove_installable(cls, pkg_name, provider, verbose, is_multi)
-        if not result and not is_multi:
-            raise typer.Exit()
+            result = remove_installable(cls, pkg_name, provider, verbose, is_multi)
+            if not result and not is_multi:
+                raise typer.Exit()
 
     if is_multi and failed:
         raise typer.Exit(code=1)
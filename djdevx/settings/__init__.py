@@ -4,10 +4,12 @@ ddx settings — manage project secrets and config variables.
 Sub-commands:
   secrets   Manage secret fields (SecretStr) for dev and prod.
   configs   Manage config vars (non-secret settings) for dev and prod.
+  bundle    Precompile the settings files into the cached settings bundle.
 """
 
 import typer
 
+from .bundle import bundle as _bundle
 from .secrets import app as secrets_app
 from .configs import app as configs_app
 
@@ -15,3 +17,4 @@ app = typer.Typer(no_args_is_help=True)
 
 app.add_typer(secrets_app, name="secrets", help="Manage project secrets")
 app.add_typer(configs_app, name="configs", help="Manage project config variables")
+app.command(name="bundle")(_bundle)
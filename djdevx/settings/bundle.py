@@ -0,0 +1,45 @@
+"""ddx settings bundle — precompile the project's settings into one bundle."""
+
+from typing import Annotated
+
+import typer
+
+from ..utils.console.print import print_console
+from ..utils.project.pixi_runner import PixiRunner
+from ..utils.project.project_structure import ProjectStructure
+
+BUNDLE_SCRIPT = "settings/utils/bundle.py"
+
+
+def bundle(
+    check: Annotated[
+        bool,
+        typer.Option("--check", help="Exit 1 if the bundle is missing or stale"),
+    ] = False,
+    verbose: Annotated[
+        bool,
+        typer.Option("--verbose", "-v", help="Show full pixi output"),
+    ] = False,
+) -> None:
+    """Compile the settings files into the cached settings bundle.
+
+    The bundle is rebuilt automatically when a settings file changes; build
+    it ahead of time for read-only images or to warm it in CI.
+    """
+    root = ProjectStructure().root
+    if not (root / BUNDLE_SCRIPT).exists():
+        print_console.fail(
+            f"{BUNDLE_SCRIPT} not found: this project's settings/__init__.py "
+            "does not load a compiled bundle."
+        )
+        raise typer.Exit(code=1)
+
+    args = ["run", "python", BUNDLE_SCRIPT] + (["--check"] if check else [])
+    result = PixiRunner(root, verbose).run_pixi_command(
+        *args, check=False, capture_output=True, text=True
+    )
+    output = (result.stdout or "").strip() or (result.stderr or "").strip()
+    if result.returncode != 0:
+        print_console.fail(output)
+        raise typer.Exit(code=1)
+    print_console.ok(output)
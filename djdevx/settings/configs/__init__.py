@@ -22,6 +22,7 @@ from ..source import (
     DEV,
     PROD,
     ConfigSource,
+    ResolutionContext,
     resolve_config_source_dev,
     resolve_config_source_prod,
     resolve_config_value_dev,
@@ -76,6 +77,7 @@ def list_configs(
         print_console.info("No config vars declared in this project.")
         return
 
+    ctx = ResolutionContext(project_root)
     cfg = _ENV_CONFIG_LIST[env]
     with print_console.table(
         f"Config vars ({env})",
@@ -97,20 +99,16 @@ def list_configs(
         show_lines=False,
     ) as tbl:
         for config_var in result.config_vars:
-            source = cfg["resolve_source"](config_var, project_root)
+            source = cfg["resolve_source"](config_var, ctx)
             if source == ConfigSource.CLASS_DEFAULT:
                 status = YELLOW_CHECKMARK
                 value_str = "(class default)"
             elif source != ConfigSource.MISSING:
                 status = GREEN_CHECK_MARK
-                value_str = _format_value(
-                    cfg["resolve_value"](config_var, project_root)
-                )
+                value_str = _format_value(cfg["resolve_value"](config_var, ctx))
             else:
                 status = RED_CROSS_MARK
-                value_str = _format_value(
-                    cfg["resolve_value"](config_var, project_root)
-                )
+                value_str = _format_value(cfg["resolve_value"](config_var, ctx))
             tbl.add_row(
                 status,
                 config_var.name,
@@ -267,13 +265,14 @@ def init(
     setup_readline()
     if env == PROD:
         resolve_source = resolve_config_source_prod
+        ctx = ResolutionContext(project_root)
         env_prod_path = project_root / ".env.prod"
         prompted = 0
         skipped = 0
 
         for config_var in result.config_vars:
             key = config_var.name.upper()
-            if resolve_source(config_var, project_root) != ConfigSource.MISSING:
+            if resolve_source(config_var, ctx) != ConfigSource.MISSING:
                 skipped += 1
                 continue
 
@@ -332,11 +331,12 @@ def verify(
     collector = SettingCollector(project_root)
     result = collector.collect()
 
+    ctx = ResolutionContext(project_root)
     cfg = _ENV_CONFIG_VERIFY[env]
     missing: list[str] = []
     optional: list[str] = []
     for config_var in result.config_vars:
-        source = cfg["resolve_source"](config_var, project_root)
+        source = cfg["resolve_source"](config_var, ctx)
         if source == ConfigSource.MISSING:
             missing.append(config_var.name)
         elif source == ConfigSource.CLASS_DEFAULT:
@@ -16,6 +16,7 @@ from ...utils.project.setting_collector import SettingCollector
 from ..source import (
     DEV,
     PROD,
+    ResolutionContext,
     SecretSource,
     resolve_secret_source_dev,
     resolve_secret_source_prod,
@@ -50,6 +51,7 @@ def list_secrets(
         print_console.info("No secrets declared in this project.")
         return
 
+    ctx = ResolutionContext(project_root)
     cfg = ENV_CONFIG_LIST[env]
     with print_console.table(
         f"Secrets ({env})",
@@ -61,7 +63,7 @@ def list_secrets(
         show_lines=False,
     ) as tbl:
         for secret in result.secrets:
-            source = cfg["resolve_source"](secret, project_root)
+            source = cfg["resolve_source"](secret, ctx)
             if source == SecretSource.CLASS_DEFAULT:
                 status = YELLOW_CHECKMARK
             elif source != SecretSource.MISSING:
@@ -100,13 +102,14 @@ def init(
 
 def _init_dev(result, project_root) -> None:
     secret_manager = SecretManager(project_root)
+    ctx = ResolutionContext(project_root)
     generated = 0
     prompted = 0
     skipped = 0
     dev_default_skipped = 0
 
     for secret in result.secrets:
-        source = resolve_secret_source_dev(secret, project_root)
+        source = resolve_secret_source_dev(secret, ctx)
         if source != SecretSource.MISSING and source != SecretSource.DEV_DEFAULT:
             skipped += 1
             continue
@@ -148,12 +151,13 @@ def _init_dev(result, project_root) -> None:
 
 def _init_prod(result, project_root) -> None:
     prod_manager = SecretManager(project_root, ".secrets.prod")
+    ctx = ResolutionContext(project_root)
     generated = 0
     prompted = 0
     skipped = 0
 
     for secret in result.secrets:
-        if resolve_secret_source_prod(secret, project_root) != SecretSource.MISSING:
+        if resolve_secret_source_prod(secret, ctx) != SecretSource.MISSING:
             skipped += 1
             continue
 
@@ -217,11 +221,12 @@ def verify(
     collector = SettingCollector(project_root)
     result = collector.collect()
 
+    ctx = ResolutionContext(project_root)
     cfg = ENV_CONFIG_VERIFY[env]
     missing: list[str] = []
     optional: list[str] = []
     for secret in result.secrets:
-        source = cfg["resolve_source"](secret, project_root)
+        source = cfg["resolve_source"](secret, ctx)
         if source == SecretSource.MISSING:
             missing.append(secret.name)
         elif source == SecretSource.CLASS_DEFAULT:
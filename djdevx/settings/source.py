@@ -1,17 +1,20 @@
 """
 Shared source-resolution logic for configs and secrets.
+
+Resolvers take a ``ResolutionContext`` that reads every source (env files,
+``/run/configs/app-config``, secret directories, ``os.environ``) at most once,
+so resolving N settings costs one pass over each source instead of N.
 """
 
 import atexit
 import os
 import readline
 from enum import StrEnum
+from functools import cached_property
 from pathlib import Path
 
 from dotenv import dotenv_values
 
-from ..utils.project.secret_manager import SecretManager
-
 DEV = "dev"
 PROD = "prod"
 
@@ -47,12 +50,64 @@ def read_env_prod(project_path: Path) -> dict[str, str | None]:
     return read_env_file(project_path / ".env.prod")
 
 
-def resolve_config_source_dev(config_var, backend_root: Path) -> str:
+def _list_dir(path: Path) -> frozenset[str]:
+    try:
+        return frozenset(entry.name for entry in path.iterdir())
+    except OSError:
+        return frozenset()
+
+
+class ResolutionContext:
+    """The sources one command resolves settings from, each loaded on first use.
+
+    Create one per command and pass it to every resolver. Values are read
+    once and then served from memory, so changes made to the sources while
+    the context is alive are not seen — create a new context after writing.
+    """
+
+    RUN_SECRETS = Path("/run/secrets")
+
+    def __init__(self, backend_root: Path) -> None:
+        self.backend_root = backend_root
+
+    @cached_property
+    def environ(self) -> dict[str, str]:
+        return dict(os.environ)
+
+    @cached_property
+    def dot_env(self) -> dict[str, str | None]:
+        return read_dot_env(self.backend_root)
+
+    @cached_property
+    def env_prod(self) -> dict[str, str | None]:
+        return read_env_prod(self.backend_root)
+
+    @cached_property
+    def run_configs(self) -> dict[str, str | None]:
+        config_file = Path(ConfigSource.RUN_CONFIGS)
+        return read_env_file(config_file) if config_file.exists() else {}
+
+    @cached_property
+    def dev_secrets(self) -> frozenset[str]:
+        """Names of the files in ``.secrets/``."""
+        return _list_dir(self.backend_root / ".secrets")
+
+    @cached_property
+    def prod_secrets(self) -> frozenset[str]:
+        """Names of the files in ``.secrets.prod/``."""
+        return _list_dir(self.backend_root / ".secrets.prod")
+
+    @cached_property
+    def run_secrets(self) -> frozenset[str]:
+        """Names of the files in ``/run/secrets/``."""
+        return _list_dir(self.RUN_SECRETS)
+
+
+def resolve_config_source_dev(config_var, ctx: ResolutionContext) -> str:
     key = config_var.name.upper()
-    if key in os.environ:
+    if key in ctx.environ:
         return ConfigSource.OS_ENVIRON
-    dot_env = read_dot_env(backend_root)
-    if key in dot_env:
+    if key in ctx.dot_env:
         return ConfigSource.DOT_ENV
     if config_var.dev_default is not None:
         return ConfigSource.DEV_DEFAULT
@@ -61,17 +116,13 @@ def resolve_config_source_dev(config_var, backend_root: Path) -> str:
     return ConfigSource.MISSING
 
 
-def resolve_config_source_prod(config_var, backend_root: Path) -> str:
+def resolve_config_source_prod(config_var, ctx: ResolutionContext) -> str:
     key = config_var.name.upper()
-    if key in os.environ:
+    if key in ctx.environ:
         return ConfigSource.OS_ENVIRON
-    config_file = Path(ConfigSource.RUN_CONFIGS)
-    if config_file.exists():
-        config_vars = read_env_file(config_file)
-        if key in config_vars:
-            return ConfigSource.RUN_CONFIGS
-    env_prod = read_env_prod(backend_root)
-    if key in env_prod:
+    if key in ctx.run_configs:
+        return ConfigSource.RUN_CONFIGS
+    if key in ctx.env_prod:
         return ConfigSource.ENV_PROD
     if config_var.prod_default is not None:
         return ConfigSource.PROD_DEFAULT
@@ -80,38 +131,30 @@ def resolve_config_source_prod(config_var, backend_root: Path) -> str:
     return ConfigSource.MISSING
 
 
-def resolve_config_value_dev(config_var, backend_root: Path):
+def resolve_config_value_dev(config_var, ctx: ResolutionContext):
     key = config_var.name.upper()
-    if key in os.environ:
-        return os.environ[key]
-    dot_env = read_dot_env(backend_root)
-    if key in dot_env:
-        return dot_env[key]
+    if key in ctx.environ:
+        return ctx.environ[key]
+    if key in ctx.dot_env:
+        return ctx.dot_env[key]
     return config_var.dev_default
 
 
-def resolve_config_value_prod(config_var, backend_root: Path):
+def resolve_config_value_prod(config_var, ctx: ResolutionContext):
     key = config_var.name.upper()
-    if key in os.environ:
-        return os.environ[key]
-    config_file = Path(ConfigSource.RUN_CONFIGS)
-    if config_file.exists():
-        config_vars = read_env_file(config_file)
-        if key in config_vars:
-            return config_vars[key]
-    env_prod = read_env_prod(backend_root)
-    if key in env_prod:
-        return env_prod[key]
+    if key in ctx.environ:
+        return ctx.environ[key]
+    if key in ctx.run_configs:
+        return ctx.run_configs[key]
+    if key in ctx.env_prod:
+        return ctx.env_prod[key]
     return config_var.prod_default
 
 
-def resolve_secret_source_dev(secret, backend_root: Path) -> str:
-    dev_manager = SecretManager(backend_root)
-    run_dir = Path("/run/secrets")
-
-    if dev_manager.has_secret(secret.name):
+def resolve_secret_source_dev(secret, ctx: ResolutionContext) -> str:
+    if secret.name in ctx.dev_secrets:
         return f".secrets/{secret.name}"
-    if (run_dir / secret.name).exists():
+    if secret.name in ctx.run_secrets:
         return f"/run/secrets/{secret.name}"
     if secret.has_dev_default:
         return SecretSource.DEV_DEFAULT
@@ -120,13 +163,10 @@ def resolve_secret_source_dev(secret, backend_root: Path) -> str:
     return SecretSource.MISSING
 
 
-def resolve_secret_source_prod(secret, backend_root: Path) -> str:
-    prod_manager = SecretManager(backend_root, ".secrets.prod")
-    run_dir = Path("/run/secrets")
-
-    if (run_dir / secret.name).exists():
+def resolve_secret_source_prod(secret, ctx: ResolutionContext) -> str:
+    if secret.name in ctx.run_secrets:
         return f"/run/secrets/{secret.name}"
-    if prod_manager.has_secret(secret.name):
+    if secret.name in ctx.prod_secrets:
         return f".secrets.prod/{secret.name}"
     if secret.prod_default is not None:
         return SecretSource.PROD_DEFAULT
@@ -0,0 +1,37 @@
+"""URLs CLI — maintain the generated URL registry (``urls/registry.py``)."""
+
+from typing import Annotated
+
+import typer
+
+from ..utils.console.print import print_console
+from ..utils.project.project_structure import ProjectStructure
+from ..utils.project.url_registry import (
+    is_url_registry_current,
+    sync_url_registry,
+)
+
+app = typer.Typer(no_args_is_help=True)
+
+
+@app.command("sync")
+def sync(
+    check: Annotated[
+        bool,
+        typer.Option("--check", help="Exit 1 if the registry is stale; write nothing"),
+    ] = False,
+) -> None:
+    """Regenerate urls/registry.py from the URL modules under urls/."""
+    structure = ProjectStructure()
+    if check:
+        if not is_url_registry_current(structure):
+            print_console.fail(
+                "urls/registry.py is out of date; run `ddx urls sync` and commit it."
+            )
+            raise typer.Exit(code=1)
+        print_console.ok("urls/registry.py is up to date")
+        return
+    if sync_url_registry(structure, create=True):
+        print_console.ok("Updated urls/registry.py")
+    else:
+        print_console.step_done("urls/registry.py is already up to date")
@@ -0,0 +1,5 @@
+"""CLI plumbing shared by the ddx command tree."""
+
+from .lazy_group import LazySubcommand, lazy_group
+
+__all__ = ["LazySubcommand", "lazy_group"]
@@ -0,0 +1,88 @@
+"""Lazy Typer group — import a sub-app only when its command is invoked."""
+
+import importlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, NamedTuple
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+from typer.main import get_group_from_info
+from typer.models import TyperInfo
+
+
+class LazySubcommand(NamedTuple):
+    """A sub-app referenced by ``"package.module:attribute"`` plus its help text."""
+
+    import_path: str
+    help: str
+
+
+class LazyTyperGroup(TyperGroup):
+    """TyperGroup whose sub-apps are imported on first use.
+
+    Until a sub-app is loaded it is represented by a stub command carrying only
+    its name and help text, which is all ``--help`` and shell completion need.
+    Any other ``get_command`` caller (command resolution, ``typer ... utils
+    docs``) gets the real group, imported on demand.
+    """
+
+    lazy_subcommands: dict[str, LazySubcommand] = {}
+
+    def __init__(self, **attrs: Any) -> None:
+        super().__init__(**attrs)
+        self._pending: dict[str, LazySubcommand] = {}
+        self._summaries_only = False
+        for name, sub in self.lazy_subcommands.items():
+            if name not in self.commands:
+                self.commands[name] = TyperCommand(
+                    name=name, help=sub.help, short_help=sub.help
+                )
+                self._pending[name] = sub
+
+    @contextmanager
+    def _summaries(self) -> Iterator[None]:
+        """Serve stubs from ``get_command`` while listing sub-commands."""
+        previous, self._summaries_only = self._summaries_only, True
+        try:
+            yield
+        finally:
+            self._summaries_only = previous
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self._pending and not self._summaries_only:
+            return self.load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_help(self, ctx, formatter) -> None:
+        with self._summaries():
+            super().format_help(ctx, formatter)
+
+    def shell_complete(self, ctx, incomplete):
+        with self._summaries():
+            return super().shell_complete(ctx, incomplete)
+
+    def load(self, name: str):
+        """Import the sub-app *name* and replace its stub with the real command."""
+        sub = self._pending.pop(name, None)
+        if sub is None:
+            return self.commands[name]
+        module_name, _, attribute = sub.import_path.partition(":")
+        sub_app: typer.Typer = getattr(
+            importlib.import_module(module_name), attribute or "app"
+        )
+        command = get_group_from_info(
+            TyperInfo(sub_app, name=name, help=sub.help),
+            pretty_exceptions_short=sub_app.pretty_exceptions_short,
+            rich_markup_mode=self.rich_markup_mode,
+            suggest_commands=self.suggest_commands,
+        )
+        self.commands[name] = command
+        return command
+
+
+def lazy_group(subcommands: dict[str, LazySubcommand]) -> type[LazyTyperGroup]:
+    """Return a ``LazyTyperGroup`` class for ``typer.Typer(cls=...)``."""
+    return type(
+        "LazyTyperGroup", (LazyTyperGroup,), {"lazy_subcommands": dict(subcommands)}
+    )
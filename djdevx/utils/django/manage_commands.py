@@ -1,8 +1,10 @@
 """Helpers for running Django ``manage.py`` commands on a PixiRunner."""
 
 import subprocess
+from functools import cached_property
 
 from ..project.pixi_runner import PixiRunner
+from .migration_state import MigrationState
 
 
 class ManageCommands:
@@ -11,6 +13,11 @@ class ManageCommands:
     def __init__(self, runner: PixiRunner | None = None) -> None:
         self._runner = runner or PixiRunner()
 
+    @cached_property
+    def migration_state(self) -> MigrationState:
+        """Recorded migration fingerprint of the runner's project."""
+        return MigrationState(self._runner.project_root)
+
     def run(
         self, command: str, *args: str, check: bool = True
     ) -> subprocess.CompletedProcess:
@@ -18,6 +25,22 @@ class ManageCommands:
         return self._runner.run_manage_command(command, *args, check=check)
 
     def migrations_pending(self) -> bool:
-        """Return True if ``manage.py migrate --check`` reports unapplied migrations."""
+        """Return True if ``manage.py migrate --check`` reports unapplied migrations.
+
+        Skips the check (and the Django boot) while the recorded migration
+        fingerprint is current; a clean check records it.
+        """
+        state = self.migration_state
+        if state.is_current():
+            return False
         result = self.run("migrate", "--check", check=False)
-        return result.returncode != 0
+        pending = result.returncode != 0
+        if not pending:
+            state.record()
+        return pending
+
+    def migrate(self) -> subprocess.CompletedProcess:
+        """Apply migrations and record the fingerprint they were applied for."""
+        result = self.run("migrate")
+        self.migration_state.record()
+        return result
@@ -0,0 +1,107 @@
+"""MigrationState — skip ``migrate --check`` when nothing migration-relevant changed.
+
+``manage.py migrate --check`` boots Django, which costs seconds. After a clean
+check or a successful ``migrate`` the state file records a fingerprint of
+everything that can introduce new migrations:
+
+* every ``migrations/*.py`` file in the project (path, size, mtime),
+* the settings tree, which assembles ``INSTALLED_APPS``,
+* ``pixi.lock`` (third-party apps and their migrations),
+* ``.env`` and the exported connection env (which database the project
+  points at, e.g. ``POSTGRES_PORT`` or ``REDIS_SOCKET``).
+
+While the fingerprint matches, migrations are known to be applied. Changes
+made behind djdevx's back (``migrate app zero`` by hand, a restored database
+dump) are not detected; ``ddx dev database purge`` clears the state.
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Optional
+
+from ..project.project_structure import ProjectStructure
+
+STATE_FORMAT = 2
+
+# Exported by the dev services (``connection_env()``); they pick the server.
+CONNECTION_ENV_KEYS = (
+    "POSTGRES_SERVER",
+    "POSTGRES_PORT",
+    "POSTGRES_DB",
+    "REDIS_PORT",
+    "REDIS_SOCKET",
+)
+
+_SKIP_DIRS = {"node_modules", "__pycache__"}
+
+
+def _migration_files(root: Path) -> Iterator[Path]:
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(
+            d for d in dirnames if not d.startswith(".") and d not in _SKIP_DIRS
+        )
+        if os.path.basename(dirpath) == "migrations":
+            for filename in sorted(filenames):
+                if filename.endswith(".py"):
+                    yield Path(dirpath) / filename
+
+
+class MigrationState:
+    """Fingerprint of the project's migration inputs, stored in ``.pixi/devdata``."""
+
+    def __init__(
+        self,
+        project_root: Optional[Path] = None,
+        state_file: str = "migration-state.json",
+    ) -> None:
+        self.structure = ProjectStructure(project_root)
+        self.state_file = state_file
+
+    @property
+    def path(self) -> Path:
+        return self.structure.dev_data_dir / self.state_file
+
+    def _inputs(self) -> Iterator[Path]:
+        root = self.structure.root
+        yield root / "pixi.lock"
+        yield root / ".env"
+        yield from sorted(self.structure.settings_dir.rglob("*.py"))
+        yield from _migration_files(root)
+
+    def fingerprint(self) -> str:
+        """Hash the connection env and the path, size and mtime of every input."""
+        root = self.structure.root
+        digest = hashlib.sha1(str(STATE_FORMAT).encode())
+        for key in CONNECTION_ENV_KEYS:
+            digest.update(f"{key}={os.environ.get(key, '')};".encode())
+        for path in self._inputs():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            rel = path.relative_to(root).as_posix()
+            digest.update(f"{rel}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+        return digest.hexdigest()
+
+    def is_current(self) -> bool:
+        """True if migrations were applied and no input changed since."""
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return False
+        return isinstance(data, dict) and data.get("fingerprint") == self.fingerprint()
+
+    def record(self) -> None:
+        """Remember that migrations are applied for the current inputs."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps({"fingerprint": self.fingerprint()}))
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Forget the recorded state, forcing the next check to run."""
+        self.path.unlink(missing_ok=True)
@@ -0,0 +1,89 @@
+"""WorkerDatabases — per-worker test databases cloned from one migrated template.
+
+Parallel test runs give every worker its own database. Instead of letting
+each worker create and migrate one, ``ddx dev test`` migrates a single
+template (``test_<database>``, the name Django's test runner uses) and clones
+it once per worker under the name the test runner expects:
+
+* ``django`` — ``manage.py test --parallel N --keepdb`` uses
+  ``test_<database>_1`` … ``test_<database>_N``,
+* ``pytest`` — ``pytest -n N --reuse-db`` (pytest-django + xdist) uses
+  ``test_<database>_gw0`` … ``test_<database>_gw<N-1>``.
+
+Both runners keep existing databases, so the clones are reused across runs
+until a migration input changes (the ``MigrationState`` fingerprint).
+"""
+
+import os
+
+from ..project.pixi_runner import PixiRunner
+from ..services import PostgresService
+from .migration_state import MigrationState
+
+TEST_RUNNERS = ("django", "pytest")
+# ``pytest -n N --reuse-db`` fails with a usage error without these.
+PYTEST_PLUGINS = ("pytest-django", "pytest-xdist")
+
+
+def worker_suffixes(test_runner: str, workers: int) -> list[str]:
+    """Return the database name suffix each worker of *test_runner* uses."""
+    if test_runner == "pytest":
+        return [f"gw{i}" for i in range(workers)]
+    if test_runner == "django":
+        return [str(i) for i in range(1, workers + 1)]
+    raise ValueError(f"Unknown test runner {test_runner!r}")
+
+
+class WorkerDatabases:
+    """Provision the template and per-worker test databases for a test run."""
+
+    def __init__(
+        self,
+        service: PostgresService,
+        runner: PixiRunner,
+        workers: int,
+        test_runner: str = "django",
+    ) -> None:
+        self.service = service
+        self.runner = runner
+        self.workers = workers
+        self.test_runner = test_runner
+        self.state = MigrationState(service.structure.root, "test-databases.json")
+
+    @property
+    def template(self) -> str:
+        return f"test_{self.service.database}"
+
+    @property
+    def names(self) -> list[str]:
+        suffixes = worker_suffixes(self.test_runner, self.workers)
+        return [f"{self.template}_{suffix}" for suffix in suffixes]
+
+    def is_current(self) -> bool:
+        """True if every database exists and no migration input changed."""
+        if not self.state.is_current():
+            return False
+        return {self.template, *self.names} <= self.service.databases()
+
+    def _migrate_template(self) -> None:
+        env = {
+            **os.environ,
+            **self.service.connection_env(),
+            self.service.database_env_key: self.template,
+        }
+        self.runner.run_manage_command("migrate", "--noinput", env=env)
+
+    def provision(self, rebuild: bool = False) -> bool:
+        """Bring the template up to date and re-clone the worker databases.
+
+        Returns False if the existing databases were reused as they are.
+        """
+        if not rebuild and self.is_current():
+            return False
+        self.state.clear()
+        if self.template not in self.service.databases():
+            self.service.create_database(self.template)
+        self._migrate_template()
+        self.service.clone_databases(self.template, self.names)
+        self.state.record()
+        return True
@@ -10,13 +10,13 @@ from pydantic import Field
 from ..console.print import print_console
 from ..prek.prek import format_files
 from ..project.project_structure import ProjectStructure
-from ..tracking import Section
+from ..templates.manager import CopyReport
+from ..tracking import ProjectTracking, Section
 from .pixi_ops import PixiOps
 from .scaffold import (
     cleanup_files,
     copy_templates,
     restore_original_templates,
-    template_output_files,
 )
 from .secrets import SecretsOps
 from .tracking import TrackingOps
@@ -91,7 +91,24 @@ class Installable(InstallableConfig):
         *,
         install_kwargs: Optional[dict[str, Any]] = None,
     ) -> None:
-        """Install this item: pixi add -> copy templates -> track -> secrets."""
+        """Install this item: pixi add -> copy templates -> track -> secrets.
+
+        The orchestrator runs the same phases across a whole ``InstallPlan``
+        instead (see ``plan.execute_plan``); this is the single-item path.
+        """
+        variant = self.begin_add(variant_name, install_kwargs)
+        self.add_dependencies(variant)
+        report = self.add_templates(variant)
+        format_files(report.changed, self.structure.root)
+        self.add_secrets(variant)
+        self.add_tracking(variant)
+
+    def begin_add(
+        self,
+        variant_name: Optional[str] = None,
+        install_kwargs: Optional[dict[str, Any]] = None,
+    ) -> Optional[Variant]:
+        """Validate the variant and set the install context for the add phases."""
         variant = self.variants.get(variant_name) if variant_name else None
 
         if not variant_name and self.exclusive_variants and self.variants:
@@ -99,28 +116,38 @@ class Installable(InstallableConfig):
                 f"{self.name} has exclusive variants \u2014 must specify one"
             )
 
-        if install_kwargs is None:
-            install_kwargs = {}
-        self._install_context = install_kwargs
+        self._install_context = install_kwargs if install_kwargs is not None else {}
+        return variant
 
+    def add_dependencies(self, variant: Optional[Variant] = None) -> None:
+        """Add phase 1: pixi packages, wrapped in the pixi install hooks."""
         self.before_pixi_install()
-        PixiOps(self.structure.root, self.verbose).add_packages(
-            self.pixi_packages, variant
+        pixi_ops = PixiOps(self.structure.root, self.verbose)
+        pixi_ops.add_packages(self.pixi_packages, variant)
+        print_console.ok(
+            "Queued dependency" if pixi_ops.deferred else "Installed dependency"
         )
-        print_console.ok("Installed dependency")
         self.after_pixi_install()
 
+    def add_templates(self, variant: Optional[Variant] = None) -> CopyReport:
+        """Add phase 2: copy templates; reports created/updated/unchanged files."""
         self.before_copy_templates()
-        copy_templates(self, variant)
+        report = copy_templates(self, variant)
         print_console.ok("Finished configuration")
         self.after_copy_templates()
+        return report
 
-        copied = template_output_files(self, variant)
-        format_files([self.structure.root / f for f in copied], self.structure.root)
-
+    def add_secrets(self, variant: Optional[Variant] = None) -> None:
+        """Add phase 3: generate missing secret files."""
         SecretsOps(self.structure.root).generate(self, variant)
 
-        TrackingOps(self.section).track_install(self, variant)
+    def add_tracking(
+        self,
+        variant: Optional[Variant] = None,
+        project: Optional[ProjectTracking] = None,
+    ) -> None:
+        """Add phase 4: record the install in djdevx.toml (or in *project*)."""
+        TrackingOps(self.section, project=project).track_install(self, variant)
 
     def remove(self, variant_name: Optional[str] = None) -> None:
         """Remove this item: pixi remove -> cleanup -> restore -> untrack."""
@@ -140,7 +167,9 @@ class Installable(InstallableConfig):
         if variant is None or not updated:
             pixi_ops.remove_packages(self.pixi_packages)
 
-        print_console.ok("Removed dependency")
+        print_console.ok(
+            "Queued dependency removal" if pixi_ops.deferred else "Removed dependency"
+        )
         self.after_pixi_remove()
 
         cleanup_files(self, variant)
@@ -0,0 +1,115 @@
+"""Installable manifest — names, display names and variants without imports.
+
+Listing, shell completion and the settings collector only need metadata about
+installables. The manifest caches that metadata per kind as JSON in the user
+cache directory, keyed by the djdevx version and the mtimes/sizes of the
+kind's modules, so those commands never import every plugin module.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Optional, cast
+
+from ... import __version__
+from ..system.cache_dir import user_cache_dir
+from .types import InstallableKind
+
+MANIFEST_FORMAT = 1
+
+
+@dataclass
+class ManifestEntry:
+    """Import-free metadata of one registered installable."""
+
+    name: str
+    display_name: str
+    module: str
+    variants: dict[str, str] = field(default_factory=dict)
+    secret_generators: list[str] = field(default_factory=list)
+
+
+def field_default(cls, field_name: str) -> Any:
+    """Return the class-level default of pydantic field *field_name*."""
+    field_info = cls.model_fields[field_name]
+    if field_info.default_factory is not None:
+        return cast(Callable[[], Any], field_info.default_factory)()
+    return field_info.default
+
+
+def entry_for(name: str, cls) -> ManifestEntry:
+    """Build the manifest entry of installable class *cls* registered as *name*."""
+    variants = field_default(cls, "variants") or {}
+    return ManifestEntry(
+        name=name,
+        display_name=field_default(cls, "display_name") or "",
+        module=cls.__module__,
+        variants={key: v.display_name or key for key, v in variants.items()},
+        secret_generators=list(field_default(cls, "secret_generators") or {}),
+    )
+
+
+def fingerprint(search_paths: Iterable[str]) -> str:
+    """Hash the djdevx version and the mtime/size of every module in *search_paths*."""
+    digest = hashlib.sha1(f"{MANIFEST_FORMAT}:{__version__}".encode())
+    for root in map(Path, search_paths):
+        for path in sorted([*root.glob("*.py"), *root.glob("*/*.py")]):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            rel = path.relative_to(root).as_posix()
+            digest.update(f"{rel}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+    return digest.hexdigest()
+
+
+def manifest_path(kind: InstallableKind, search_paths: Sequence[str]) -> Path:
+    """Cache file of *kind* — one per install location, so checkouts don't clash."""
+    location = hashlib.sha1("|".join(search_paths).encode()).hexdigest()[:12]
+    return user_cache_dir("manifests") / f"{kind.name}-{location}.json"
+
+
+def _read(path: Path, expected: str) -> Optional[list[ManifestEntry]]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("fingerprint") != expected:
+        return None
+    try:
+        return [ManifestEntry(**entry) for entry in data["entries"]]
+    except (KeyError, TypeError):
+        return None
+
+
+def _write(path: Path, key: str, entries: list[ManifestEntry]) -> None:
+    """Write atomically; a read-only cache directory only costs the speed-up."""
+    payload = {"fingerprint": key, "entries": [asdict(e) for e in entries]}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        with os.fdopen(fd, "w") as fh:
+            json.dump(payload, fh)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def load_manifest(
+    kind: InstallableKind,
+    search_paths: Sequence[str],
+    build: Callable[[], list[ManifestEntry]],
+) -> dict[str, ManifestEntry]:
+    """Return the manifest of *kind*, calling *build* only when it is stale."""
+    search_paths = list(search_paths)
+    key = fingerprint(search_paths)
+    path = manifest_path(kind, search_paths)
+    entries = _read(path, key)
+    if entries is None:
+        entries = build()
+        _write(path, key, entries)
+    return {entry.name: entry for entry in entries}
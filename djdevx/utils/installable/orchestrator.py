@@ -5,8 +5,10 @@ from typing import Any
 
 from ..console import prompts
 from ..console.print import print_console
-from ..tracking import ProjectTracking
+from ..tracking import tracking_session
 
+from .pixi_ops import pixi_batch
+from .plan import InstallPlan, PlanStep, execute_plan
 from .resolver import resolve
 from .tracking import (
     get_installed_names,
@@ -17,19 +19,6 @@ from .tracking import (
 from .types import InstallParam, InstallableRef
 
 
-def _auto_install_needs(needs: list[InstallableRef], verbose: bool) -> None:
-    """Resolve and install unmet dependencies recursively."""
-    project = ProjectTracking()
-    for ref in needs:
-        cls = resolve(ref)
-        section = get_section(cls)
-        if project.is_installed(section, ref.name):
-            continue
-        print_console.step(f"Installing required dependency: {ref.name}")
-        add_installable(cls, ref.name, verbose=verbose)
-        print_console.step_done(f"Installed required dependency: {ref.name}")
-
-
 def select_installable(cls, label: str) -> list[str] | None:
     """Interactive multi-select from not-yet-installed installables."""
     available = get_installable_names(cls)
@@ -138,28 +127,100 @@ def add_installable(
     provider: str | None = None,
     verbose: bool = False,
     is_multi: bool = False,
+    *,
+    plan: InstallPlan | None = None,
+    dry_run: bool = False,
 ) -> bool:
     """Install an installable.
 
     Returns True if installed, False if skipped.
-    Handles dependencies, variants, and interactive prompts.
+    Handles dependencies, variants, and interactive prompts. With *plan* the
+    installable (and its unmet ``needs``) is only added to that plan for the
+    caller to run; otherwise a plan is built and run right away.
     """
+    if plan is not None:
+        return _plan_installable(plan, cls, name, provider, verbose, is_multi)
+
+    plan = InstallPlan(verbose=verbose)
+    planned = _plan_installable(plan, cls, name, provider, verbose, is_multi)
+    run_plan(plan, dry_run=dry_run)
+    return planned
+
+
+def run_plan(plan: InstallPlan, dry_run: bool = False) -> None:
+    """Execute *plan*, or only print it when *dry_run* is set."""
+    if dry_run:
+        plan.describe()
+        return
+    execute_plan(plan)
+
+
+def _plan_needs(plan: InstallPlan, needs: list[InstallableRef], verbose: bool):
+    """Plan unmet dependencies recursively; return the plan keys they map to."""
+    keys = []
+    for ref in needs:
+        cls = resolve(ref)
+        section = get_section(cls)
+        if not plan.is_installed(section, ref.name):
+            print_console.step(f"Resolving required dependency: {ref.name}")
+            _plan_installable(plan, cls, ref.name, verbose=verbose)
+        keys.extend(plan.keys_for(section, ref.name))
+    return keys
+
+
+def _plan_installable(
+    plan: InstallPlan,
+    cls,
+    name: str,
+    provider: str | None = None,
+    verbose: bool = False,
+    is_multi: bool = False,
+) -> bool:
     installable = cls(verbose=verbose)
 
-    _auto_install_needs(installable.needs, verbose)
+    with plan.resolving(installable.section, name):
+        needs = _plan_needs(plan, installable.needs, verbose)
+
+        if installable.exclusive_variants and installable.variants:
+            return _plan_exclusive_variant(
+                plan, installable, name, provider, needs, is_multi
+            )
 
-    if installable.exclusive_variants and installable.variants:
-        return _add_exclusive_variant(installable, name, provider, verbose, is_multi)
+        if installable.variants:
+            return _plan_additive_variants(
+                plan, installable, name, provider, needs, is_multi
+            )
 
-    if installable.variants:
-        return _add_additive_variants(installable, name, provider, verbose, is_multi)
+        return _plan_simple(plan, installable, name, needs)
 
-    return _add_simple(installable, name, is_multi)
+
+def _plan_variant(plan: InstallPlan, installable, variant_name: str, needs) -> None:
+    """Add one variant step, after planning the variant's own needs."""
+    variant = installable.variants[variant_name]
+    depends_on = needs + _plan_needs(plan, variant.needs, installable.verbose)
+    plan.add_step(
+        PlanStep(
+            installable=type(installable)(verbose=installable.verbose),
+            variant_name=variant_name,
+            install_kwargs=_collect_install_kwargs(variant),
+            depends_on=depends_on,
+        )
+    )
 
 
-def _add_exclusive_variant(installable, name, provider, verbose, is_multi) -> bool:
-    """Install an installable that requires exactly one variant."""
-    if name in get_installed_names(type(installable)):
+def _unknown_variant(installable, provider: str, is_multi: bool) -> bool:
+    if is_multi:
+        print_console.warning(
+            f"Unknown variant '{provider}' for {installable.display_name}. Skipping."
+        )
+        return False
+    print_console.fail(f"Unknown variant: {provider}")
+    return False
+
+
+def _plan_exclusive_variant(plan, installable, name, provider, needs, is_multi) -> bool:
+    """Plan an installable that requires exactly one variant."""
+    if plan.is_installed(installable.section, name):
         print_console.ok(f"{installable.display_name} is already installed.")
         return False
 
@@ -169,92 +230,52 @@ def _add_exclusive_variant(installable, name, provider, verbose, is_multi) -> bo
             return False
 
     if provider not in installable.variants:
-        if is_multi:
-            print_console.warning(
-                f"Unknown variant '{provider}' "
-                f"for {installable.display_name}. Skipping."
-            )
-            return False
-        print_console.fail(f"Unknown variant: {provider}")
-        return False
+        return _unknown_variant(installable, provider, is_multi)
 
-    variant = installable.variants[provider]
-    _auto_install_needs(variant.needs, verbose)
-    install_kwargs = _collect_install_kwargs(variant)
-
-    print_console.step(f"Installing {installable.display_name}...")
-    installable.add(variant_name=provider, install_kwargs=install_kwargs)
-    print_console.step_done(
-        f"{installable.display_name} ({variant.display_name}) installed."
-    )
+    _plan_variant(plan, installable, provider, needs)
     return True
 
 
-def _add_additive_variants(installable, name, provider, verbose, is_multi) -> bool:
-    """Install an installable with additive (non-exclusive) variants."""
-    installed = get_installed_variants(type(installable), name)
+def _plan_additive_variants(plan, installable, name, provider, needs, is_multi) -> bool:
+    """Plan an installable with additive (non-exclusive) variants."""
+    installed = plan.installed_variants(installable.section, name)
 
     for rv_name, rv in installable.variants.items():
         if rv.required and rv_name not in installed:
-            _auto_install_needs(rv.needs, verbose)
-            install_kwargs = _collect_install_kwargs(rv)
-            print_console.step(
-                f"Installing {installable.display_name} ({rv.display_name})..."
-            )
-            installable.reset_state()
-            installable.add(variant_name=rv_name, install_kwargs=install_kwargs)
+            _plan_variant(plan, installable, rv_name, needs)
             installed.append(rv_name)
+    needs = needs + plan.keys_for(installable.section, name)
 
     if provider:
         if provider not in installable.variants:
-            if is_multi:
-                print_console.warning(
-                    f"Unknown variant '{provider}' "
-                    f"for {installable.display_name}. Skipping."
-                )
-                return False
-            print_console.fail(f"Unknown variant: {provider}")
-            return False
+            return _unknown_variant(installable, provider, is_multi)
         if provider in installed:
             print_console.info(
                 f"{installable.variants[provider].display_name} already installed."
             )
             return False
-        variant = installable.variants[provider]
-        _auto_install_needs(variant.needs, verbose)
-        install_kwargs = _collect_install_kwargs(variant)
-        print_console.step(
-            f"Installing {installable.display_name} ({variant.display_name})..."
-        )
-        installable.reset_state()
-        installable.add(variant_name=provider, install_kwargs=install_kwargs)
-    else:
-        selected = _select_optional_variants(installable.variants, installed)
-        if selected:
-            for var_name in selected:
-                variant = installable.variants[var_name]
-                _auto_install_needs(variant.needs, verbose)
-                install_kwargs = _collect_install_kwargs(variant)
-                print_console.step(
-                    f"Installing {installable.display_name} ({variant.display_name})..."
-                )
-                installable.reset_state()
-                installable.add(variant_name=var_name, install_kwargs=install_kwargs)
+        _plan_variant(plan, installable, provider, needs)
+        return True
 
-    print_console.step_done(f"{installable.display_name} installed.")
+    selected = _select_optional_variants(installable.variants, installed)
+    for var_name in selected or []:
+        _plan_variant(plan, installable, var_name, needs)
     return True
 
 
-def _add_simple(installable, name, is_multi) -> bool:
-    """Install an installable with no variants."""
-    if name in get_installed_names(type(installable)):
-        print_console.ok(f"{installable.display_name} is already installed.")
+def _plan_simple(plan, installable, name, needs) -> bool:
+    """Plan an installable with no variants."""
+    if plan.is_installed(installable.section, name):
+        print_console.ok(f"{installable.display_name or name} is already installed.")
         return False
 
-    install_kwargs = _collect_install_kwargs(installable)
-    print_console.step(f"Installing {installable.display_name or name}...")
-    installable.add(install_kwargs=install_kwargs)
-    print_console.step_done(f"{installable.display_name or name} installed.")
+    plan.add_step(
+        PlanStep(
+            installable=installable,
+            install_kwargs=_collect_install_kwargs(installable),
+            depends_on=needs,
+        )
+    )
     return True
 
 
@@ -273,7 +294,8 @@ def remove_installable(
     """Remove an installable.
 
     Returns True if removed, False if skipped.
-    Handles variants and interactive prompts.
+    Handles variants and interactive prompts. Pixi removals are applied as one
+    batch at the end, and djdevx.toml is written once.
     """
     installable = cls(verbose=verbose)
 
@@ -286,13 +308,14 @@ def remove_installable(
         print_console.ok(f"{installable.display_name or name} is not installed.")
         return False
 
-    if not installable.variants:
-        return _remove_simple(installable, name)
+    with tracking_session(), pixi_batch():
+        if not installable.variants:
+            return _remove_simple(installable, name)
 
-    if installable.exclusive_variants:
-        return _remove_exclusive_variant(installable, name, provider, is_multi)
+        if installable.exclusive_variants:
+            return _remove_exclusive_variant(installable, name, provider, is_multi)
 
-    return _remove_additive_variants(installable, name, provider, is_multi)
+        return _remove_additive_variants(installable, name, provider, is_multi)
 
 
 def _remove_simple(installable, name) -> bool:
@@ -1,40 +1,133 @@
 """PixiOps — pixi package operations for installable lifecycle."""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 
+from ..console.print import print_console
 from ..project.pixi_runner import PixiRunner
 from ..types.pixi_types import PixiPackageSpec
 from .types import Variant
 
+PixiGroupKey = tuple[str, Optional[str]]
+
+
+def group_package_specs(
+    specs: list[PixiPackageSpec],
+) -> dict[PixiGroupKey, list[PixiPackageSpec]]:
+    """Group specs by ``(kind, pixi_feature)``, dropping duplicates, keeping order."""
+    groups: dict[PixiGroupKey, list[PixiPackageSpec]] = {}
+    for spec in specs:
+        group = groups.setdefault((spec.kind, spec.pixi_feature), [])
+        if spec not in group:
+            group.append(spec)
+    return groups
+
+
+class PixiBatch:
+    """Collects the pixi changes of one command run and applies them per group.
+
+    Every ``(kind, pixi_feature)`` group is applied with a single ``pixi add`` /
+    ``pixi remove`` invocation, so the environment is solved once per group
+    instead of once per package.
+    """
+
+    def __init__(self) -> None:
+        self._runner: Optional[PixiRunner] = None
+        self.to_add: list[PixiPackageSpec] = []
+        self.to_remove: list[PixiPackageSpec] = []
+
+    def queue_add(self, runner: PixiRunner, specs: list[PixiPackageSpec]) -> None:
+        self._runner = self._runner or runner
+        self.to_add.extend(specs)
+
+    def queue_remove(self, runner: PixiRunner, specs: list[PixiPackageSpec]) -> None:
+        self._runner = self._runner or runner
+        self.to_remove.extend(specs)
+
+    def discard(self) -> None:
+        """Drop everything queued so far."""
+        self.to_add, self.to_remove = [], []
+
+    def is_empty(self) -> bool:
+        return not self.to_add and not self.to_remove
+
+    def flush(self) -> None:
+        """Apply queued removals, then queued additions, one invocation per group."""
+        if self._runner is None or self.is_empty():
+            return
+        to_add, to_remove = self.to_add, self.to_remove
+        self.to_add, self.to_remove = [], []
+
+        if to_remove:
+            print_console.step("Removing dependencies ...")
+            for (_, feature), group in group_package_specs(to_remove).items():
+                self._runner.remove_package_specs_if_exist(group, pixi_feature=feature)
+            print_console.step_done("Dependencies removed.")
+
+        if to_add:
+            print_console.step("Installing dependencies ...")
+            for (_, feature), group in group_package_specs(to_add).items():
+                self._runner.add_package_specs(group, pixi_feature=feature)
+            print_console.step_done("Dependencies installed.")
+
+
+_active_batch: Optional[PixiBatch] = None
+
+
+@contextmanager
+def pixi_batch() -> Iterator[PixiBatch]:
+    """Defer every ``PixiOps`` change made inside the block to one batch.
+
+    Re-entrant: nested blocks join the outermost batch, which is flushed when
+    the outermost block exits — including on error, so changes whose templates
+    and tracking were already written still get their dependencies.
+    """
+    global _active_batch
+    if _active_batch is not None:
+        yield _active_batch
+        return
+
+    batch = _active_batch = PixiBatch()
+    try:
+        yield batch
+    finally:
+        _active_batch = None
+        batch.flush()
+
 
 class PixiOps:
     def __init__(self, project_root: Path, verbose: bool = False):
         self.pixi = PixiRunner(project_root=project_root, verbose=verbose)
 
+    @property
+    def deferred(self) -> bool:
+        """True when changes are queued on an active ``pixi_batch``."""
+        return _active_batch is not None
+
     def add_packages(
         self,
         packages: list[PixiPackageSpec],
         variant: Optional[Variant] = None,
     ) -> None:
-        for spec in packages:
-            self.pixi.add_from_package_spec(spec, pixi_feature=spec.pixi_feature)
+        specs = list(packages)
         if variant:
-            for spec in variant.pixi_packages:
-                self.pixi.add_from_package_spec(spec, pixi_feature=spec.pixi_feature)
+            specs.extend(variant.pixi_packages)
+        if _active_batch is not None:
+            _active_batch.queue_add(self.pixi, specs)
+            return
+        for (_, feature), group in group_package_specs(specs).items():
+            self.pixi.add_package_specs(group, pixi_feature=feature)
 
     def remove_packages(
         self,
         packages: list[PixiPackageSpec],
         variant: Optional[Variant] = None,
     ) -> None:
-        if variant:
-            for spec in variant.pixi_packages:
-                self.pixi.remove_package_spec_if_exists(
-                    spec, pixi_feature=spec.pixi_feature
-                )
-        else:
-            for spec in packages:
-                self.pixi.remove_package_spec_if_exists(
-                    spec, pixi_feature=spec.pixi_feature
-                )
+        specs = list(variant.pixi_packages) if variant else list(packages)
+        if _active_batch is not None:
+            _active_batch.queue_remove(self.pixi, specs)
+            return
+        for (_, feature), group in group_package_specs(specs).items():
+            self.pixi.remove_package_specs_if_exist(group, pixi_feature=feature)
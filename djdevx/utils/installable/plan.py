@@ -0,0 +1,216 @@
+"""InstallPlan — a resolved install DAG executed in phases."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from ..console.print import print_console
+from ..prek.prek import format_files
+from ..templates.manager import CopyReport
+from ..tracking import ProjectTracking, Section
+from .pixi_ops import pixi_batch
+
+PlanKey = tuple[Section, str, Optional[str]]
+
+
+@dataclass
+class PlanStep:
+    """One installable (or one of its variants) scheduled for installation."""
+
+    installable: Any
+    variant_name: Optional[str] = None
+    install_kwargs: dict[str, Any] = field(default_factory=dict)
+    depends_on: list[PlanKey] = field(default_factory=list)
+
+    @property
+    def key(self) -> PlanKey:
+        return (self.installable.section, self.name, self.variant_name)
+
+    @property
+    def name(self) -> str:
+        return self.installable.name.replace("_", "-")
+
+    @property
+    def variant(self):
+        if self.variant_name is None:
+            return None
+        return self.installable.variants[self.variant_name]
+
+    @property
+    def label(self) -> str:
+        label = self.installable.display_name or self.installable.name
+        if self.variant is not None:
+            label += f" ({self.variant.display_name})"
+        return label
+
+
+class InstallPlan:
+    """Every installable, variant and transitive ``needs`` of one add run.
+
+    Planning (dependency resolution, variant selection, parameter prompts)
+    happens up front; ``execute_plan`` then runs the whole DAG in phases so the
+    run costs a constant number of pixi / prek invocations and djdevx.toml is
+    only written once everything else succeeded.
+    """
+
+    def __init__(
+        self,
+        project_root: Optional[Path] = None,
+        verbose: bool = False,
+    ) -> None:
+        self.verbose = verbose
+        self.project = ProjectTracking(project_root, autosave=False)
+        self._steps: dict[PlanKey, PlanStep] = {}
+        self._resolving: list[tuple[Section, str]] = []
+
+    def __bool__(self) -> bool:
+        return bool(self._steps)
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def is_installed(self, section: Section, name: str) -> bool:
+        """True if *name* is tracked in djdevx.toml or already planned."""
+        name = name.replace("_", "-")
+        return self.project.is_installed(section, name) or any(
+            key[0] == section and key[1] == name for key in self._steps
+        )
+
+    def installed_variants(self, section: Section, name: str) -> list[str]:
+        """Tracked variants of *name* plus the variants planned so far."""
+        name = name.replace("_", "-")
+        variants = self.project.get_variants(section, name)
+        for key in self._steps:
+            if key[0] == section and key[1] == name and key[2] not in variants:
+                variants.append(key[2])
+        return [v for v in variants if v is not None]
+
+    def keys_for(self, section: Section, name: str) -> list[PlanKey]:
+        """Keys of every planned step (base or variant) of *name*."""
+        name = name.replace("_", "-")
+        return [key for key in self._steps if key[:2] == (section, name)]
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def resolving(self, section: Section, name: str) -> Iterator[None]:
+        """Guard a recursive ``needs`` resolution against dependency cycles."""
+        node = (section, name.replace("_", "-"))
+        if node in self._resolving:
+            cycle = [n for _, n in self._resolving[self._resolving.index(node) :]]
+            raise ValueError(f"Dependency cycle: {' -> '.join(cycle + [node[1]])}")
+        self._resolving.append(node)
+        try:
+            yield
+        finally:
+            self._resolving.pop()
+
+    def add_step(self, step: PlanStep) -> PlanStep:
+        self._steps.setdefault(step.key, step)
+        return self._steps[step.key]
+
+    def ordered_steps(self) -> list[PlanStep]:
+        """Steps in dependency order, otherwise in the order they were planned."""
+        ordered: list[PlanStep] = []
+        done: set[PlanKey] = set()
+        pending = list(self._steps.values())
+        while pending:
+            step = next(
+                (
+                    step
+                    for step in pending
+                    if all(
+                        dep in done or dep not in self._steps for dep in step.depends_on
+                    )
+                ),
+                None,
+            )
+            if step is None:
+                labels = ", ".join(step.label for step in pending)
+                raise ValueError(f"Dependency cycle in install plan: {labels}")
+            ordered.append(step)
+            done.add(step.key)
+            pending.remove(step)
+        return ordered
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def describe(self) -> None:
+        """Print the plan as a table (used by ``--dry-run``)."""
+        steps = self.ordered_steps()
+        if not steps:
+            print_console.info("Nothing to install.")
+            return
+        labels = {step.key: step.label for step in steps}
+        with print_console.table(
+            "Install plan",
+            [
+                ("#", {"justify": "right"}),
+                ("Installable", {}),
+                ("Section", {}),
+                ("Needs", {}),
+                ("Dependencies", {}),
+            ],
+        ) as tbl:
+            for index, step in enumerate(steps, start=1):
+                specs = list(step.installable.pixi_packages)
+                if step.variant is not None:
+                    specs.extend(step.variant.pixi_packages)
+                tbl.add_row(
+                    str(index),
+                    step.label,
+                    str(step.installable.section),
+                    ", ".join(labels[dep] for dep in step.depends_on if dep in labels),
+                    ", ".join(spec.name for spec in specs),
+                )
+
+
+def execute_plan(plan: InstallPlan) -> None:
+    """Run *plan* phase by phase.
+
+    Phases: one pixi batch, all template copies, one formatting pass over the
+    files the copies actually changed, one secrets pass, one tracking save.
+    An error in any phase aborts the run before djdevx.toml is touched.
+    """
+    steps = plan.ordered_steps()
+    if not steps:
+        return
+
+    for step in steps:
+        step.installable.begin_add(step.variant_name, step.install_kwargs)
+
+    with pixi_batch() as batch:
+        try:
+            for step in steps:
+                step.installable.add_dependencies(step.variant)
+        except Exception:
+            batch.discard()
+            raise
+
+    report = CopyReport()
+    for step in steps:
+        print_console.step(f"Configuring {step.label}...")
+        report.extend(step.installable.add_templates(step.variant))
+
+    changed = list(dict.fromkeys(report.changed))
+    format_files(changed, steps[0].installable.structure.root)
+
+    for step in steps:
+        step.installable.add_secrets(step.variant)
+
+    for step in steps:
+        step.installable.add_tracking(step.variant, project=plan.project)
+    plan.project.save()
+
+    for step in steps:
+        print_console.step_done(f"{step.label} installed.")
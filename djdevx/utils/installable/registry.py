@@ -1,6 +1,9 @@
-from typing import Generic, Type, TypeVar
+import importlib
+from typing import Generic, Optional, Type, TypeVar
 
-from .types import InstallableConfig, InstallableKind
+from .discovery import discover_and_register
+from .manifest import ManifestEntry, entry_for, load_manifest
+from .types import INSTALLABLE_KINDS, InstallableConfig, InstallableKind
 
 T = TypeVar("T", bound=InstallableConfig)
 
@@ -8,10 +11,20 @@ REGISTRIES: dict[str, "Registry"] = {}
 
 
 class Registry(Generic[T]):
+    """Installables of one kind, discovered on the first lookup.
+
+    ``register`` never triggers discovery, so modules imported by
+    ``discover_and_register`` can register themselves. ``list`` and
+    ``display_name`` answer from the kind's manifest, ``get`` imports only the
+    requested module, and ``values`` imports the whole package once.
+    """
+
     def __init__(self, kind: InstallableKind) -> None:
         self._entries: dict[str, Type[T]] = {}
         self._kind = kind
         self._label = kind.name
+        self._discovered = kind.package is None
+        self._manifest: Optional[dict[str, ManifestEntry]] = None
         REGISTRIES[kind.name] = self
 
     @property
@@ -22,6 +35,35 @@ class Registry(Generic[T]):
     def _normalize(name: str) -> str:
         return name.replace("_", "-")
 
+    def _discover(self) -> None:
+        if self._discovered or self._kind.package is None:
+            return
+        self._discovered = True
+        package = importlib.import_module(self._kind.package)
+        discover_and_register(package.__path__, package.__name__)
+
+    def manifest(self) -> dict[str, ManifestEntry]:
+        """Metadata of every installable, keyed by normalized name."""
+        if self._kind.package is None:
+            return {name: entry_for(name, cls) for name, cls in self._entries.items()}
+        if self._manifest is None:
+            package = importlib.import_module(self._kind.package)
+            self._manifest = load_manifest(
+                self._kind, list(package.__path__), self._build_manifest
+            )
+        return {
+            **self._manifest,
+            **{
+                name: entry_for(name, cls)
+                for name, cls in self._entries.items()
+                if name not in self._manifest
+            },
+        }
+
+    def _build_manifest(self) -> list[ManifestEntry]:
+        self._discover()
+        return [entry_for(name, cls) for name, cls in self._entries.items()]
+
     def register(self, cls: Type[T]) -> Type[T]:
         name = cls.get_installable_name()
         self._entries[self._normalize(name)] = cls
@@ -29,6 +71,12 @@ class Registry(Generic[T]):
 
     def get(self, name: str) -> Type[T]:
         normalized = self._normalize(name)
+        if normalized not in self._entries:
+            entry = self.manifest().get(normalized)
+            if entry is not None:
+                importlib.import_module(entry.module)
+        if normalized not in self._entries:
+            self._discover()
         if normalized not in self._entries:
             raise KeyError(
                 f"Unknown {self._label} '{name}'. "
@@ -37,7 +85,28 @@ class Registry(Generic[T]):
         return self._entries[normalized]
 
     def list(self) -> list[str]:
-        return sorted(self._entries.keys())
+        return sorted(self.manifest())
+
+    def display_name(self, name: str) -> str:
+        entry = self.manifest().get(self._normalize(name))
+        return (entry.display_name if entry else "") or name
 
     def values(self) -> list[Type[T]]:
+        self._discover()
         return list(self._entries.values())
+
+
+def get_registry(kind: InstallableKind) -> "Registry":
+    """Return the registry of *kind*, importing its ``_registry`` module if needed."""
+    if kind.name not in REGISTRIES and kind.package is not None:
+        importlib.import_module(f"{kind.package}._registry")
+    if kind.name not in REGISTRIES:
+        raise ValueError(f"Unknown installable kind: {kind}")
+    return REGISTRIES[kind.name]
+
+
+def load_registries() -> list["Registry"]:
+    """Every registry: the built-in kinds plus any created elsewhere."""
+    for kind in INSTALLABLE_KINDS:
+        get_registry(kind)
+    return list(REGISTRIES.values())
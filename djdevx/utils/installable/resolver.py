@@ -1,11 +1,8 @@
 """Resolve InstallableRef to its class via the appropriate registry."""
 
-from .registry import REGISTRIES
+from .registry import get_registry
 from .types import InstallableRef
 
 
 def resolve(ref: InstallableRef) -> type:
-    registry = REGISTRIES.get(ref.kind.name)
-    if registry is None:
-        raise ValueError(f"Unknown installable kind: {ref.kind}")
-    return registry.get(ref.name)
+    return get_registry(ref.kind).get(ref.name)
@@ -2,7 +2,8 @@
 
 import shutil
 from pathlib import Path
-from ..templates.manager import TemplateManager
+from ..project.url_registry import sync_url_registry
+from ..templates.manager import CopyReport, TemplateManager
 
 
 def resolve_template_source(installable, variant=None) -> Path | None:
@@ -15,18 +16,20 @@ def resolve_template_source(installable, variant=None) -> Path | None:
     return None
 
 
-def copy_templates(installable, variant=None) -> None:
+def copy_templates(installable, variant=None) -> CopyReport:
     manager = TemplateManager()
     context = installable._install_context.copy()
     source_dir = resolve_template_source(installable, variant)
-    if source_dir is None:
-        return
-    if source_dir.exists():
-        manager.copy_templates(
-            source_dir=source_dir,
-            dest_dir=installable.structure.root,
-            template_context=context,
-        )
+    if source_dir is None or not source_dir.exists():
+        return CopyReport()
+    report = manager.copy_templates(
+        source_dir=source_dir,
+        dest_dir=installable.structure.root,
+        template_context=context,
+    )
+    if sync_url_registry(installable.structure):
+        report.updated.append(installable.structure.url_registry)
+    return report
 
 
 def template_output_files(installable, variant=None) -> list[Path]:
@@ -61,6 +64,7 @@ def cleanup_files(installable, variant=None) -> None:
         (installable.structure.root / rel_path).unlink(missing_ok=True)
     for rel_path in extras.folders_to_remove:
         shutil.rmtree(installable.structure.root / rel_path, ignore_errors=True)
+    sync_url_registry(installable.structure)
 
 
 def restore_original_templates(installable) -> None:
@@ -13,9 +13,14 @@ def _normalize(name: str) -> str:
 class TrackingOps:
     """Section-scoped tracking operations for installable lifecycle."""
 
-    def __init__(self, section: Section, project_root: Optional[Path] = None):
+    def __init__(
+        self,
+        section: Section,
+        project_root: Optional[Path] = None,
+        project: Optional[ProjectTracking] = None,
+    ):
         self._section = section
-        self._project = ProjectTracking(project_root)
+        self._project = project or ProjectTracking(project_root)
 
     def track_install(self, instance, variant=None) -> None:
         name = _normalize(instance.name)
@@ -70,11 +75,7 @@ def get_installable_names(cls) -> list[str]:
 
 
 def get_display_name(cls, name: str) -> str:
-    try:
-        installable_cls = cls.get_registry().get(name)
-        return installable_cls.model_fields["display_name"].default or name
-    except KeyError:
-        return name
+    return cls.get_registry().display_name(name)
 
 
 def autocomplete_installable(cls, incomplete: str) -> list[str]:
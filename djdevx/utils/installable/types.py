@@ -27,13 +27,17 @@ class InstallParam:
 class InstallableKind:
     name: str
     section: Section
+    package: Optional[str] = None
+    """Package whose modules register installables of this kind."""
 
 
-PACKAGE = InstallableKind("package", Section.PACKAGES)
-FEATURE = InstallableKind("feature", Section.FEATURES)
-FRAMEWORK = InstallableKind("framework", Section.FRAMEWORKS)
-DATABASE = InstallableKind("database", Section.DATABASE)
-CACHE = InstallableKind("cache", Section.CACHE)
+PACKAGE = InstallableKind("package", Section.PACKAGES, "djdevx.packages")
+FEATURE = InstallableKind("feature", Section.FEATURES, "djdevx.features")
+FRAMEWORK = InstallableKind("framework", Section.FRAMEWORKS, "djdevx.frameworks")
+DATABASE = InstallableKind("database", Section.DATABASE, "djdevx.database")
+CACHE = InstallableKind("cache", Section.CACHE, "djdevx.cache")
+
+INSTALLABLE_KINDS = (PACKAGE, FEATURE, FRAMEWORK, DATABASE, CACHE)
 
 
 @dataclass
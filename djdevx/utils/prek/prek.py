@@ -1,20 +1,113 @@
 """Format output files using prek pre-commit hooks via pixi."""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Optional
 
 from ..project.pixi_runner import PixiRunner
 from ..console.print import print_console
 
 
+class FormatQueue:
+    """Files touched during one command, formatted together when it ends.
+
+    Every ``format_files`` call made while the queue is active only records
+    its files, so a command that writes many installables boots prek once.
+    """
+
+    def __init__(self, ruff_only: bool = False) -> None:
+        self.ruff_only = ruff_only
+        self._project_root: Optional[Path] = None
+        self.files: list[Path] = []
+
+    def queue(self, files: list[Path], project_root: Path) -> None:
+        self._project_root = self._project_root or project_root
+        for f in files:
+            if f not in self.files:
+                self.files.append(f)
+
+    def flush(self) -> None:
+        if self._project_root is None or not self.files:
+            return
+        files, self.files = self.files, []
+        if self.ruff_only:
+            format_python_files_with_ruff(files, self._project_root)
+        else:
+            _run_prek(files, self._project_root)
+
+
+_active_queue: Optional[FormatQueue] = None
+
+
+@contextmanager
+def formatting_queue(ruff_only: bool = False) -> Iterator[FormatQueue]:
+    """Defer every ``format_files`` call made inside the block to one pass.
+
+    Re-entrant: nested blocks join the outermost queue, which is flushed when
+    the outermost block exits — also on error, since the queued files were
+    already written. With *ruff_only*, only the generated Python files are
+    formatted, by ruff directly instead of the full prek hook set.
+    """
+    global _active_queue
+    if _active_queue is not None:
+        yield _active_queue
+        return
+
+    queue = _active_queue = FormatQueue(ruff_only=ruff_only)
+    try:
+        yield queue
+    finally:
+        _active_queue = None
+        queue.flush()
+
+
 def format_files(files: list[Path], project_root: Path) -> None:
     """Run prek pre-commit hooks on the given files via pixi.
 
+    Inside ``formatting_queue()`` the files are queued instead and formatted
+    once when the queue is flushed.
+
     Args:
         files: List of absolute file paths to format.
         project_root: Project root directory (where pixi.toml / prek.toml live).
     """
     if not files:
         return
+    if _active_queue is not None:
+        _active_queue.queue(files, project_root)
+        return
+    _run_prek(files, project_root)
+
+
+def format_python_files_with_ruff(files: list[Path], project_root: Path) -> None:
+    """Run only ``ruff check --fix`` and ``ruff format`` on the ``.py`` files.
+
+    Skips booting prek and its other hooks (pyupgrade, django-upgrade, djade,
+    ripsecrets, shellcheck); non-Python files are left as rendered.
+    """
+    str_files = [str(f) for f in files if f.suffix == ".py"]
+    if not str_files:
+        return
+    runner = PixiRunner(project_root=project_root)
+    print_console.step("Formatting Python files with ruff ...")
+    lint = runner.run_pixi_command(
+        "run", "ruff", "check", "--fix", "--quiet", *str_files, check=False
+    )
+    fmt = runner.run_pixi_command(
+        "run", "ruff", "format", "--quiet", *str_files, check=False
+    )
+    if lint.returncode != 0 or fmt.returncode != 0:
+        print_console.fail(
+            "Some files were not formatted successfully.\n"
+            f"Run `pixi run ruff check {' '.join(str_files)}` in the project root to see the details."
+        )
+        return
+
+    print_console.step_done("Files formatted.")
+
+
+def _run_prek(files: list[Path], project_root: Path) -> None:
     runner = PixiRunner(project_root=project_root)
     str_files = [str(f) for f in files]
     print_console.step("Formatting files ...")
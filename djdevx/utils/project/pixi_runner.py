@@ -28,10 +28,10 @@ class PixiRunner:
         return name
 
     def run_manage_command(
-        self, command: str, *args: str, check: bool = True
+        self, command: str, *args: str, check: bool = True, **kwargs
     ) -> subprocess.CompletedProcess:
         return self.run_pixi_command(
-            "run", "python", "manage.py", command, *args, check=check
+            "run", "python", "manage.py", command, *args, check=check, **kwargs
         )
 
     def run_pixi_command(
@@ -118,6 +118,55 @@ class PixiRunner:
         else:
             self.remove_conda_package(pkg_base, pixi_feature=pixi_feature)
 
+    @staticmethod
+    def _batch_args(
+        action: str,
+        specs: list[PixiPackageSpec],
+        names: list[str],
+        pixi_feature: Optional[str],
+    ) -> list[str]:
+        kinds = {spec.kind for spec in specs}
+        if len(kinds) > 1:
+            raise ValueError(
+                f"Cannot {action} conda and pypi packages in one pixi invocation"
+            )
+        cmd_args = [action]
+        if kinds == {"pypi"}:
+            cmd_args.append("--pypi")
+        cmd_args.extend(names)
+        if pixi_feature:
+            cmd_args.extend(["--feature", pixi_feature])
+        return cmd_args
+
+    def add_package_specs(
+        self, specs: list[PixiPackageSpec], pixi_feature: Optional[str] = None
+    ) -> Optional[subprocess.CompletedProcess]:
+        """Add several specs of the same kind with a single ``pixi add`` solve."""
+        if not specs:
+            return None
+        cmd_args = self._batch_args(
+            "add", specs, [spec.name for spec in specs], pixi_feature
+        )
+        return self.run_pixi_command(*cmd_args)
+
+    def remove_package_specs_if_exist(
+        self, specs: list[PixiPackageSpec], pixi_feature: Optional[str] = None
+    ) -> None:
+        """Remove several specs of the same kind with a single ``pixi remove``.
+
+        ``pixi remove`` fails as a whole when one of the packages is absent, so
+        a failed batch falls back to removing the specs one at a time.
+        """
+        if not specs:
+            return
+        names = [self._extract_package_name(spec.name) for spec in specs]
+        cmd_args = self._batch_args("remove", specs, names, pixi_feature)
+        try:
+            self.run_pixi_command(*cmd_args)
+        except subprocess.CalledProcessError:
+            for spec in specs:
+                self.remove_package_spec_if_exists(spec, pixi_feature=pixi_feature)
+
     def list_dependencies(self, environment: str = "") -> list[str]:
         cmd_args = ["list", "--explicit"]
         if environment:
@@ -74,6 +74,10 @@ class ProjectStructure:
     def packages_urls_dir(self) -> Path:
         return self._root / "urls" / "packages"
 
+    @property
+    def url_registry(self) -> Path:
+        return self._root / "urls" / "registry.py"
+
     # ------------------------------------------------------------------
     # Templates
     # ------------------------------------------------------------------
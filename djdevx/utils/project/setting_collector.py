@@ -15,14 +15,39 @@ Config vars = all other annotated fields (str, int, bool, list, …)
 Dev defaults are extracted from the get_dev_defaults() method body, which is
 always a plain dict literal in this codebase and is therefore safe to evaluate
 with ast.literal_eval without executing any code.
+
+Parse results are cached per project in the user cache directory, keyed by
+each file's path, mtime and size, so repeated collections (``dev status``,
+``settings list``, compose ``generate`` / ``verify``) only stat the files.
+Changed files are parsed in a process pool when there are enough of them.
 """
 
 import ast
+import hashlib
+import os
+import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
+from functools import cache, partial
 from pathlib import Path
-from typing import Any, Callable, Optional, cast
+from typing import Any, Callable, Optional
+
+from ... import __version__
+from ..installable.manifest import field_default
+from ..installable.registry import load_registries
+from ..system.cache_dir import user_cache_dir
+
+PARSE_CACHE_FORMAT = 1
+
+# Below this many changed files a process pool costs more than it saves.
+POOL_MIN_FILES = 32
 
-from ..installable.registry import REGISTRIES
+SecretFieldRow = tuple[str, Any, Any, Any, bool]
+ConfigVarRow = tuple[str, str, Any, Any, Any, bool]
+ParseResult = tuple[list[SecretFieldRow], list[ConfigVarRow]]
+FileStamp = tuple[int, int]
 
 
 @dataclass
@@ -159,11 +184,7 @@ def _extract_class_default(annotation_node: ast.AnnAssign) -> Any:
         return None
 
 
-def _parse_settings_file(
-    filepath: Path,
-) -> tuple[
-    list[tuple[str, Any, Any, Any, bool]], list[tuple[str, str, Any, Any, Any, bool]]
-]:
+def _parse_settings_file(filepath: Path) -> ParseResult:
     """Parse a single settings file via AST."""
     try:
         source = filepath.read_text(encoding="utf-8")
@@ -171,8 +192,8 @@ def _parse_settings_file(
     except (OSError, SyntaxError):
         return [], []
 
-    secret_fields: list[tuple[str, Any, Any, Any, bool]] = []
-    config_vars: list[tuple[str, str, Any, Any, Any, bool]] = []
+    secret_fields: list[SecretFieldRow] = []
+    config_vars: list[ConfigVarRow] = []
 
     for node in ast.walk(tree):
         if not isinstance(node, ast.ClassDef):
@@ -230,6 +251,131 @@ def _parse_settings_file(
     return secret_fields, config_vars
 
 
+def _parse_settings_files(files: list[Path]) -> list[ParseResult]:
+    """Parse *files*, fanning out over a process pool for large batches."""
+    workers = min(os.cpu_count() or 1, 8)
+    if len(files) >= POOL_MIN_FILES and workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunksize = max(1, len(files) // (workers * 4))
+                return list(pool.map(_parse_settings_file, files, chunksize=chunksize))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            pass  # no multiprocessing support here — parse serially
+    return [_parse_settings_file(f) for f in files]
+
+
+def _file_stamp(path: Path) -> Optional[FileStamp]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@cache
+def _collector_source_hash() -> str:
+    """Hash of this module's source, so parser changes invalidate the cache."""
+    try:
+        return hashlib.sha1(Path(__file__).read_bytes()).hexdigest()[:12]
+    except OSError:
+        return "unknown"
+
+
+def _owned_by_current_user(stat: os.stat_result) -> bool:
+    """Only unpickle cache files this user wrote."""
+    getuid = getattr(os, "getuid", None)
+    return getuid is None or stat.st_uid == getuid()
+
+
+class ParseCache:
+    """``_parse_settings_file`` results of one project, keyed by path/mtime/size.
+
+    Persisted as a pickle in the user cache directory and kept in memory for
+    the rest of the process. A missing, corrupt or read-only cache only costs
+    the speed-up.
+    """
+
+    _instances: dict[Path, "ParseCache"] = {}
+
+    def __init__(self, project_path: Path) -> None:
+        location = hashlib.sha1(str(project_path).encode()).hexdigest()[:12]
+        self.path = user_cache_dir("settings") / f"{location}.pickle"
+        self._entries: dict[str, tuple[FileStamp, ParseResult]] = self._read()
+
+    @classmethod
+    def for_project(cls, project_path: Path) -> "ParseCache":
+        """Return the process-wide cache of *project_path*."""
+        project_path = project_path.resolve()
+        if project_path not in cls._instances:
+            cls._instances[project_path] = cls(project_path)
+        return cls._instances[project_path]
+
+    def _key(self) -> str:
+        return f"{PARSE_CACHE_FORMAT}:{__version__}:{_collector_source_hash()}"
+
+    def _read(self) -> dict[str, tuple[FileStamp, ParseResult]]:
+        try:
+            with self.path.open("rb") as fh:
+                if not _owned_by_current_user(os.fstat(fh.fileno())):
+                    return {}
+                data = pickle.load(fh)
+        except Exception:
+            return {}
+        if not isinstance(data, dict) or data.get("key") != self._key():
+            return {}
+        return data.get("entries", {})
+
+    def _write(self) -> None:
+        payload = {"key": self._key(), "entries": self._entries}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(
+                dir=self.path.parent, prefix=self.path.name, suffix=".tmp"
+            )
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+    def parse(self, files: list[Path]) -> list[ParseResult]:
+        """Return the parse result of every file, re-parsing only changed ones."""
+        stamps = [_file_stamp(f) for f in files]
+        results: list[Optional[ParseResult]] = []
+        stale: list[int] = []
+        for index, (f, stamp) in enumerate(zip(files, stamps)):
+            cached = self._entries.get(str(f))
+            if stamp is not None and cached is not None and cached[0] == stamp:
+                results.append(cached[1])
+            else:
+                results.append(None)
+                stale.append(index)
+
+        dirty = False
+        if stale:
+            parsed = _parse_settings_files([files[i] for i in stale])
+            for index, result in zip(stale, parsed):
+                results[index] = result
+                stamp = stamps[index]
+                if stamp is not None:
+                    self._entries[str(files[index])] = (stamp, result)
+                    dirty = True
+
+        live = {str(f) for f in files}
+        for gone in [p for p in self._entries if p not in live]:
+            del self._entries[gone]
+            dirty = True
+
+        if dirty:
+            self._write()
+        return [r for r in results if r is not None]
+
+
+def _run_generator(registry, installable_name: str, field_name: str) -> str:
+    installable_class = registry.get(installable_name)
+    return field_default(installable_class, "secret_generators")[field_name]()
+
+
 class SettingCollector:
     """
     Discovers all secrets and config vars in a generated Django project by
@@ -251,9 +397,9 @@ class SettingCollector:
         seen_secrets: set[str] = set()
         seen_configs: set[str] = set()
 
-        for settings_file in self._iter_settings_files():
-            secret_fields, config_vars_raw = _parse_settings_file(settings_file)
-
+        files = list(self._iter_settings_files())
+        parsed = ParseCache.for_project(self._project_path).parse(files)
+        for settings_file, (secret_fields, config_vars_raw) in zip(files, parsed):
             for (
                 name,
                 dev_default,
@@ -313,23 +459,21 @@ class SettingCollector:
     def _build_generators_index(self) -> dict[str, Callable[[], str]]:
         """Build a flat mapping of {field_name: generator} from all registered
         installable classes (packages, features, frameworks, database/cache
-        plugins) and core Django secrets."""
+        plugins) and core Django secrets.
+
+        Field names come from the installable manifests; an installable class is
+        only imported when one of its generators is actually called."""
         if self._generators_index is not None:
             return self._generators_index
 
         index: dict[str, Callable[[], str]] = {}
 
-        for registry in REGISTRIES.values():
-            for installable_class in registry.values():
-                field_info = installable_class.model_fields["secret_generators"]
-                if field_info.default_factory is not None:
-                    generators = cast(Callable[[], Any], field_info.default_factory)()
-                elif isinstance(field_info.default, dict):
-                    generators = field_info.default
-                else:
-                    generators = {}
-                if generators:
-                    index.update(generators)
+        for registry in load_registries():
+            for entry in registry.manifest().values():
+                for field_name in entry.secret_generators:
+                    index[field_name] = partial(
+                        _run_generator, registry, entry.name, field_name
+                    )
 
         # Core Django secrets — always present in every generated project.
         from djdevx.utils.generators import generate_random_password
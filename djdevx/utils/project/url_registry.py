@@ -0,0 +1,64 @@
+"""URL registry — the generated list of URL modules the root URLconf imports.
+
+A project's ``urls/__init__.py`` imports the modules listed in
+``urls/registry.py`` in order, instead of walking ``urls/`` on every worker
+boot. djdevx keeps the registry in sync whenever it adds or removes a URL
+module (installable templates, ``ddx create app``); ``ddx urls sync``
+regenerates it after manual changes and ``ddx urls sync --check`` fails when
+it is stale.
+
+The registry lists every ``.py`` module under ``urls/`` except package
+``__init__.py`` files, sorted by dotted module name.
+"""
+
+from pathlib import Path
+
+from .project_structure import ProjectStructure
+
+REGISTRY_HEADER = '''"""Generated by djdevx — do not edit; run `ddx urls sync` after changing urls/."""
+'''
+
+
+def url_modules(structure: ProjectStructure) -> list[str]:
+    """Return the dotted names of every URL module under ``urls/``, sorted."""
+    urls_dir = structure.urls_dir
+    modules = [
+        ".".join(path.relative_to(structure.root).with_suffix("").parts)
+        for path in urls_dir.rglob("*.py")
+        if path.name != "__init__.py" and path != structure.url_registry
+    ]
+    return sorted(modules)
+
+
+def render_registry(modules: list[str]) -> str:
+    """Return the source of ``urls/registry.py`` for *modules*."""
+    if not modules:
+        return f"{REGISTRY_HEADER}\nURL_MODULES: list[str] = []\n"
+    entries = "".join(f'    "{module}",\n' for module in modules)
+    return f"{REGISTRY_HEADER}\nURL_MODULES: list[str] = [\n{entries}]\n"
+
+
+def is_url_registry_current(structure: ProjectStructure) -> bool:
+    """True if ``urls/registry.py`` lists exactly the URL modules on disk."""
+    registry: Path = structure.url_registry
+    if not registry.exists():
+        return False
+    return registry.read_text() == render_registry(url_modules(structure))
+
+
+def sync_url_registry(structure: ProjectStructure, create: bool = False) -> bool:
+    """Rewrite ``urls/registry.py`` if it is stale; return True if it changed.
+
+    Projects created before the registry existed have no ``urls/registry.py``
+    and still discover their URL modules at runtime; they are left alone
+    unless *create* is set.
+    """
+    registry = structure.url_registry
+    if not registry.exists() and not create:
+        return False
+    content = render_registry(url_modules(structure))
+    if registry.exists() and registry.read_text() == content:
+        return False
+    registry.parent.mkdir(parents=True, exist_ok=True)
+    registry.write_text(content)
+    return True
@@ -1,19 +1,30 @@
-"""Pixi-native local dev services (postgres, redis) and provider resolution."""
+"""Pixi-native local dev services (postgres, pgbouncer, redis) and provider resolution."""
 
 from .base import BaseDevService
+from .daemon_client import DaemonClient, DaemonError
+from .pgbouncer import PgBouncerService
 from .postgres import PostgresService
 from .redis import RedisService
 from .resolver import (
     resolve_cache_dev_service,
     resolve_database_dev_service,
     resolve_dev_services,
+    resolve_pgbouncer_dev_service,
 )
+from .scheduler import ServiceScheduler
+from .supervisor import Supervisor
 
 __all__ = [
     "BaseDevService",
+    "DaemonClient",
+    "DaemonError",
+    "PgBouncerService",
     "PostgresService",
     "RedisService",
+    "ServiceScheduler",
+    "Supervisor",
     "resolve_cache_dev_service",
     "resolve_database_dev_service",
     "resolve_dev_services",
+    "resolve_pgbouncer_dev_service",
 ]
@@ -2,18 +2,33 @@
 
 Services run through ``pixi run <binary>`` via :class:`PixiRunner`. Their
 data lives under ``.pixi/devdata/<provider>`` so nothing depends on Docker.
+
+Readiness is checked in-process over the service's wire protocol (see
+``probes.py``); the ``pixi run`` CLI probe is only used when the native probe
+is inconclusive. Starting a service ends with ``wait_until_ready()`` so
+callers never hand a not-yet-listening port to Django.
 """
 
 import os
+import random
 import socket
 import subprocess
+import tempfile
+import time
 from abc import ABC, abstractmethod
+from functools import cached_property
 from pathlib import Path
-from typing import ClassVar, Optional
+from typing import Any, ClassVar, Optional
 
 from ..console.print import print_console
 from ..project.pixi_runner import PixiRunner
 from ..project.project_structure import ProjectStructure
+from ..tracking import ProjectTracking
+
+READY_TIMEOUT = 30.0
+READY_INTERVAL = 0.05
+READY_MAX_INTERVAL = 1.0
+LOG_TAIL_LINES = 20
 
 
 class BaseDevService(ABC):
@@ -26,6 +41,7 @@ class BaseDevService(ABC):
     secret_file_name: ClassVar[str] = ""
     dev_default_password: ClassVar[str] = ""
     port_env_key: ClassVar[str] = ""
+    probe_timeout: ClassVar[float] = 1.0
 
     def __init__(
         self, project_root: Optional[Path] = None, verbose: bool = False
@@ -34,6 +50,16 @@ class BaseDevService(ABC):
         self.runner = PixiRunner(self.structure.root, verbose)
         self.verbose = verbose
 
+    @cached_property
+    def dev_config(self) -> dict[str, Any]:
+        """The ``[dev.<name>]`` table of djdevx.toml (empty if absent)."""
+        return ProjectTracking(self.structure.root).dev_config(self.name)
+
+    @property
+    def host(self) -> str:
+        """Where the service listens; a path means a Unix socket directory."""
+        return "localhost"
+
     @property
     def service_dir(self) -> Path:
         return self.structure.dev_data_dir / self.service_subdir
@@ -42,6 +68,11 @@ class BaseDevService(ABC):
     def data_dir(self) -> Path:
         return self.service_dir / self.data_subdir
 
+    @property
+    def log_file(self) -> Optional[Path]:
+        """Server log shown when the service fails to become ready."""
+        return None
+
     @property
     def _port_file(self) -> Path:
         return self.service_dir / "port"
@@ -53,9 +84,21 @@ class BaseDevService(ABC):
             return int(self._port_file.read_text().strip())
         port = self._generate_port()
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        self._port_file.write_text(str(port))
+        # Temp file + os.replace: a concurrent reader never sees it half-written.
+        fd, tmp = tempfile.mkstemp(dir=self.service_dir, prefix=".port.", suffix=".tmp")
+        with os.fdopen(fd, "w") as fh:
+            fh.write(str(port))
+        os.replace(tmp, self._port_file)
         return port
 
+    def prepare(self) -> None:
+        """Resolve the port files this service shares with others.
+
+        Called on the main thread before ``up()`` runs on a worker thread, so
+        concurrent starts never race to generate the same port file.
+        """
+        self.port
+
     @staticmethod
     def _generate_port() -> int:
         """Ask the OS for a free port."""
@@ -71,26 +114,87 @@ class BaseDevService(ABC):
             return secret_path.read_text().strip()
         return self.dev_default_password
 
-    def _set_port_env(self) -> None:
-        """Set the service port as an environment variable for subprocesses."""
-        if self.port_env_key:
-            os.environ[self.port_env_key] = str(self.port)
-            print_console.step_done(f"Set {self.port_env_key}={self.port}")
+    def connection_env(self) -> dict[str, str]:
+        """Environment variables that point the project's settings at the service."""
+        return {self.port_env_key: str(self.port)} if self.port_env_key else {}
+
+    def export_connection_env(self, env: Optional[dict[str, str]] = None) -> None:
+        """Export *env* (default: :meth:`connection_env`) for subprocesses.
+
+        Call it from the main thread: ``up()`` leaves the environment alone,
+        so services started on worker threads never race on ``os.environ``.
+        """
+        for key, value in (env if env is not None else self.connection_env()).items():
+            os.environ[key] = value
+            print_console.step_done(f"Set {key}={value}")
 
     def run_pixi(self, *args: str) -> subprocess.CompletedProcess:
         return self.runner.run_pixi_command(*args, check=False)
 
     @abstractmethod
-    def up(self) -> None:
-        """Ensure the service is running (idempotent)."""
+    def up(self) -> bool:
+        """Ensure the service is running (idempotent).
+
+        Returns True if this call started it, False if it was already running.
+        Does not export the connection env; see :meth:`export_connection_env`.
+        """
 
     @abstractmethod
     def down(self) -> None:
         """Stop the service if it is running."""
 
+    def _native_probe(self) -> Optional[bool]:
+        """In-process readiness check; ``None`` defers to :meth:`_pixi_probe`."""
+        return None
+
     @abstractmethod
+    def _pixi_probe(self) -> bool:
+        """Readiness check through the service's CLI in the pixi env."""
+
+    def probe(self) -> bool:
+        """Return True if the service accepts connections, without printing."""
+        up = self._native_probe()
+        if up is None:
+            try:
+                up = self._pixi_probe()
+            except OSError:
+                up = False
+        return up
+
+    def wait_until_ready(
+        self, timeout: float = READY_TIMEOUT, interval: float = READY_INTERVAL
+    ) -> None:
+        """Block until :meth:`probe` passes.
+
+        Polls with jittered exponential backoff starting at *interval* and
+        capped at one second. Raises ``RuntimeError`` with the tail of
+        :attr:`log_file` if the service is not ready within *timeout* seconds.
+        """
+        deadline = time.monotonic() + timeout
+        delay = interval
+        while not self.probe():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise RuntimeError(self._not_ready_message(timeout))
+            time.sleep(min(delay * random.uniform(0.5, 1.5), remaining))
+            delay = min(delay * 2, READY_MAX_INTERVAL)
+
+    def _not_ready_message(self, timeout: float) -> str:
+        message = f"{self.display_name} did not become ready within {timeout:g}s"
+        tail = _tail(self.log_file) if self.log_file is not None else []
+        if tail:
+            message += f". Last lines of {self.log_file}:\n" + "\n".join(tail)
+        return message
+
     def is_up(self) -> bool:
         """Return True if the service is currently reachable."""
+        print_console.step(f"Checking if {self.display_name} is running...")
+        up = self.probe()
+        if up:
+            print_console.step_done(f"{self.display_name} is up on port {self.port}")
+        else:
+            print_console.step_done(f"{self.display_name} is not running")
+        return up
 
     @abstractmethod
     def reset(self) -> None:
@@ -98,3 +202,15 @@ class BaseDevService(ABC):
 
     def status(self) -> bool:
         return self.is_up()
+
+
+def _tail(path: Path, lines: int = LOG_TAIL_LINES) -> list[str]:
+    """Return the last *lines* lines of *path* (empty if unreadable)."""
+    try:
+        with path.open("rb") as fh:
+            fh.seek(0, os.SEEK_END)
+            fh.seek(max(0, fh.tell() - 8192))
+            data = fh.read()
+    except OSError:
+        return []
+    return data.decode(errors="replace").splitlines()[-lines:] if lines > 0 else []
@@ -0,0 +1,113 @@
+"""DaemonClient — talk to the ``ddx dev daemon`` supervisor over its Unix socket.
+
+The protocol is newline-delimited JSON, one request per connection::
+
+    → {"command": "status", "params": {}}
+    ← {"ok": true, "result": {...}}
+
+Streaming commands (``logs``) answer with one ``result`` line per event until
+either side closes the connection. Failures answer ``{"ok": false, "error":
+"..."}`` and surface as :class:`DaemonError`. A socket owned by another user
+is never trusted.
+"""
+
+import json
+import os
+import socket
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Optional
+
+from ..project.project_structure import ProjectStructure
+from ..system.runtime_dir import short_socket_path
+
+SOCKET_NAME = "ddx.sock"
+CONNECT_TIMEOUT = 1.0
+
+
+class DaemonError(RuntimeError):
+    """The daemon rejected a request or could not be reached."""
+
+
+def daemon_supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+def socket_path(structure: ProjectStructure) -> Path:
+    """Return the control socket path for the project.
+
+    The socket lives next to the service data in ``.pixi/devdata``; deep
+    project paths that would overflow ``sun_path`` fall back to a private
+    (mode 0700) per-user runtime directory, never a shared temp directory.
+    """
+    return short_socket_path(structure.dev_data_dir / SOCKET_NAME, structure.root)
+
+
+def _check_owner(path: Path) -> None:
+    """Refuse a socket another user created: its replies set our env."""
+    if not hasattr(os, "getuid"):
+        return
+    owner = os.stat(path).st_uid
+    if owner != os.getuid():
+        raise DaemonError(f"{path} is owned by uid {owner}, not the current user")
+
+
+class DaemonClient:
+    """Client for one project's dev daemon."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    @classmethod
+    def connect(cls, project_root: Optional[Path] = None) -> Optional["DaemonClient"]:
+        """Return a client if a daemon answers on the project's socket, else None."""
+        if not daemon_supported():
+            return None
+        path = socket_path(ProjectStructure(project_root))
+        if not path.exists():
+            return None
+        client = cls(path)
+        try:
+            client.call("ping", timeout=CONNECT_TIMEOUT)
+        except (OSError, DaemonError):
+            return None
+        return client
+
+    def _send(self, command: str, params: dict[str, Any], timeout: Optional[float]):
+        _check_owner(self.path)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(timeout)
+            sock.connect(str(self.path))
+            request = {"command": command, "params": params}
+            sock.sendall(json.dumps(request).encode() + b"\n")
+        except BaseException:
+            sock.close()
+            raise
+        return sock
+
+    @staticmethod
+    def _decode(line: bytes) -> Any:
+        try:
+            reply = json.loads(line)
+        except ValueError as e:
+            raise DaemonError(f"Malformed reply from the dev daemon: {line!r}") from e
+        if not reply.get("ok"):
+            raise DaemonError(reply.get("error") or "dev daemon request failed")
+        return reply.get("result")
+
+    def call(self, command: str, timeout: Optional[float] = None, **params: Any) -> Any:
+        """Send *command* and return its result; *timeout* None waits forever."""
+        with self._send(command, params, timeout) as sock:
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+        if not line:
+            raise DaemonError(f"The dev daemon closed the connection on {command!r}")
+        return self._decode(line)
+
+    def stream(self, command: str, **params: Any) -> Iterator[Any]:
+        """Send *command* and yield each result until the daemon closes the stream."""
+        with self._send(command, params, None) as sock:
+            with sock.makefile("rb") as reader:
+                for line in reader:
+                    yield self._decode(line)
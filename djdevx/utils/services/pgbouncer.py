@@ -0,0 +1,194 @@
+"""PgBouncerService — pixi-native PgBouncer in front of the dev PostgreSQL.
+
+``ddx database add postgres`` with PgBouncer enables it in djdevx.toml::
+
+    [dev.pgbouncer]
+    enabled = true
+    pool_mode = "transaction"     # "session", "transaction" (default) or "statement"
+    default_pool_size = 10        # server connections per database/user pair
+    max_client_conn = 50
+
+    [dev.pgbouncer.settings]      # any other pgbouncer.ini parameter, applied last
+    server_idle_timeout = 60
+
+PgBouncer listens on its own port and forwards every database to the dev
+PostgreSQL server. Its connection env points ``POSTGRES_PORT`` at PgBouncer
+and sets ``POSTGRES_CONNECTION=pgbouncer``, so the dev server runs the same
+connection path as production. Migrations in ``ddx dev start``, ``ddx dev
+test`` and the database snapshots still talk to PostgreSQL directly.
+
+``pool_sizes()`` derives the pool sizes from the number of web replicas; the
+devcontainer and the docker-compose deployment use it too.
+"""
+
+import os
+import signal
+from pathlib import Path
+from typing import ClassVar, Optional
+
+from ..console.print import print_console
+from .base import BaseDevService
+from .postgres import PostgresService
+from .probes import postgres_ready
+
+CONF_FILE = "pgbouncer.ini"
+AUTH_FILE = "userlist.txt"
+PID_FILE = "pgbouncer.pid"
+POOL_MODES = ("session", "transaction", "statement")
+DEFAULT_POOL_MODE = "transaction"
+
+# Client connections one web replica may open (server workers x threads),
+# and the server connections PgBouncer keeps open for it. The pool stays
+# under PostgreSQL's default max_connections (100), leaving room for
+# superuser, release and maintenance connections.
+CLIENTS_PER_REPLICA = 50
+SERVER_CONNECTIONS_PER_REPLICA = 5
+MIN_POOL_SIZE = 10
+MAX_POOL_SIZE = 80
+
+# Image for the devcontainer service and the docker-compose sidecar.
+PGBOUNCER_IMAGE = "edoburu/pgbouncer:v1.23.1-p2"
+
+
+def pool_sizes(replicas: int = 1) -> dict[str, int]:
+    """PgBouncer ``max_client_conn`` and ``default_pool_size`` for *replicas*."""
+    replicas = max(1, replicas)
+    return {
+        "max_client_conn": replicas * CLIENTS_PER_REPLICA,
+        "default_pool_size": min(
+            MAX_POOL_SIZE, max(MIN_POOL_SIZE, replicas * SERVER_CONNECTIONS_PER_REPLICA)
+        ),
+    }
+
+
+class PgBouncerService(BaseDevService):
+    """Run PgBouncer natively via ``pgbouncer`` from the pixi env."""
+
+    name: ClassVar[str] = "pgbouncer"
+    display_name: ClassVar[str] = "PgBouncer"
+    service_subdir: ClassVar[str] = "pgbouncer"
+    secret_file_name: ClassVar[str] = "postgres_password"
+    dev_default_password: ClassVar[str] = "password"
+    port_env_key: ClassVar[str] = "POSTGRES_PORT"
+
+    @property
+    def log_file(self) -> Path:
+        return self.service_dir / "pgbouncer.log"
+
+    @property
+    def postgres(self) -> PostgresService:
+        return PostgresService(self.structure.root, self.verbose)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.dev_config.get("enabled", False))
+
+    def prepare(self) -> None:
+        """Also resolve PostgreSQL's port, which pgbouncer.ini points at."""
+        self.postgres.prepare()
+        super().prepare()
+
+    def connection_env(self) -> dict[str, str]:
+        env = super().connection_env()
+        env["POSTGRES_SERVER"] = self.host
+        env["POSTGRES_CONNECTION"] = "pgbouncer"
+        return env
+
+    def server_settings(self) -> dict[str, str]:
+        """The ``[pgbouncer]`` section of pgbouncer.ini."""
+        pool_mode = self.dev_config.get("pool_mode", DEFAULT_POOL_MODE)
+        if pool_mode not in POOL_MODES:
+            raise RuntimeError(
+                f"Unknown [dev.pgbouncer] pool_mode {pool_mode!r}; "
+                f"expected one of {', '.join(POOL_MODES)}"
+            )
+        sizes = pool_sizes()
+        for key in sizes:
+            sizes[key] = self.dev_config.get(key, sizes[key])
+        settings = {
+            "listen_addr": "127.0.0.1",
+            "listen_port": str(self.port),
+            "unix_socket_dir": "",
+            "auth_type": "scram-sha-256",
+            "auth_file": str(self.service_dir / AUTH_FILE),
+            "admin_users": "postgres",
+            "pool_mode": pool_mode,
+            "max_client_conn": str(sizes["max_client_conn"]),
+            "default_pool_size": str(sizes["default_pool_size"]),
+            "ignore_startup_parameters": "extra_float_digits",
+            "logfile": str(self.log_file),
+            "pidfile": str(self.service_dir / PID_FILE),
+        }
+        for key, value in self.dev_config.get("settings", {}).items():
+            settings[key] = (
+                str(value).lower() if isinstance(value, bool) else str(value)
+            )
+        return settings
+
+    def _write_conf(self) -> Path:
+        """Write pgbouncer.ini and the auth file; return the ini path."""
+        postgres = self.postgres
+        lines = [
+            "; Generated by djdevx from [dev.pgbouncer] in djdevx.toml.\n",
+            "[databases]\n",
+            f"* = host={postgres.host} port={postgres.port}\n",
+            "[pgbouncer]\n",
+        ]
+        lines += [f"{key} = {value}\n" for key, value in self.server_settings().items()]
+        conf = self.service_dir / CONF_FILE
+        conf.write_text("".join(lines))
+        auth = self.service_dir / AUTH_FILE
+        escaped = self.password.replace('"', '""')
+        auth.write_text(f'"postgres" "{escaped}"\n')
+        auth.chmod(0o600)
+        return conf
+
+    def _pid(self) -> Optional[int]:
+        try:
+            return int((self.service_dir / PID_FILE).read_text().strip())
+        except (OSError, ValueError):
+            return None
+
+    def _native_probe(self) -> Optional[bool]:
+        return postgres_ready(self.host, self.port, self.probe_timeout)
+
+    def _pixi_probe(self) -> bool:
+        result = self.run_pixi(
+            "run", "pg_isready", "-h", self.host, "-p", str(self.port)
+        )
+        return result.returncode == 0
+
+    def up(self) -> bool:
+        self.service_dir.mkdir(parents=True, exist_ok=True)
+        if self.is_up():
+            print_console.step_done(f"{self.display_name} is already running")
+            return False
+        print_console.step(f"Starting {self.display_name}...")
+        result = self.run_pixi("run", "pgbouncer", "-d", str(self._write_conf()))
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"pgbouncer failed (exit {result.returncode}). "
+                f"Check log: {self.log_file}"
+            )
+        self.wait_until_ready()
+        print_console.ok(f"{self.display_name} started on port {self.port}")
+        return True
+
+    def down(self) -> None:
+        pid = self._pid()
+        if pid is None or not self.is_up():
+            print_console.step_done(
+                f"{self.display_name} is not running, nothing to stop"
+            )
+            return
+        print_console.step(f"Stopping {self.display_name}...")
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+        print_console.ok(f"{self.display_name} stopped")
+
+    def reset(self) -> None:
+        print_console.info(
+            f"{self.display_name} holds no data; reset the database instead"
+        )
@@ -1,10 +1,63 @@
-"""PostgresService — pixi-native local PostgreSQL dev service."""
+"""PostgresService — pixi-native local PostgreSQL dev service.
 
+The server is tuned from ``[dev.postgres]`` in djdevx.toml::
+
+    [dev.postgres]
+    profile = "fast"          # "durable" (default) or "fast"
+    unix_socket_only = true   # no TCP listener; socket in .pixi/devdata
+
+    [dev.postgres.settings]   # any postgresql.conf parameter, applied last
+    shared_buffers = "1GB"
+
+The resulting parameters are written to ``djdevx.conf`` in the data directory,
+which ``postgresql.conf`` includes, on every start. A socket path that would
+overflow ``sun_path`` moves to a private per-user runtime directory.
+
+Snapshots are template databases (``ddx_snapshot_<name>``) cloned from the
+project database (``POSTGRES_DB``); saving and restoring both clone into a
+staging database first and swap it in only once the clone succeeded.
+"""
+
+import os
+import re
+import subprocess
 from pathlib import Path
-from typing import ClassVar
+from typing import ClassVar, Optional
+
+from dotenv import dotenv_values
 
 from ..console.print import print_console
+from ..system.runtime_dir import short_socket_path
 from .base import BaseDevService
+from .probes import postgres_ready
+
+CONF_FILE = "djdevx.conf"
+DEFAULT_PROFILE = "durable"
+DEFAULT_DATABASE = "postgres"
+SNAPSHOT_PREFIX = "ddx_snapshot_"
+DEFAULT_SNAPSHOT = "default"
+RESTORE_STAGING = "ddx_restoring"
+SNAPSHOT_STAGING = "ddx_saving"
+SNAPSHOT_NAME = re.compile(r"^[a-z0-9_]{1,40}$")
+
+# The "fast" profile trades crash safety for speed: a throwaway cluster for
+# test suites and large migrations. An OS crash can corrupt it; purge and
+# re-create it if that happens.
+DEV_PROFILES: dict[str, dict[str, str]] = {
+    "durable": {},
+    "fast": {
+        "fsync": "off",
+        "synchronous_commit": "off",
+        "full_page_writes": "off",
+        "wal_level": "minimal",
+        "max_wal_senders": "0",
+        "max_wal_size": "2GB",
+        "checkpoint_timeout": "30min",
+        "shared_buffers": "256MB",
+        "work_mem": "16MB",
+        "maintenance_work_mem": "256MB",
+    },
+}
 
 
 class PostgresService(BaseDevService):
@@ -16,11 +69,69 @@ class PostgresService(BaseDevService):
     secret_file_name: ClassVar[str] = "postgres_password"
     dev_default_password: ClassVar[str] = "password"
     port_env_key: ClassVar[str] = "POSTGRES_PORT"
+    database_env_key: ClassVar[str] = "POSTGRES_DB"
 
     @property
-    def _log_file(self) -> Path:
+    def log_file(self) -> Path:
         return self.service_dir / "postgres.log"
 
+    @property
+    def unix_socket_only(self) -> bool:
+        return bool(self.dev_config.get("unix_socket_only", False))
+
+    @property
+    def host(self) -> str:
+        if not self.unix_socket_only:
+            return "localhost"
+        socket_file = self.service_dir / f".s.PGSQL.{self.port}"
+        return str(short_socket_path(socket_file, self.structure.root).parent)
+
+    def connection_env(self) -> dict[str, str]:
+        env = super().connection_env()
+        if self.unix_socket_only:
+            env["POSTGRES_SERVER"] = self.host
+        return env
+
+    def server_settings(self) -> dict[str, str]:
+        """postgresql.conf parameters for the configured dev profile."""
+        profile = self.dev_config.get("profile", DEFAULT_PROFILE)
+        if profile not in DEV_PROFILES:
+            raise RuntimeError(
+                f"Unknown [dev.postgres] profile {profile!r}; "
+                f"expected one of {', '.join(DEV_PROFILES)}"
+            )
+        settings = dict(DEV_PROFILES[profile])
+        if self.unix_socket_only:
+            settings["listen_addresses"] = ""
+            settings["unix_socket_directories"] = self.host
+        for key, value in self.dev_config.get("settings", {}).items():
+            settings[key] = (
+                str(value).lower() if isinstance(value, bool) else str(value)
+            )
+        return settings
+
+    @property
+    def database(self) -> str:
+        """The project database (``POSTGRES_DB`` from the env or ``.env``)."""
+        name = os.environ.get(self.database_env_key)
+        if not name:
+            dot_env = dotenv_values(self.structure.root / ".env")
+            name = dot_env.get(self.database_env_key)
+        return name or DEFAULT_DATABASE
+
+    def _write_conf(self) -> None:
+        """Write the profile to ``djdevx.conf`` and include it from postgresql.conf."""
+        lines = ["# Generated by djdevx from [dev.postgres] in djdevx.toml.\n"]
+        for key, value in self.server_settings().items():
+            escaped = value.replace("'", "''")
+            lines.append(f"{key} = '{escaped}'\n")
+        (self.data_dir / CONF_FILE).write_text("".join(lines))
+        conf = self.data_dir / "postgresql.conf"
+        include = f"include_if_exists = '{CONF_FILE}'"
+        if conf.exists() and include not in conf.read_text():
+            with conf.open("a") as fh:
+                fh.write(f"\n{include}\n")
+
     @property
     def _pwfile(self) -> Path:
         return self.service_dir / "postgres_pwfile"
@@ -29,31 +140,25 @@ class PostgresService(BaseDevService):
     def _initialized(self) -> bool:
         return (self.data_dir / "PG_VERSION").exists()
 
-    def is_up(self) -> bool:
-        print_console.step(f"Checking if {self.display_name} is running...")
-        try:
-            result = self.run_pixi(
-                "run", "pg_isready", "-h", "localhost", "-p", str(self.port)
-            )
-        except OSError:
-            print_console.step_done(f"{self.display_name} is not running")
-            return False
-        up = result.returncode == 0
-        if up:
-            print_console.step_done(f"{self.display_name} is up on port {self.port}")
-        else:
-            print_console.step_done(f"{self.display_name} is not running")
-        return up
+    def _native_probe(self) -> Optional[bool]:
+        return postgres_ready(self.host, self.port, self.probe_timeout)
+
+    def _pixi_probe(self) -> bool:
+        result = self.run_pixi(
+            "run", "pg_isready", "-h", self.host, "-p", str(self.port)
+        )
+        return result.returncode == 0
 
-    def up(self) -> None:
+    def up(self) -> bool:
         self.structure.dev_data_dir.mkdir(parents=True, exist_ok=True)
         if not self._initialized:
             self._init_db()
-        if not self.is_up():
+        started = not self.is_up()
+        if started:
             self._start()
         else:
             print_console.step_done(f"{self.display_name} is already running")
-        self._set_port_env()
+        return started
 
     def down(self) -> None:
         if not self.is_up():
@@ -66,10 +171,119 @@ class PostgresService(BaseDevService):
         print_console.ok(f"{self.display_name} stopped")
 
     def reset(self) -> None:
+        """Restore the default snapshot if there is one, else flush all tables."""
+        if DEFAULT_SNAPSHOT in self.snapshots():
+            self.restore(DEFAULT_SNAPSHOT)
+            return
         print_console.step(f"Flushing {self.display_name} data...")
         self.runner.run_manage_command("flush", "--noinput", check=False)
         print_console.ok(f"{self.display_name} data flushed")
 
+    # ── Snapshots ──────────────────────────────────────────────────────────
+
+    def _psql(self, *statements: str) -> subprocess.CompletedProcess:
+        """Run each statement with psql (connected to ``template1``) in the pixi env."""
+        args = ["run", "psql", "-X", "-q", "-A", "-t", "-v", "ON_ERROR_STOP=1"]
+        args += ["-h", self.host, "-p", str(self.port), "-U", "postgres"]
+        args += ["-d", "template1"]
+        for statement in statements:
+            args += ["-c", statement]
+        result = self.runner.run_pixi_command(
+            *args,
+            check=False,
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PGPASSWORD": self.password},
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"psql failed: {result.stderr.strip()}")
+        return result
+
+    @staticmethod
+    def _snapshot_db(name: str) -> str:
+        if not SNAPSHOT_NAME.match(name):
+            raise RuntimeError(
+                f"Invalid snapshot name {name!r}: use lowercase letters, digits "
+                "and underscores (at most 40)"
+            )
+        return SNAPSHOT_PREFIX + name
+
+    def databases(self) -> set[str]:
+        """Return the names of every database in the cluster."""
+        result = self._psql("SELECT datname FROM pg_database")
+        return {line for line in result.stdout.splitlines() if line.strip()}
+
+    def create_database(self, name: str) -> None:
+        self._psql(f"CREATE DATABASE {_ident(name)}")
+
+    def clone_databases(self, template: str, names: list[str]) -> None:
+        """(Re)create each of *names* as a copy of *template*."""
+        statements = []
+        for name in names:
+            statements += [
+                f"DROP DATABASE IF EXISTS {_ident(name)} WITH (FORCE)",
+                f"CREATE DATABASE {_ident(name)} TEMPLATE {_ident(template)}",
+            ]
+        self._psql(*statements)
+
+    def snapshots(self) -> list[str]:
+        """Return the names of the existing snapshots, sorted."""
+        return sorted(
+            name.removeprefix(SNAPSHOT_PREFIX)
+            for name in self.databases()
+            if name.startswith(SNAPSHOT_PREFIX)
+        )
+
+    def snapshot(self, name: str = DEFAULT_SNAPSHOT) -> None:
+        """Save the project database as template snapshot *name*, replacing it.
+
+        Open connections to the project database are terminated first, since
+        PostgreSQL only clones a database nobody is connected to. The clone
+        goes to a staging database, so a failed clone keeps the old snapshot.
+        """
+        snapshot_db = self._snapshot_db(name)
+        print_console.step(f"Saving {self.display_name} snapshot {name!r}...")
+        staging = _ident(SNAPSHOT_STAGING)
+        statements = [
+            "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+            f"WHERE datname = {_literal(self.database)} AND pid <> pg_backend_pid()",
+            f"DROP DATABASE IF EXISTS {staging}",
+            f"CREATE DATABASE {staging} TEMPLATE {_ident(self.database)}",
+        ]
+        if name in self.snapshots():
+            statements += _drop_template(snapshot_db)
+        statements += [
+            f"ALTER DATABASE {staging} RENAME TO {_ident(snapshot_db)}",
+            f"ALTER DATABASE {_ident(snapshot_db)} "
+            "WITH IS_TEMPLATE true ALLOW_CONNECTIONS false",
+        ]
+        self._psql(*statements)
+        print_console.ok(f"Snapshot {name!r} saved")
+
+    def restore(self, name: str = DEFAULT_SNAPSHOT) -> None:
+        """Replace the project database with a clone of snapshot *name*."""
+        snapshot_db = self._snapshot_db(name)
+        if name not in self.snapshots():
+            raise RuntimeError(f"No {self.display_name} snapshot named {name!r}")
+        print_console.step(f"Restoring {self.display_name} snapshot {name!r}...")
+        # Clone first so a failed clone leaves the project database intact.
+        staging = _ident(RESTORE_STAGING)
+        self._psql(
+            f"DROP DATABASE IF EXISTS {staging}",
+            f"CREATE DATABASE {staging} TEMPLATE {_ident(snapshot_db)}",
+            f"DROP DATABASE IF EXISTS {_ident(self.database)} WITH (FORCE)",
+            f"ALTER DATABASE {staging} RENAME TO {_ident(self.database)}",
+        )
+        print_console.ok(f"Snapshot {name!r} restored")
+
+    def drop_snapshot(self, name: str) -> None:
+        """Delete snapshot *name*."""
+        snapshot_db = self._snapshot_db(name)
+        if name not in self.snapshots():
+            raise RuntimeError(f"No {self.display_name} snapshot named {name!r}")
+        self._psql(*_drop_template(snapshot_db))
+        print_console.ok(f"Snapshot {name!r} deleted")
+
     def _init_db(self) -> None:
         print_console.step(f"Initializing {self.display_name} data directory...")
         self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -98,13 +312,14 @@ class PostgresService(BaseDevService):
     def _start(self) -> None:
         print_console.step(f"Starting {self.display_name} server...")
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self._write_conf()
         result = self.run_pixi(
             "run",
             "pg_ctl",
             "-D",
             str(self.data_dir),
             "-l",
-            str(self._log_file),
+            str(self.log_file),
             "-o",
             f"-p {self.port}",
             "start",
@@ -112,6 +327,24 @@ class PostgresService(BaseDevService):
         if result.returncode != 0:
             raise RuntimeError(
                 f"pg_ctl start failed (exit {result.returncode}). "
-                f"Check log: {self._log_file}"
+                f"Check log: {self.log_file}"
             )
+        self.wait_until_ready()
         print_console.ok(f"{self.display_name} server started on port {self.port}")
+
+
+def _ident(name: str) -> str:
+    """Quote an SQL identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _literal(value: str) -> str:
+    """Quote an SQL string literal."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _drop_template(database: str) -> list[str]:
+    return [
+        f"ALTER DATABASE {_ident(database)} WITH IS_TEMPLATE false",
+        f"DROP DATABASE {_ident(database)}",
+    ]
@@ -0,0 +1,111 @@
+"""Readiness probes — in-process wire-protocol checks for dev services.
+
+Each probe opens a connection with a timeout and speaks just enough of the
+service's protocol to tell whether it accepts clients. A probe returns True or
+False when it reached a conclusion and None when the reply was unexpected, so
+the caller can fall back to the service's own CLI in the pixi env.
+"""
+
+import socket
+import struct
+from typing import Optional, Union
+
+# PostgreSQL frontend/backend protocol constants.
+SSL_REQUEST_CODE = 80877103
+PROTOCOL_VERSION_3 = 3 << 16
+CANNOT_CONNECT_NOW = b"57P03"  # starting up, shutting down or in recovery
+MAX_MESSAGE_LENGTH = 1 << 16
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("connection closed by server")
+        data += chunk
+    return data
+
+
+def _connect(address: Union[str, tuple[str, int]], timeout: float) -> socket.socket:
+    """Connect to a ``(host, port)`` over TCP or to a Unix socket path."""
+    if not isinstance(address, str):
+        return socket.create_connection(address, timeout=timeout)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(address)
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+def _sqlstate(error_fields: bytes) -> Optional[bytes]:
+    """Return the SQLSTATE (``C`` field) of an ErrorResponse body."""
+    for error_field in error_fields.split(b"\0"):
+        if error_field[:1] == b"C":
+            return error_field[1:]
+    return None
+
+
+def postgres_ready(host: str, port: int, timeout: float = 1.0) -> Optional[bool]:
+    """Probe PostgreSQL the way ``pg_isready`` does.
+
+    Sends an SSLRequest, then a StartupMessage for ``postgres``. An
+    authentication request — or any error other than "cannot connect now" —
+    means the server accepts connections. As with libpq, a *host* starting
+    with ``/`` is the directory holding the server's Unix socket.
+    """
+    params = b"user\0postgres\0database\0postgres\0\0"
+    address = f"{host}/.s.PGSQL.{port}" if host.startswith("/") else (host, port)
+    try:
+        with _connect(address, timeout) as sock:
+            sock.sendall(struct.pack("!ii", 8, SSL_REQUEST_CODE))
+            if _recv_exact(sock, 1) != b"N":
+                return None  # TLS-only server or unknown reply — defer to pg_isready
+            sock.sendall(
+                struct.pack("!ii", 8 + len(params), PROTOCOL_VERSION_3) + params
+            )
+            kind, length = struct.unpack("!ci", _recv_exact(sock, 5))
+            if kind == b"R":
+                return True
+            if kind != b"E" or not 4 <= length <= MAX_MESSAGE_LENGTH:
+                return None
+            return _sqlstate(_recv_exact(sock, length - 4)) != CANNOT_CONNECT_NOW
+    except OSError:
+        return False
+
+
+def _resp_command(*args: str) -> bytes:
+    """Encode *args* as a RESP array of bulk strings."""
+    parts = [f"*{len(args)}\r\n".encode()]
+    for arg in args:
+        data = arg.encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+def redis_ready(
+    host: str, port: int, password: str = "", timeout: float = 1.0
+) -> Optional[bool]:
+    """Probe Redis with a pipelined ``AUTH`` + ``PING``; ready means ``+PONG``.
+
+    A *host* starting with ``/`` is the path of the server's Unix socket.
+    """
+    commands = [_resp_command("AUTH", password)] if password else []
+    commands.append(_resp_command("PING"))
+    address = host if host.startswith("/") else (host, port)
+    try:
+        with _connect(address, timeout) as sock:
+            sock.sendall(b"".join(commands))
+            with sock.makefile("rb") as reader:
+                replies = [reader.readline() for _ in commands]
+    except OSError:
+        return False
+    reply = replies[-1]
+    if reply.startswith(b"+PONG"):
+        return True
+    if not reply or reply.startswith(b"-"):
+        return False  # closed, NOAUTH, WRONGPASS, LOADING, ...
+    return None
@@ -1,9 +1,42 @@
-"""RedisService — pixi-native local Redis dev service."""
+"""RedisService — pixi-native local Redis dev service.
 
-from typing import ClassVar
+Persistence and memory limits come from ``[dev.redis]`` in djdevx.toml::
+
+    [dev.redis]
+    persistence = "none"              # "none" (default), "rdb" or "aof"
+    maxmemory = "256mb"               # "0" for no limit
+    maxmemory_policy = "allkeys-lru"
+    unix_socket = true                # also listen on .pixi/devdata/redis/redis.sock
+
+The default is a capped, non-persistent LRU cache, the way the production
+cache is meant to behave: nothing is written to disk and the oldest keys are
+evicted instead of growing without bound. With ``unix_socket`` the socket
+path is exported as ``REDIS_SOCKET`` next to ``REDIS_PORT``, and the
+generated cache and channels settings connect through ``unix://`` instead of
+TCP. A socket path that would overflow ``sun_path`` moves to a private
+per-user runtime directory.
+"""
+
+from pathlib import Path
+from typing import ClassVar, Optional
 
 from ..console.print import print_console
+from ..system.runtime_dir import short_socket_path
 from .base import BaseDevService
+from .probes import redis_ready
+
+SOCKET_FILE = "redis.sock"
+DEFAULT_PERSISTENCE = "none"
+DEFAULT_MAXMEMORY = "256mb"
+DEFAULT_MAXMEMORY_POLICY = "allkeys-lru"
+
+# redis-server arguments for each persistence mode. An empty ``--save``
+# disables RDB snapshots; "rdb" uses Redis's own default save points.
+PERSISTENCE_MODES: dict[str, dict[str, str]] = {
+    "none": {"save": "", "appendonly": "no"},
+    "rdb": {"save": "3600 1 300 100 60 10000", "appendonly": "no"},
+    "aof": {"save": "", "appendonly": "yes", "appendfsync": "everysec"},
+}
 
 
 class RedisService(BaseDevService):
@@ -16,40 +49,76 @@ class RedisService(BaseDevService):
     secret_file_name: ClassVar[str] = "redis_password"
     dev_default_password: ClassVar[str] = "redis_password"
     port_env_key: ClassVar[str] = "REDIS_PORT"
+    socket_env_key: ClassVar[str] = "REDIS_SOCKET"
+
+    @property
+    def log_file(self) -> Path:
+        return self.service_dir / "redis.log"
 
-    def is_up(self) -> bool:
-        print_console.step(f"Checking if {self.display_name} is running...")
-        try:
-            result = self.run_pixi(
-                "run",
-                "redis-cli",
-                "-p",
-                str(self.port),
-                "-a",
-                self.password,
-                "ping",
+    @property
+    def unix_socket(self) -> Optional[Path]:
+        """The Unix socket Redis listens on besides its port, if enabled."""
+        if not self.dev_config.get("unix_socket", False):
+            return None
+        return short_socket_path(self.service_dir / SOCKET_FILE, self.structure.root)
+
+    def connection_env(self) -> dict[str, str]:
+        env = super().connection_env()
+        if self.unix_socket is not None:
+            env[self.socket_env_key] = str(self.unix_socket)
+        return env
+
+    def server_settings(self) -> dict[str, str]:
+        """redis-server configuration for the persistence mode and memory cap."""
+        mode = self.dev_config.get("persistence", DEFAULT_PERSISTENCE)
+        if mode not in PERSISTENCE_MODES:
+            raise RuntimeError(
+                f"Unknown [dev.redis] persistence {mode!r}; "
+                f"expected one of {', '.join(PERSISTENCE_MODES)}"
             )
-        except OSError:
-            print_console.step_done(f"{self.display_name} is not running")
-            return False
+        settings = {
+            **PERSISTENCE_MODES[mode],
+            "maxmemory": str(self.dev_config.get("maxmemory", DEFAULT_MAXMEMORY)),
+            "maxmemory-policy": str(
+                self.dev_config.get("maxmemory_policy", DEFAULT_MAXMEMORY_POLICY)
+            ),
+        }
+        if self.unix_socket is not None:
+            settings["unixsocket"] = str(self.unix_socket)
+            settings["unixsocketperm"] = "700"
+        return settings
+
+    def _native_probe(self) -> Optional[bool]:
+        host = str(self.unix_socket) if self.unix_socket is not None else self.host
+        return redis_ready(host, self.port, self.password, self.probe_timeout)
+
+    def _pixi_probe(self) -> bool:
+        result = self.run_pixi(
+            "run",
+            "redis-cli",
+            "-p",
+            str(self.port),
+            "-a",
+            self.password,
+            "ping",
+        )
         stdout = (
             result.stdout.decode()
             if isinstance(result.stdout, bytes)
             else (result.stdout or "")
         )
-        up = result.returncode == 0 and "PONG" in stdout
-        if up:
-            print_console.step_done(f"{self.display_name} is up on port {self.port}")
-        else:
-            print_console.step_done(f"{self.display_name} is not running")
-        return up
-
-    def up(self) -> None:
+        return result.returncode == 0 and "PONG" in stdout
+
+    def up(self) -> bool:
         self.data_dir.mkdir(parents=True, exist_ok=True)
         if self.is_up():
             print_console.step_done(f"{self.display_name} is already running")
-            self._set_port_env()
-            return
+            return False
+        settings = [
+            arg
+            for key, value in self.server_settings().items()
+            for arg in (f"--{key}", value)
+        ]
         print_console.step(f"Starting {self.display_name}...")
         result = self.run_pixi(
             "run",
@@ -60,18 +129,20 @@ class RedisService(BaseDevService):
             self.password,
             "--dir",
             str(self.data_dir),
+            "--logfile",
+            str(self.log_file),
             "--daemonize",
             "yes",
-            "--appendonly",
-            "yes",
+            *settings,
         )
         if result.returncode != 0:
             raise RuntimeError(
                 f"redis-server failed (exit {result.returncode}): "
                 f"{result.stderr.decode().strip()}"
             )
+        self.wait_until_ready()
         print_console.ok(f"{self.display_name} started on port {self.port}")
-        self._set_port_env()
+        return True
 
     def down(self) -> None:
         if not self.is_up():
@@ -5,6 +5,7 @@ from typing import Optional
 
 from ..tracking import ProjectTracking, Section
 from .base import BaseDevService
+from .pgbouncer import PgBouncerService
 from .postgres import PostgresService
 from .redis import RedisService
 
@@ -44,15 +45,30 @@ def resolve_cache_dev_service(
     return _resolve_service(name, CACHE_DEV_SERVICES, project_root, verbose)
 
 
+def resolve_pgbouncer_dev_service(
+    project_root: Optional[Path] = None, verbose: bool = False
+) -> Optional[BaseDevService]:
+    """Return the PgBouncer dev service if it is enabled for postgres, or None."""
+    if ProjectTracking(project_root).installed(Section.DATABASE) != "postgres":
+        return None
+    service = PgBouncerService(project_root=project_root, verbose=verbose)
+    return service if service.enabled else None
+
+
 def resolve_dev_services(
     project_root: Optional[Path] = None, verbose: bool = False
 ) -> list[BaseDevService]:
-    """Return the installed database and cache dev services (None-filtered)."""
+    """Return the installed database, cache and pooler dev services (None-filtered).
+
+    PgBouncer comes last: its connection env replaces the database's, so
+    Django connects through it once everything is up.
+    """
     return [
         s
         for s in (
             resolve_database_dev_service(project_root, verbose),
             resolve_cache_dev_service(project_root, verbose),
+            resolve_pgbouncer_dev_service(project_root, verbose),
         )
         if s is not None
     ]
@@ -0,0 +1,87 @@
+"""ServiceScheduler — start dev services concurrently and wait on readiness."""
+
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+from .base import BaseDevService
+
+
+def _bring_up(service: BaseDevService) -> tuple[bool, dict[str, str]]:
+    """Start *service* unless it is running; ``up()`` returns once it is ready.
+
+    ``up()`` probes the service itself, so there is no separate ``is_up()``
+    round-trip. Returns whether this call started the service, and its
+    connection env for the caller to export.
+    """
+    started = service.up()
+    return started, service.connection_env()
+
+
+class ServiceScheduler:
+    """Bring up every service at once; callers wait only on what they need.
+
+    Each service is started on its own worker thread (the work is waiting on
+    subprocesses and sockets, and ``up()`` waits until the service is ready),
+    so a cold start takes as long as the slowest service rather than the sum.
+    ``wait(service)`` blocks until that service is ready and re-raises its
+    startup error; leaving the ``with`` block waits for the rest.
+
+    Workers only return each service's connection env; it is exported on the
+    calling thread the first time the service is waited on, so ``os.environ``
+    is never written concurrently and services whose env overlaps (PgBouncer
+    in front of PostgreSQL) end up in the order they were given. Port files
+    are resolved up front on the calling thread (``prepare()``), so PgBouncer
+    and PostgreSQL agree on PostgreSQL's port on a cold start.
+
+    Usage::
+
+        with ServiceScheduler([db, cache]) as scheduler:
+            scheduler.wait(db)      # cache keeps starting meanwhile
+            run_migrations()
+        # every service is ready here
+    """
+
+    def __init__(self, services: Sequence[BaseDevService]) -> None:
+        self.services = list(services)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: dict[BaseDevService, Future[tuple[bool, dict[str, str]]]] = {}
+        self._exported: set[BaseDevService] = set()
+
+    def __enter__(self) -> "ServiceScheduler":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self.wait_all()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def start(self) -> None:
+        """Submit every service for startup (idempotent)."""
+        if self._executor is not None or not self.services:
+            return
+        for service in self.services:
+            service.prepare()
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self.services), thread_name_prefix="ddx-service"
+        )
+        for service in self.services:
+            self._futures[service] = self._executor.submit(_bring_up, service)
+
+    def wait(self, service: BaseDevService) -> bool:
+        """Block until *service* is ready; True if this run started it."""
+        self.start()
+        started, env = self._futures[service].result()
+        if service not in self._exported:
+            service.export_connection_env(env)
+            self._exported.add(service)
+        return started
+
+    def wait_all(self) -> dict[BaseDevService, bool]:
+        """Wait for every service, in the order they were given."""
+        return {service: self.wait(service) for service in self.services}
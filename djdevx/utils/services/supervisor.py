@@ -0,0 +1,268 @@
+"""Supervisor — the optional ``ddx dev daemon`` process that owns the dev services.
+
+While it runs, the supervisor:
+
+* keeps every service it brought up running, restarting any that stop
+  answering their readiness probe,
+* serves a control API on a Unix socket (see ``daemon_client.py``) so
+  ``ddx dev up/down/status/start`` become quick requests instead of
+  per-command probing,
+* streams the services' log files as one aggregated feed.
+
+The services themselves stay daemonized (``pg_ctl``, ``redis-server
+--daemonize``): stopping the supervisor ends supervision, not the services.
+"""
+
+import json
+import os
+import signal
+import socketserver
+import threading
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any, Optional
+
+from ... import __version__
+from ..console.print import print_console
+from .base import LOG_TAIL_LINES, BaseDevService, _tail
+from .daemon_client import CONNECT_TIMEOUT, DaemonClient, DaemonError
+from .scheduler import ServiceScheduler
+
+MONITOR_INTERVAL = 2.0
+LOG_POLL_INTERVAL = 0.2
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _read_new_lines(path: Path, offset: int) -> tuple[list[str], int]:
+    """Return the whole lines appended to *path* after *offset*, and the new offset."""
+    try:
+        with path.open("rb") as fh:
+            fh.seek(0, os.SEEK_END)
+            if fh.tell() < offset:
+                offset = 0  # truncated or replaced
+            fh.seek(offset)
+            data = fh.read()
+    except OSError:
+        return [], 0
+    end = data.rfind(b"\n") + 1
+    return data[:end].decode(errors="replace").splitlines(), offset + end
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: "_ControlServer"
+
+    def _reply(self, reply: dict[str, Any]) -> None:
+        self.wfile.write(json.dumps(reply).encode() + b"\n")
+        self.wfile.flush()
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+            result = self.server.supervisor.dispatch(
+                request["command"], request.get("params") or {}
+            )
+            if isinstance(result, Iterator):
+                for item in result:
+                    self._reply({"ok": True, "result": item})
+            else:
+                self._reply({"ok": True, "result": result})
+        except (BrokenPipeError, ConnectionResetError):
+            return  # client went away
+        except Exception as e:
+            try:
+                self._reply({"ok": False, "error": str(e) or type(e).__name__})
+            except OSError:
+                pass
+
+
+class _ControlServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: Path, supervisor: "Supervisor") -> None:
+        self.supervisor = supervisor
+        super().__init__(str(path), _Handler)
+
+
+class Supervisor:
+    """Own a set of dev services and serve the daemon control API.
+
+    ``up``/``down``/``check_services`` are serialized by one lock so a crash
+    restart never races a requested stop; ``status`` and ``logs`` only read.
+    """
+
+    def __init__(
+        self,
+        services: Sequence[BaseDevService],
+        path: Path,
+        monitor_interval: float = MONITOR_INTERVAL,
+    ) -> None:
+        self.services = {service.name: service for service in services}
+        self.path = path
+        self.monitor_interval = monitor_interval
+        self.supervised: set[str] = set()
+        self.restarts = {name: 0 for name in self.services}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._server: Optional[_ControlServer] = None
+
+    # ── Commands ───────────────────────────────────────────────────────────
+
+    def dispatch(self, command: str, params: dict[str, Any]) -> Any:
+        """Run the control command *command*; the reply must be JSON-serializable."""
+        handlers = {
+            "ping": self.ping,
+            "status": self.status,
+            "up": self.up,
+            "down": self.down,
+            "logs": self.logs,
+            "shutdown": self.shutdown,
+        }
+        handler = handlers.get(command)
+        if handler is None:
+            raise DaemonError(f"Unknown dev daemon command {command!r}")
+        return handler(**params)
+
+    def _select(self, names: Optional[Sequence[str]]) -> list[BaseDevService]:
+        if names is None:
+            return list(self.services.values())
+        unknown = sorted(set(names) - set(self.services))
+        if unknown:
+            raise DaemonError(f"The dev daemon has no service {', '.join(unknown)}")
+        return [s for name, s in self.services.items() if name in names]
+
+    def _describe(self, service: BaseDevService, **state: Any) -> dict[str, Any]:
+        return {
+            "name": service.name,
+            "display_name": service.display_name,
+            "port": service.port,
+            "env": service.connection_env(),
+            "supervised": service.name in self.supervised,
+            "restarts": self.restarts[service.name],
+            **state,
+        }
+
+    def ping(self) -> dict[str, Any]:
+        return {"pid": os.getpid(), "version": __version__}
+
+    def status(self) -> dict[str, Any]:
+        services = [self._describe(s, up=s.probe()) for s in self.services.values()]
+        return {**self.ping(), "services": services}
+
+    def up(self, services: Optional[Sequence[str]] = None) -> list[dict[str, Any]]:
+        """Start the selected services concurrently and supervise them."""
+        selected = self._select(services)
+        with self._lock:
+            with ServiceScheduler(selected) as scheduler:
+                started = scheduler.wait_all()
+            self.supervised.update(s.name for s in selected)
+        return [self._describe(s, up=True, started=started[s]) for s in selected]
+
+    def down(self, services: Optional[Sequence[str]] = None) -> list[dict[str, Any]]:
+        """Stop supervising the selected services and stop them."""
+        selected = self._select(services)
+        stopped = {}
+        with self._lock:
+            self.supervised.difference_update(s.name for s in selected)
+            for service in selected:
+                stopped[service] = service.probe()
+                if stopped[service]:
+                    service.down()
+        return [self._describe(s, up=False, stopped=stopped[s]) for s in selected]
+
+    def logs(
+        self, follow: bool = False, lines: int = LOG_TAIL_LINES
+    ) -> Iterator[dict[str, str]]:
+        """Yield the last *lines* of every service log, then new lines if *follow*."""
+        files = {
+            name: service.log_file
+            for name, service in self.services.items()
+            if service.log_file is not None
+        }
+        offsets = {}
+        for name, path in files.items():
+            offsets[name] = _file_size(path)
+            for line in _tail(path, lines):
+                yield {"service": name, "line": line}
+        while follow and not self._stop.is_set():
+            for name, path in files.items():
+                new_lines, offsets[name] = _read_new_lines(path, offsets[name])
+                for line in new_lines:
+                    yield {"service": name, "line": line}
+            self._stop.wait(LOG_POLL_INTERVAL)
+
+    def shutdown(self) -> dict[str, Any]:
+        """Stop supervising; the services keep running."""
+        self._stop.set()
+        return self.ping()
+
+    # ── Supervision ────────────────────────────────────────────────────────
+
+    def check_services(self) -> None:
+        """Restart every supervised service that stopped answering its probe."""
+        with self._lock:
+            for name, service in self.services.items():
+                if name not in self.supervised or service.probe():
+                    continue
+                self.restarts[name] += 1
+                print_console.warning(f"{service.display_name} is down, restarting...")
+                try:
+                    service.up()
+                except Exception as e:
+                    print_console.fail(f"Restarting {service.display_name} failed: {e}")
+
+    def _bind(self) -> None:
+        if self.path.exists():
+            try:
+                running = DaemonClient(self.path).call("ping", timeout=CONNECT_TIMEOUT)
+            except (OSError, DaemonError):
+                self.path.unlink(missing_ok=True)  # stale socket from a dead daemon
+            else:
+                raise DaemonError(
+                    f"A dev daemon is already running (pid {running['pid']})"
+                )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Created 0600 by bind() itself; a chmod afterwards would leave a window.
+        umask = os.umask(0o177)
+        try:
+            self._server = _ControlServer(self.path, self)
+        finally:
+            os.umask(umask)
+
+    def serve(self, bring_up: bool = True) -> None:
+        """Serve the control socket and supervise until :meth:`shutdown`.
+
+        With *bring_up*, every service is started first; a failed start is
+        reported and left for a later ``up`` request instead of ending the
+        daemon. Runs the monitor loop on the calling thread.
+        """
+        self._bind()
+        assert self._server is not None
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda *_: self._stop.set())
+        thread = threading.Thread(
+            target=self._server.serve_forever, name="ddx-daemon", daemon=True
+        )
+        thread.start()
+        print_console.ok(f"Dev daemon listening on {self.path} (pid {os.getpid()})")
+        try:
+            if bring_up:
+                try:
+                    self.up()
+                except Exception as e:
+                    print_console.fail(f"Starting dev services failed: {e}")
+            while not self._stop.wait(self.monitor_interval):
+                self.check_services()
+        finally:
+            self._server.shutdown()
+            self._server.server_close()
+            self.path.unlink(missing_ok=True)
+            print_console.ok("Dev daemon stopped")
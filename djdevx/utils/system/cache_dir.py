@@ -0,0 +1,23 @@
+"""Per-user cache directory for data djdevx can always rebuild."""
+
+import os
+import sys
+from pathlib import Path
+
+
+def user_cache_dir(*parts: str) -> Path:
+    """Return ``<cache root>/djdevx/<parts...>`` without creating it.
+
+    ``DJDEVX_CACHE_DIR`` overrides the root; otherwise ``XDG_CACHE_HOME`` (or
+    ``~/Library/Caches`` on macOS, ``~/.cache`` elsewhere) is used.
+    """
+    override = os.environ.get("DJDEVX_CACHE_DIR")
+    if override:
+        root = Path(override)
+    elif os.environ.get("XDG_CACHE_HOME"):
+        root = Path(os.environ["XDG_CACHE_HOME"]) / "djdevx"
+    elif sys.platform == "darwin":
+        root = Path.home() / "Library" / "Caches" / "djdevx"
+    else:
+        root = Path.home() / ".cache" / "djdevx"
+    return root.joinpath(*parts)
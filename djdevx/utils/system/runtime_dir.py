@@ -0,0 +1,48 @@
+"""Private per-user directory for Unix sockets, and the ``sun_path`` limit."""
+
+import hashlib
+import os
+from pathlib import Path
+
+from .cache_dir import user_cache_dir
+
+# sun_path is 104 bytes on macOS and 108 on Linux, including the NUL.
+MAX_SOCKET_PATH = 100
+
+
+def user_runtime_dir(*parts: str) -> Path:
+    """Return ``<runtime root>/<parts...>``, created with mode 0700.
+
+    ``XDG_RUNTIME_DIR/djdevx`` is used when set, otherwise ``run`` under the
+    user cache directory. A directory owned by another user is refused.
+    """
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    root = Path(runtime) / "djdevx" if runtime else user_cache_dir("run")
+    path = root.joinpath(*parts)
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if hasattr(os, "getuid") and path.stat().st_uid != os.getuid():
+        raise RuntimeError(f"{path} is owned by another user")
+    path.chmod(0o700)
+    return path
+
+
+def fits_socket_path(path: Path) -> bool:
+    return len(os.fsencode(path)) <= MAX_SOCKET_PATH
+
+
+def short_socket_path(path: Path, project_root: Path) -> Path:
+    """Return *path*, or the same file name in a private per-project directory.
+
+    Deep project paths overflow ``sun_path``; the fallback lives in
+    :func:`user_runtime_dir`, keyed by a hash of *project_root*.
+    """
+    if fits_socket_path(path):
+        return path
+    digest = hashlib.sha1(str(project_root).encode()).hexdigest()[:12]
+    fallback = user_runtime_dir(digest) / path.name
+    if not fits_socket_path(fallback):
+        raise RuntimeError(
+            f"Unix socket path {fallback} is longer than {MAX_SOCKET_PATH} bytes; "
+            "set XDG_RUNTIME_DIR to a shorter directory"
+        )
+    return fallback
@@ -1,9 +1,122 @@
 import fileinput
+import hashlib
 import shutil
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
-from jinja2 import ChainableUndefined, Environment, FileSystemLoader
+from jinja2 import (
+    BytecodeCache,
+    ChainableUndefined,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+)
+
+from ..system.cache_dir import user_cache_dir
+
+_environments: dict[Optional[str], Environment] = {}
+_bytecode_cache: Optional[BytecodeCache] = None
+
+
+def _get_bytecode_cache() -> Optional[BytecodeCache]:
+    """Compiled templates persisted under the user cache dir, keyed by checksum.
+
+    Jinja stores the source checksum with each entry and recompiles on
+    mismatch, so edited templates are never served stale.
+    """
+    global _bytecode_cache
+    if _bytecode_cache is None:
+        directory = user_cache_dir("jinja")
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return None
+        _bytecode_cache = FileSystemBytecodeCache(str(directory))
+    return _bytecode_cache
+
+
+def get_environment(loader_root: Optional[Path] = None) -> Environment:
+    """Return the process-wide Jinja2 environment for *loader_root*.
+
+    ``None`` gives the loader-less environment used for template strings.
+    FileSystemLoader checks template mtimes, so a cached environment still
+    picks up changed files.
+    """
+    key = str(loader_root.resolve()) if loader_root is not None else None
+    env = _environments.get(key)
+    if env is None:
+        env = Environment(
+            loader=FileSystemLoader(loader_root) if loader_root is not None else None,
+            undefined=ChainableUndefined,
+            bytecode_cache=_get_bytecode_cache(),
+        )
+        _environments[key] = env
+    return env
+
+
+@dataclass
+class CopyReport:
+    """Destination files of a template copy, by what happened to them."""
+
+    created: list[Path] = field(default_factory=list)
+    updated: list[Path] = field(default_factory=list)
+    unchanged: list[Path] = field(default_factory=list)
+
+    @property
+    def changed(self) -> list[Path]:
+        """Files that were written — the only ones worth reformatting."""
+        return self.created + self.updated
+
+    def extend(self, other: "CopyReport") -> None:
+        self.created.extend(other.created)
+        self.updated.extend(other.updated)
+        self.unchanged.extend(other.unchanged)
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write_if_changed(
+    dest_path: Path, content: bytes, report: CopyReport, incremental: bool
+) -> None:
+    """Write *content* unless *dest_path* already holds the same bytes."""
+    if not dest_path.exists():
+        dest_path.write_bytes(content)
+        report.created.append(dest_path)
+        return
+    if incremental and _digest(dest_path.read_bytes()) == _digest(content):
+        report.unchanged.append(dest_path)
+        return
+    dest_path.write_bytes(content)
+    report.updated.append(dest_path)
+
+
+def _copy_if_changed(
+    source_path: Path, dest_path: Path, report: CopyReport, incremental: bool
+) -> None:
+    """``shutil.copy2`` unless *dest_path* already has the same content."""
+    if not dest_path.exists():
+        shutil.copy2(source_path, dest_path)
+        report.created.append(dest_path)
+        return
+    if (
+        incremental
+        and dest_path.stat().st_size == source_path.stat().st_size
+        and _digest(dest_path.read_bytes()) == _digest(source_path.read_bytes())
+    ):
+        report.unchanged.append(dest_path)
+        return
+    shutil.copy2(source_path, dest_path)
+    report.updated.append(dest_path)
+
+
+@lru_cache(maxsize=1024)
+def _compile_string(template_str: str) -> Template:
+    return get_environment().from_string(template_str)
 
 
 class TemplateManager:
@@ -25,19 +138,32 @@ class TemplateManager:
             Rendered string
         """
         if "{{" in template_str or "{%" in template_str:
-            template = Environment(
-                undefined=ChainableUndefined,
-            ).from_string(template_str)
-            return template.render(**template_context)
+            return _compile_string(template_str).render(**template_context)
         return template_str
 
+    def _render_rel_path(
+        self, rel_path: Path, template_context: dict, rendered: dict[str, str]
+    ) -> Path:
+        """Render every component of *rel_path*, memoized in *rendered*.
+
+        Sibling files share their parent components, so one tree copy renders
+        each distinct directory name once.
+        """
+        parts = []
+        for part in rel_path.parts:
+            if part not in rendered:
+                rendered[part] = self.render_template_string(part, template_context)
+            parts.append(rendered[part])
+        return Path(*parts)
+
     def copy_templates(
         self,
         source_dir: Path,
         dest_dir: Path,
         template_context: Optional[dict] = None,
         exclude_files: Optional[List[Path]] = None,
-    ) -> None:
+        incremental: bool = True,
+    ) -> CopyReport:
         """
         Copy template files from source to destination with Jinja2 processing.
 
@@ -46,6 +172,11 @@ class TemplateManager:
             dest_dir: Destination directory for processed files
             template_context: Context variables for template rendering
             exclude_files: List of file patterns to exclude from copying
+            incremental: Leave destination files whose content is already
+                identical untouched (mtime included)
+
+        Returns:
+            CopyReport of created, updated and unchanged destination files
         """
         if template_context is None:
             template_context = {}
@@ -53,22 +184,18 @@ class TemplateManager:
             exclude_files = []
 
         dest_dir.mkdir(parents=True, exist_ok=True)
-        jinja_env = Environment(
-            loader=FileSystemLoader(source_dir),
-            undefined=ChainableUndefined,
-        )
+        jinja_env = get_environment(source_dir)
+        rendered: dict[str, str] = {}
+        report = CopyReport()
 
         for source_path in source_dir.rglob("*"):
             if any(source_path.match(str(exclude)) for exclude in exclude_files):
                 continue
 
             rel_path = source_path.relative_to(source_dir)
-
-            rendered_parts = [
-                self.render_template_string(part, template_context)
-                for part in rel_path.parts
-            ]
-            dest_path = dest_dir / Path(*rendered_parts)
+            dest_path = dest_dir / self._render_rel_path(
+                rel_path, template_context, rendered
+            )
 
             if source_path.is_dir():
                 dest_path.mkdir(parents=True, exist_ok=True)
@@ -82,14 +209,18 @@ class TemplateManager:
                     rendered_content = template.render(**template_context)
                     rendered_content = rendered_content.rstrip("\n") + "\n"
 
-                    dest_path.write_text(rendered_content)
+                    _write_if_changed(
+                        dest_path, rendered_content.encode(), report, incremental
+                    )
                 else:
                     filename = self.render_template_string(
                         dest_path.name, template_context
                     )
                     dest_path = dest_path.parent / filename
 
-                    shutil.copy2(source_path, dest_path)
+                    _copy_if_changed(source_path, dest_path, report, incremental)
+
+        return report
 
     def copy_template(
         self, source_file: Path, dest_dir: Path, template_context: Optional[dict] = None
@@ -110,10 +241,7 @@ class TemplateManager:
 
         dest_dir.mkdir(parents=True, exist_ok=True)
 
-        jinja_env = Environment(
-            loader=FileSystemLoader(source_file.parent),
-            undefined=ChainableUndefined,
-        )
+        jinja_env = get_environment(source_file.parent)
 
         filename = self.render_template_string(source_file.name, template_context)
         dest_path = dest_dir / filename
@@ -126,9 +254,9 @@ class TemplateManager:
             if dest_path.suffix == ".j2":
                 dest_path = dest_path.with_suffix("")
 
-            dest_path.write_text(rendered_content)
+            _write_if_changed(dest_path, rendered_content.encode(), CopyReport(), True)
         else:
-            shutil.copy2(source_file, dest_path)
+            _copy_if_changed(source_file, dest_path, CopyReport(), True)
 
         return dest_path
 
@@ -154,6 +282,7 @@ class TemplateManager:
             exclude_files = []
 
         result: list[Path] = []
+        rendered: dict[str, str] = {}
 
         for source_path in source_dir.rglob("*"):
             if source_path.is_dir():
@@ -162,12 +291,7 @@ class TemplateManager:
                 continue
 
             rel_path = source_path.relative_to(source_dir)
-
-            rendered_parts = [
-                self.render_template_string(part, template_context)
-                for part in rel_path.parts
-            ]
-            dest_path = Path(*rendered_parts)
+            dest_path = self._render_rel_path(rel_path, template_context, rendered)
 
             if source_path.suffix == ".j2":
                 filename = self.render_template_string(dest_path.stem, template_context)
@@ -1,7 +1,8 @@
-from .project import ProjectTracking
+from .project import ProjectTracking, tracking_session
 from .sections import Section
 
 __all__ = [
     "ProjectTracking",
     "Section",
+    "tracking_session",
 ]
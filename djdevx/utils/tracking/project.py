@@ -1,5 +1,9 @@
 """ProjectTracking — reads/writes djdevx.toml and manages section entries."""
 
+import os
+import tempfile
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Optional
 
@@ -8,7 +12,174 @@ import tomlkit
 from ..project.project_structure import ProjectStructure
 from .sections import Section
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no advisory flock
+    fcntl = None
+
 Table = dict[str, Any]
+Mutation = Callable[[tomlkit.TOMLDocument], None]
+Stamp = Optional[tuple[int, int, int]]
+
+
+def _stamp(path: Path) -> Stamp:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+@contextmanager
+def _project_lock(directory: Path) -> Iterator[None]:
+    """Exclusive advisory lock on the project directory itself.
+
+    Locking the directory (not djdevx.toml) survives the atomic rename and
+    leaves no lock file behind.
+    """
+    if fcntl is None:
+        yield
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write via a temp file in the same directory plus ``os.replace``."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as fh:
+            fh.write(text)
+            fh.flush()
+            os.fsync(fh.fileno())
+        if path.exists():
+            mode = path.stat().st_mode & 0o777
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+class TrackedDocument:
+    """One djdevx.toml: parsed once, mutated in memory, written atomically.
+
+    Mutations are kept until ``save()``. If another process rewrote the file
+    since it was read, ``save()`` re-reads it under the lock and replays the
+    pending mutations, so concurrent ``ddx`` runs never drop each other's
+    changes.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._doc: Optional[tomlkit.TOMLDocument] = None
+        self._stamp: Stamp = None
+        self._pending: list[Mutation] = []
+
+    def _read(self) -> None:
+        self._stamp = _stamp(self.path)
+        if self._stamp is None:
+            self._doc = tomlkit.document()
+        else:
+            self._doc = tomlkit.loads(self.path.read_text())
+
+    def document(self) -> tomlkit.TOMLDocument:
+        """The parsed document; re-read if the file changed and nothing is pending."""
+        if self._doc is None or (
+            not self._pending and _stamp(self.path) != self._stamp
+        ):
+            self._read()
+        assert self._doc is not None
+        return self._doc
+
+    def apply(self, mutation: Mutation) -> None:
+        mutation(self.document())
+        self._pending.append(mutation)
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._pending)
+
+    def save(self) -> None:
+        if not self._pending:
+            return
+        with _project_lock(self.path.parent):
+            if _stamp(self.path) != self._stamp:
+                self._read()
+                assert self._doc is not None
+                for mutation in self._pending:
+                    mutation(self._doc)
+            _write_atomic(self.path, tomlkit.dumps(self._doc))
+            self._stamp = _stamp(self.path)
+            self._pending.clear()
+
+
+class TrackingSession:
+    """Shares one ``TrackedDocument`` per project and writes them once, at the end."""
+
+    def __init__(self) -> None:
+        self._documents: dict[Path, TrackedDocument] = {}
+
+    def document(self, path: Path) -> TrackedDocument:
+        key = path.resolve()
+        if key not in self._documents:
+            self._documents[key] = TrackedDocument(path)
+        return self._documents[key]
+
+    def owns(self, document: TrackedDocument) -> bool:
+        return any(d is document for d in self._documents.values())
+
+    def flush(self) -> None:
+        for document in self._documents.values():
+            document.save()
+
+
+_active_session: Optional[TrackingSession] = None
+
+
+@contextmanager
+def tracking_session() -> Iterator[TrackingSession]:
+    """Parse each djdevx.toml once and batch every save made inside the block.
+
+    Re-entrant: nested blocks join the outermost session, which writes all
+    pending mutations when it exits — also on error, since the changes they
+    record were already applied to the project.
+    """
+    global _active_session
+    if _active_session is not None:
+        yield _active_session
+        return
+
+    session = _active_session = TrackingSession()
+    try:
+        yield session
+    finally:
+        _active_session = None
+        session.flush()
+
+
+def _get_table(doc: tomlkit.TOMLDocument, section: Section) -> Optional[Table]:
+    """Return the section table, or None if the section is absent."""
+    table = doc.get(section)
+    return table if table is not None else None
+
+
+def _ensure_table(doc: tomlkit.TOMLDocument, section: Section) -> Table:
+    """Return the section table, creating it if absent."""
+    table = doc.get(section)
+    if table is None:
+        table = tomlkit.table()
+        doc[section] = table
+    return table
 
 
 class ProjectTracking:
@@ -16,47 +187,75 @@ class ProjectTracking:
 
     Owns the djdevx.toml document (load/save) and provides section-scoped
     operations on ``[<section>.<name>]`` entries. Reads never mutate the
-    document; mutations trigger a save.
+    document; mutations trigger a save unless *autosave* is off, in which case
+    the caller batches them and calls ``save()`` once. Inside
+    ``tracking_session()`` all instances share one parsed document and saves
+    are deferred to the end of the session.
     """
 
-    def __init__(self, project_root: Optional[Path] = None) -> None:
+    def __init__(
+        self, project_root: Optional[Path] = None, autosave: bool = True
+    ) -> None:
         if project_root is not None:
             self._project_root = project_root
         else:
             self._project_root = ProjectStructure().root
         self._djdevx_path = self._project_root / "djdevx.toml"
-        self._doc: Optional[tomlkit.TOMLDocument] = None
+        self._document = (
+            _active_session.document(self._djdevx_path)
+            if _active_session is not None
+            else TrackedDocument(self._djdevx_path)
+        )
+        self._autosave = autosave
 
     def _load(self) -> tomlkit.TOMLDocument:
-        if self._doc is None:
-            if self._djdevx_path.exists():
-                self._doc = tomlkit.loads(self._djdevx_path.read_text())
-            else:
-                self._doc = tomlkit.document()
-        return self._doc
+        return self._document.document()
 
     def save(self) -> None:
-        if self._doc is not None:
-            self._djdevx_path.write_text(tomlkit.dumps(self._doc))
+        if _active_session is not None and _active_session.owns(self._document):
+            return
+        self._document.save()
+
+    def _mutate(self, mutation: Mutation) -> None:
+        self._document.apply(mutation)
+        if self._autosave:
+            self.save()
 
     def get_config(self) -> tomlkit.TOMLDocument:
         """Get the root config document."""
         return self._load()
 
-    def _get_table(self, section: Section) -> Optional[Table]:
-        """Return the section table, or None if the section is absent."""
-        config = self._load()
-        table = config.get(section)
-        return table if table is not None else None
+    def dev_config(self, name: str) -> dict[str, Any]:
+        """Return the ``[dev.<name>]`` table as plain Python values (empty if absent)."""
+        dev = self._load().get("dev")
+        table = dev.get(name) if dev is not None else None
+        return table.unwrap() if table is not None else {}
 
-    def _ensure_table(self, section: Section) -> Table:
-        """Return the section table, creating it if absent."""
-        config = self._load()
-        table = config.get(section)
-        if table is None:
-            table = tomlkit.table()
-            config[section] = table
-        return table
+    def set_dev_config(self, name: str, values: dict[str, Any]) -> None:
+        """Merge *values* into the ``[dev.<name>]`` table, creating it if needed."""
+
+        def mutation(doc: tomlkit.TOMLDocument) -> None:
+            if "dev" not in doc:
+                doc["dev"] = tomlkit.table(is_super_table=True)
+            dev = doc["dev"]
+            if name not in dev:
+                dev[name] = tomlkit.table()
+            for key, value in values.items():
+                dev[name][key] = value
+
+        self._mutate(mutation)
+
+    def remove_dev_config(self, name: str) -> None:
+        """Delete the ``[dev.<name>]`` table if present."""
+
+        def mutation(doc: tomlkit.TOMLDocument) -> None:
+            dev = doc.get("dev")
+            if dev is not None and name in dev:
+                del dev[name]
+                if not dev:
+                    del doc["dev"]
+
+        self._mutate(mutation)
 
     # ------------------------------------------------------------------
     # Section-scoped operations
@@ -71,31 +270,38 @@ class ProjectTracking:
         variant: Optional[str] = None,
         variants: Optional[list[str]] = None,
     ) -> None:
-        table = self._ensure_table(section)
-        if name not in table:
-            table[name] = tomlkit.table()
-        entry = table[name]
-        entry["installed"] = True
-        if display_name is not None:
-            entry["display_name"] = display_name
-        if variant is not None:
-            entry["variant"] = variant
-        if variants is not None:
-            entry["variants"] = variants
-        self.save()
+        def mutation(doc: tomlkit.TOMLDocument) -> None:
+            table = _ensure_table(doc, section)
+            if name not in table:
+                table[name] = tomlkit.table()
+            entry = table[name]
+            entry["installed"] = True
+            if display_name is not None:
+                entry["display_name"] = display_name
+            if variant is not None:
+                entry["variant"] = variant
+            if variants is not None:
+                entry["variants"] = variants
+
+        self._mutate(mutation)
 
     def remove(self, section: Section, name: str) -> None:
-        table = self._get_table(section)
-        if table is not None and name in table:
-            del table[name]
-            self.save()
+        if not self.is_installed(section, name):
+            return
+
+        def mutation(doc: tomlkit.TOMLDocument) -> None:
+            table = _get_table(doc, section)
+            if table is not None and name in table:
+                del table[name]
+
+        self._mutate(mutation)
 
     def is_installed(self, section: Section, name: str) -> bool:
-        table = self._get_table(section)
+        table = _get_table(self._load(), section)
         return table is not None and name in table
 
     def get_variants(self, section: Section, name: str) -> list[str]:
-        table = self._get_table(section)
+        table = _get_table(self._load(), section)
         if table is not None:
             entry = table.get(name)
             if entry is not None and hasattr(entry, "get"):
@@ -104,7 +310,7 @@ class ProjectTracking:
         return []
 
     def list(self, section: Section) -> dict[str, dict[str, Any]]:
-        table = self._get_table(section)
+        table = _get_table(self._load(), section)
         result: dict[str, dict[str, Any]] = {}
         if table is None:
             return result
@@ -10,6 +10,8 @@ class CacheSettings(AppBaseSettings):
     redis_port: int = 6379
     redis_db: int = 1
     redis_password: SecretStr
+    # Set by `ddx dev` when the dev Redis listens on a Unix socket.
+    redis_socket: str | None = None
 
     @classmethod
     def get_dev_defaults(cls) -> dict[str, Any]:
@@ -30,10 +32,15 @@ class CacheSettings(AppBaseSettings):
 
 _cache = CacheSettings()
 
+if _cache.redis_socket:
+    _location = f"unix://{_cache.redis_socket}?db={_cache.redis_db}"
+else:
+    _location = f"redis://{_cache.redis_host}:{_cache.redis_port}/{_cache.redis_db}"
+
 CACHES = {
     "default": {
         "BACKEND": "django_redis.cache.RedisCache",
-        "LOCATION": f"redis://{_cache.redis_host}:{_cache.redis_port}/{_cache.redis_db}",
+        "LOCATION": _location,
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
             "PASSWORD": _cache.redis_password.get_secret_value(),
@@ -9,3 +9,12 @@ def temp_dir(tmp_path):
     Each test gets a unique folder under pytest's temp root.
     """
     return tmp_path
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _user_cache_dir(tmp_path_factory):
+    """Keep djdevx's user cache (installable manifests) out of the real home."""
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setenv("DJDEVX_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+    yield
+    monkeypatch.undo()
@@ -0,0 +1,7 @@
+"""Generated by djdevx — do not edit; run `ddx urls sync` after changing urls/."""
+
+URL_MODULES: list[str] = [
+    "urls.apps.home",
+    "urls.django.admin",
+    "urls.django.media",
+]
@@ -1,9 +1,23 @@
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import SecretStr
 
 from settings.utils.base_settings import AppBaseSettings
 
+# How Django connects to PostgreSQL:
+#   pool       — psycopg 3 connection pool per worker process (CONN_MAX_AGE 0)
+#   persistent — each worker thread keeps its connection open for
+#                postgres_conn_max_age seconds instead of reconnecting per request
+#   pgbouncer  — an external PgBouncer in transaction pooling mode, without
+#                server-side cursors
+#
+# The project is served over ASGI, where Django runs each request's sync code
+# on whatever thread is free, so thread-bound persistent connections pile up
+# instead of being reused. Django recommends CONN_MAX_AGE 0 plus a pool under
+# ASGI, hence "pool" by default and postgres_conn_max_age 0; raise it only for
+# a WSGI deployment.
+PostgresConnection = Literal["pool", "persistent", "pgbouncer"]
+
 
 class DatabaseSettings(AppBaseSettings):
     postgres_server: str
@@ -11,6 +25,12 @@ class DatabaseSettings(AppBaseSettings):
     postgres_db: str
     postgres_user: str
     postgres_password: SecretStr
+    postgres_connection: PostgresConnection = "pool"
+    postgres_conn_max_age: int = 0
+    postgres_conn_health_checks: bool = True
+    postgres_pool_min_size: int = 2
+    postgres_pool_max_size: int = 10
+    postgres_pool_timeout: float = 30.0
 
     @classmethod
     def get_dev_defaults(cls) -> dict[str, Any]:
@@ -29,13 +49,28 @@ class DatabaseSettings(AppBaseSettings):
 
 _db = DatabaseSettings()
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.postgresql",
-        "HOST": _db.postgres_server,
-        "PORT": str(_db.postgres_port),
-        "NAME": _db.postgres_db,
-        "USER": _db.postgres_user,
-        "PASSWORD": _db.postgres_password.get_secret_value(),
-    }
+_default: dict[str, Any] = {
+    "ENGINE": "django.db.backends.postgresql",
+    "HOST": _db.postgres_server,
+    "PORT": str(_db.postgres_port),
+    "NAME": _db.postgres_db,
+    "USER": _db.postgres_user,
+    "PASSWORD": _db.postgres_password.get_secret_value(),
+    "CONN_HEALTH_CHECKS": _db.postgres_conn_health_checks,
 }
+
+if _db.postgres_connection == "pool":
+    _default["OPTIONS"] = {
+        "pool": {
+            "min_size": _db.postgres_pool_min_size,
+            "max_size": _db.postgres_pool_max_size,
+            "timeout": _db.postgres_pool_timeout,
+        }
+    }
+else:
+    _default["CONN_MAX_AGE"] = _db.postgres_conn_max_age
+
+if _db.postgres_connection == "pgbouncer":
+    _default["DISABLE_SERVER_SIDE_CURSORS"] = True
+
+DATABASES = {"default": _default}
@@ -5,8 +5,13 @@ from pathlib import Path
 from unittest.mock import patch
 from typer.testing import CliRunner
 
+from djdevx.database.postgres import PGBOUNCER_PIXI_PACKAGE, PostgresDatabase
 from djdevx.main import app
+from djdevx.utils.devcontainer import DockerComposeManager
+from djdevx.utils.installable.pixi_ops import PixiBatch, pixi_batch
 from djdevx.utils.project.pixi_runner import PixiRunner
+from djdevx.utils.project.project_structure import ProjectStructure
+from djdevx.utils.tracking import ProjectTracking
 from tests.test_helpers import create_test_django_project
 
 runner = CliRunner()
@@ -35,10 +40,11 @@ def test_postgres_install_and_remove(temp_dir):
     assert result.exit_code == 0, f"PostgreSQL install failed: {result.output}"
     assert "PostgreSQL installed." in result.stdout
 
-    # Check if psycopg2-binary dependency was added
-    assert PixiRunner().has_dependency("psycopg2-binary"), (
-        "psycopg2-binary dependency not found after installation"
-    )
+    # Check if the psycopg 3 driver and its connection pool were added
+    for dependency in ("psycopg", "psycopg-pool"):
+        assert PixiRunner().has_dependency(dependency), (
+            f"{dependency} dependency not found after installation"
+        )
 
     # Check if database.py settings file exists and matches expected content
     database_settings_file = temp_dir / "settings" / "django" / "database.py"
@@ -86,10 +92,11 @@ def test_postgres_install_and_remove(temp_dir):
     assert result.exit_code == 0, f"PostgreSQL remove failed: {result.output}"
     assert "PostgreSQL removed." in result.stdout
 
-    # Check if psycopg2-binary dependency was removed
-    assert not PixiRunner().has_dependency("psycopg2-binary"), (
-        "psycopg2-binary dependency found after removal"
-    )
+    # Check if the psycopg dependencies were removed
+    for dependency in ("psycopg", "psycopg-pool"):
+        assert not PixiRunner().has_dependency(dependency), (
+            f"{dependency} dependency found after removal"
+        )
 
     # Check if postgres service was removed from docker-compose
     docker_compose_content = docker_compose_file.read_text()
@@ -114,3 +121,30 @@ def test_postgres_install_and_remove(temp_dir):
     assert database_content_after == default_database_file.read_text(), (
         "database.py not restored to default sqlite settings after removal"
     )
+
+
+def test_postgres_pgbouncer_hooks(tmp_path):
+    """The pgbouncer install param queues its package and adds the dev config."""
+    (tmp_path / "djdevx.toml").write_text("")
+    database = PostgresDatabase()
+    database._structure = ProjectStructure(tmp_path)
+    database._install_context = {"pgbouncer": True}
+
+    with patch.object(PixiBatch, "flush"), pixi_batch() as batch:
+        database.after_pixi_install()
+    assert batch.to_add == [PGBOUNCER_PIXI_PACKAGE]
+    compose = DockerComposeManager(tmp_path)
+    assert compose.service_exists("pgbouncer")
+    assert compose.get_service("pgbouncer")["depends_on"] == ["db"]
+    assert ProjectTracking(tmp_path).dev_config("pgbouncer") == {"enabled": True}
+
+    with (
+        patch.object(PixiBatch, "flush"),
+        patch.object(PostgresDatabase, "_wipe_dev_data"),
+        patch("djdevx.utils.services.pgbouncer.PgBouncerService.down"),
+        pixi_batch() as batch,
+    ):
+        database.after_pixi_remove()
+    assert batch.to_remove == [PGBOUNCER_PIXI_PACKAGE]
+    assert not DockerComposeManager(tmp_path).service_exists("pgbouncer")
+    assert ProjectTracking(tmp_path).dev_config("pgbouncer") == {}
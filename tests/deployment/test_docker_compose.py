@@ -1,10 +1,18 @@
 """Unit tests for DockerComposePlugin imports and DeployInputs."""
 
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import typer
+import yaml
+
 from djdevx.deployment.docker_compose import (
     DeployInputs,
     DockerComposePlugin,
     _OVERLAY_STUB,
 )
+from djdevx.utils.services.pgbouncer import PGBOUNCER_IMAGE
 from djdevx.utils.project.setting_collector import (
     CollectedSettings,
     ConfigVarInfo,
@@ -74,3 +82,100 @@ class TestDeployInputs:
         assert DeployInputs._validate_email("test@example.com") is True
         assert DeployInputs._validate_email("invalid") is False
         assert DeployInputs._validate_email("@example.com") is False
+
+
+class TestBaseCompose:
+    """Tests for the generated docker-compose.yml."""
+
+    def _compose(self, secrets: list[SecretInfo]) -> dict:
+        settings = CollectedSettings(secrets=secrets)
+        return yaml.safe_load(DockerComposePlugin._build_base_compose(settings))
+
+    def test_release_runs_before_web(self) -> None:
+        services = self._compose([])["services"]
+        release = services["release"]
+        assert release["command"] == ["release"]
+        assert release["restart"] == "no"
+        assert release["image"] == services["web"]["image"]
+        assert "labels" not in release
+        assert services["web"]["depends_on"] == {
+            "release": {"condition": "service_completed_successfully"}
+        }
+
+    def test_release_gets_the_secrets(self) -> None:
+        secret = SecretInfo(name="secret_key", source_file=Path("base.py"))
+        services = self._compose([secret])["services"]
+        assert services["release"]["secrets"] == ["secret_key"]
+        assert services["web"]["secrets"] == ["secret_key"]
+
+    def test_no_pgbouncer_by_default(self) -> None:
+        services = self._compose([])["services"]
+        assert "pgbouncer" not in services
+        assert "environment" not in services["web"]
+        assert "deploy" not in services["web"]
+
+    def test_pgbouncer_sidecar(self) -> None:
+        secret = SecretInfo(name="postgres_password", source_file=Path("db.py"))
+        settings = CollectedSettings(secrets=[secret])
+        compose = yaml.safe_load(
+            DockerComposePlugin._build_base_compose(
+                settings, replicas=4, pgbouncer=True
+            )
+        )
+        services = compose["services"]
+        pgbouncer = services["pgbouncer"]
+        assert pgbouncer["image"] == PGBOUNCER_IMAGE
+        assert not PGBOUNCER_IMAGE.endswith(":latest")
+        assert pgbouncer["environment"]["POOL_MODE"] == "transaction"
+        assert pgbouncer["environment"]["MAX_CLIENT_CONN"] == "200"
+        assert pgbouncer["environment"]["DEFAULT_POOL_SIZE"] == "20"
+        assert pgbouncer["secrets"] == ["postgres_password"]
+        web = services["web"]
+        assert web["environment"]["POSTGRES_SERVER"] == "pgbouncer"
+        assert web["environment"]["POSTGRES_CONNECTION"] == "pgbouncer"
+        assert web["depends_on"]["pgbouncer"] == {"condition": "service_started"}
+        assert web["deploy"] == {"replicas": 4}
+        assert "environment" not in services["release"]
+
+    def test_web_replicas_from_app_env(self, tmp_path) -> None:
+        assert DockerComposePlugin._web_replicas(tmp_path) == 1
+        (tmp_path / "app").mkdir()
+        (tmp_path / "app" / ".env").write_text("DOMAIN=example.com\nWEB_REPLICAS=3\n")
+        assert DockerComposePlugin._web_replicas(tmp_path) == 3
+
+    @pytest.mark.parametrize("value", ["three", "0", "-2"])
+    def test_invalid_web_replicas_fails(self, tmp_path, value) -> None:
+        (tmp_path / "app").mkdir()
+        (tmp_path / "app" / ".env").write_text(f"WEB_REPLICAS={value}\n")
+        with pytest.raises(typer.Exit):
+            DockerComposePlugin._web_replicas(tmp_path)
+
+    def test_pgbouncer_sidecar_is_opt_in(self, tmp_path) -> None:
+        backend = tmp_path / "backend"
+        backend.mkdir()
+        (backend / ".env.prod").write_text("POSTGRES_CONNECTION=pgbouncer\n")
+        output_dir = tmp_path / "deploy"
+        (output_dir / "app").mkdir(parents=True)
+        app_env = output_dir / "app" / ".env"
+
+        with patch(
+            "djdevx.deployment.docker_compose.ProjectStructure"
+        ) as structure_cls:
+            structure_cls.return_value.root = backend
+            app_env.write_text(
+                DockerComposePlugin._build_app_env(output_dir, domain="example.com")
+            )
+            assert not DockerComposePlugin._pgbouncer_sidecar(output_dir)
+
+            app_env.write_text(
+                DockerComposePlugin._build_app_env(output_dir, pgbouncer=True)
+            )
+            assert DockerComposePlugin._pgbouncer_sidecar(output_dir)
+
+            # Kept on later runs, dropped by --no-pgbouncer.
+            app_env.write_text(DockerComposePlugin._build_app_env(output_dir))
+            assert DockerComposePlugin._pgbouncer_sidecar(output_dir)
+            app_env.write_text(
+                DockerComposePlugin._build_app_env(output_dir, pgbouncer=False)
+            )
+            assert not DockerComposePlugin._pgbouncer_sidecar(output_dir)
@@ -0,0 +1,97 @@
+"""Tests for ddx dev daemon {start,stop,status,logs}."""
+
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from djdevx.main import app
+
+runner = CliRunner()
+
+SERVICE = {
+    "name": "postgres",
+    "display_name": "PostgreSQL",
+    "port": 6543,
+    "env": {"POSTGRES_PORT": "6543"},
+    "supervised": True,
+    "restarts": 2,
+    "up": True,
+}
+
+
+def _invoke(tmp_path, monkeypatch, args, client=None):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "djdevx.toml").write_text("")
+    with patch("djdevx.dev.daemon.DaemonClient.connect", return_value=client):
+        return runner.invoke(app, ["dev", "daemon", *args])
+
+
+def test_start_detaches_and_brings_services_up(tmp_path, monkeypatch):
+    client = MagicMock()
+    client.call.return_value = [SERVICE]
+    with (
+        patch("djdevx.dev.daemon._spawn") as spawn,
+        patch("djdevx.dev.daemon._wait_for_daemon", return_value=client),
+    ):
+        result = _invoke(tmp_path, monkeypatch, ["start"])
+    assert result.exit_code == 0
+    spawn.assert_called_once()
+    client.call.assert_called_once_with("up")
+    assert "PostgreSQL is up on port 6543" in result.output
+
+
+def test_start_foreground_serves_installed_services(tmp_path, monkeypatch):
+    services = [MagicMock()]
+    with (
+        patch("djdevx.dev.daemon.resolve_dev_services", return_value=services),
+        patch("djdevx.dev.daemon.Supervisor") as supervisor_cls,
+    ):
+        result = _invoke(tmp_path, monkeypatch, ["start", "--foreground"])
+    assert result.exit_code == 0
+    assert supervisor_cls.call_args.args == (
+        services,
+        tmp_path / ".pixi" / "devdata" / "ddx.sock",
+    )
+    supervisor_cls.return_value.serve.assert_called_once()
+
+
+def test_start_when_already_running(tmp_path, monkeypatch):
+    client = MagicMock()
+    client.call.return_value = {"pid": 99}
+    with patch("djdevx.dev.daemon._spawn") as spawn:
+        result = _invoke(tmp_path, monkeypatch, ["start"], client)
+    assert result.exit_code == 0
+    spawn.assert_not_called()
+    assert "already running (pid 99)" in result.output
+
+
+def test_stop_shuts_the_daemon_down(tmp_path, monkeypatch):
+    client = MagicMock()
+    client.call.return_value = {"pid": 99}
+    result = _invoke(tmp_path, monkeypatch, ["stop"], client)
+    assert result.exit_code == 0
+    assert client.call.call_args.args == ("shutdown",)
+
+
+def test_status_lists_supervised_services(tmp_path, monkeypatch):
+    client = MagicMock()
+    client.call.return_value = {"pid": 99, "version": "0.1.0", "services": [SERVICE]}
+    result = _invoke(tmp_path, monkeypatch, ["status"], client)
+    assert result.exit_code == 0
+    assert "PostgreSQL" in result.output
+    assert "6543" in result.output
+
+
+def test_logs_prefix_lines_with_service(tmp_path, monkeypatch):
+    client = MagicMock()
+    client.stream.return_value = iter([{"service": "redis", "line": "Ready"}])
+    result = _invoke(tmp_path, monkeypatch, ["logs", "-f"], client)
+    assert result.exit_code == 0
+    client.stream.assert_called_once_with("logs", follow=True, lines=20)
+    assert "redis    | Ready" in result.output
+
+
+def test_commands_need_a_running_daemon(tmp_path, monkeypatch):
+    result = _invoke(tmp_path, monkeypatch, ["status"])
+    assert result.exit_code == 1
+    assert "No dev daemon running" in result.output
@@ -6,6 +6,7 @@ from typer.testing import CliRunner
 
 from djdevx.main import app
 from djdevx.utils.django.manage_commands import ManageCommands
+from djdevx.utils.services import PostgresService
 
 runner = CliRunner()
 
@@ -64,6 +65,18 @@ def test_reset_flushes_data(tmp_path, monkeypatch):
     service.reset.assert_called_once()
 
 
+def test_reset_starts_a_stopped_server_first(tmp_path, monkeypatch):
+    service = _make_service(tmp_path, is_up=False)
+    result, _, _, _ = _invoke(tmp_path, monkeypatch, ["reset"], service)
+    assert result.exit_code == 0
+    assert [c[0] for c in service.method_calls] == [
+        "up",
+        "export_connection_env",
+        "reset",
+    ]
+    service.is_up.assert_not_called()
+
+
 def test_purge_stops_and_deletes_data(tmp_path, monkeypatch):
     service = _make_service(tmp_path, is_up=True)
     result, _, _, _ = _invoke(tmp_path, monkeypatch, ["purge"], service)
@@ -72,7 +85,74 @@ def test_purge_stops_and_deletes_data(tmp_path, monkeypatch):
     assert not service.data_dir.exists()
 
 
+def test_purge_clears_migration_state(tmp_path, monkeypatch):
+    state = tmp_path / ".pixi" / "devdata" / "migration-state.json"
+    state.parent.mkdir(parents=True)
+    state.write_text("{}")
+    service = _make_service(tmp_path, is_up=False)
+    result, _, _, _ = _invoke(tmp_path, monkeypatch, ["purge"], service)
+    assert result.exit_code == 0
+    assert not state.exists()
+
+
 def test_commands_guard_when_no_database(tmp_path, monkeypatch):
     result, _, _, _ = _invoke(tmp_path, monkeypatch, ["init"], None)
     assert result.exit_code == 1
     assert "No database installed" in result.output
+
+
+def test_purge_stops_through_daemon(tmp_path, monkeypatch):
+    service = _make_service(tmp_path, is_up=True)
+    service.name = "postgres"
+    client = MagicMock()
+    with patch("djdevx.dev.database.DaemonClient.connect", return_value=client):
+        result, _, _, _ = _invoke(tmp_path, monkeypatch, ["purge"], service)
+    assert result.exit_code == 0
+    client.call.assert_called_once_with("down", services=["postgres"])
+    service.down.assert_not_called()
+
+
+# ── snapshots ─────────────────────────────────────────────────────────────────
+
+
+def _make_postgres(tmp_path, is_up=True):
+    service = MagicMock(spec=PostgresService)
+    service.is_up.return_value = is_up
+    service.display_name = "PostgreSQL"
+    service.data_dir = _data_dir(tmp_path)
+    return service
+
+
+def test_snapshot_starts_service_and_saves(tmp_path, monkeypatch):
+    service = _make_postgres(tmp_path, is_up=False)
+    result, _, _, _ = _invoke(tmp_path, monkeypatch, ["snapshot", "seeded"], service)
+    assert result.exit_code == 0
+    service.up.assert_called_once()
+    service.is_up.assert_not_called()
+    service.snapshot.assert_called_once_with("seeded")
+
+
+def test_restore_defaults_and_clears_migration_state(tmp_path, monkeypatch):
+    state = tmp_path / ".pixi" / "devdata" / "migration-state.json"
+    state.parent.mkdir(parents=True)
+    state.write_text("{}")
+    service = _make_postgres(tmp_path)
+    result, _, _, _ = _invoke(tmp_path, monkeypatch, ["restore"], service)
+    assert result.exit_code == 0
+    service.restore.assert_called_once_with("default")
+    assert not state.exists()
+
+
+def test_snapshots_lists_names(tmp_path, monkeypatch):
+    service = _make_postgres(tmp_path)
+    service.snapshots.return_value = ["default", "seeded"]
+    result, _, _, _ = _invoke(tmp_path, monkeypatch, ["snapshots"], service)
+    assert result.exit_code == 0
+    assert "seeded" in result.output
+
+
+def test_snapshots_need_postgres(tmp_path, monkeypatch):
+    service = _make_service(tmp_path)
+    result, _, _, _ = _invoke(tmp_path, monkeypatch, ["snapshot"], service)
+    assert result.exit_code == 1
+    assert "does not support snapshots" in result.output
@@ -1,11 +1,14 @@
 """Tests for ddx dev start — ordering and skip-if-done behavior."""
 
+import os
+import threading
 from unittest.mock import MagicMock, patch
 
 from typer.testing import CliRunner
 
 from djdevx.main import app
 from djdevx.utils.django.manage_commands import ManageCommands
+from djdevx.utils.project.pixi_runner import PixiRunner
 
 runner = CliRunner()
 
@@ -19,11 +22,13 @@ class _Invocation:
         self.db = MagicMock()
         self.db.display_name = "PostgreSQL"
         self.db.is_up.return_value = False
+        self.db.connection_env.return_value = {"POSTGRES_PORT": "5432"}
         self.cache = MagicMock()
         self.cache.display_name = "Redis"
         self.cache.is_up.return_value = False
-        self.pixi = MagicMock()
-        self.pixi.project_root = None
+        self.cache.connection_env.return_value = {"REDIS_PORT": "6379"}
+        self.pooler = None
+        self.pixi = MagicMock(spec=PixiRunner)
         self.log: list[object] = []
         self.db.up = MagicMock(side_effect=lambda: self.log.append("db_up"))
         self.cache.up = MagicMock(side_effect=lambda: self.log.append("cache_up"))
@@ -37,11 +42,15 @@ class _Invocation:
     def invoke(self, tmp_path, monkeypatch, args=(), configure=None):
         monkeypatch.chdir(tmp_path)
         (tmp_path / "djdevx.toml").write_text("")
+        self.pixi.project_root = tmp_path
         with (
             patch("djdevx.dev.start.PixiRunner") as self.pixi_cls,
             patch("djdevx.dev.start._init_settings") as self.init_settings,
             patch("djdevx.dev.start.resolve_database_dev_service") as self.resolve_db,
             patch("djdevx.dev.start.resolve_cache_dev_service") as self.resolve_cache,
+            patch(
+                "djdevx.dev.start.resolve_pgbouncer_dev_service"
+            ) as self.resolve_pooler,
             patch.object(
                 ManageCommands, "migrations_pending", return_value=True
             ) as self.migrations_pending,
@@ -50,6 +59,7 @@ class _Invocation:
             self.pixi_cls.return_value = self.pixi
             self.resolve_db.return_value = self.db
             self.resolve_cache.return_value = self.cache
+            self.resolve_pooler.return_value = self.pooler
             self.migrations_pending.return_value = True
             self.server_command.return_value = SERVER_ARGS
             if configure is not None:
@@ -60,12 +70,23 @@ class _Invocation:
 def test_start_runs_steps_in_order(tmp_path, monkeypatch):
     inv = _Invocation()
     inv.invoke(tmp_path, monkeypatch)
-    assert inv.log == [
-        "db_up",
-        ("manage", ("migrate",)),
-        "cache_up",
-        ("server", tuple(SERVER_ARGS)),
-    ]
+    assert inv.log.index("db_up") < inv.log.index(("manage", ("migrate",)))
+    assert sorted(map(str, inv.log[:-1])) == sorted(
+        map(str, ["db_up", "cache_up", ("manage", ("migrate",))])
+    )
+    assert inv.log[-1] == ("server", tuple(SERVER_ARGS))
+
+
+def test_start_migrates_while_cache_is_starting(tmp_path, monkeypatch):
+    inv = _Invocation()
+    migrated = threading.Event()
+    inv.pixi.run_manage_command.side_effect = lambda *a, **k: migrated.set()
+    inv.cache.up.side_effect = lambda: inv.log.append(
+        "cache_up_after_migrate" if migrated.wait(5) else "cache_up_blocked"
+    )
+    result = inv.invoke(tmp_path, monkeypatch)
+    assert result.exit_code == 0
+    assert "cache_up_after_migrate" in inv.log
 
 
 def test_start_skips_settings(tmp_path, monkeypatch):
@@ -93,14 +114,109 @@ def test_start_skips_migrate_when_none_pending(tmp_path, monkeypatch):
     inv.db.up.assert_called_once()
 
 
-def test_start_does_not_start_running_db(tmp_path, monkeypatch):
+def test_start_probes_db_once_through_up(tmp_path, monkeypatch):
     inv = _Invocation()
-    inv.db.is_up.return_value = True
-    inv.invoke(tmp_path, monkeypatch)
-    inv.db.up.assert_not_called()
+    inv.db.up.side_effect = None
+    inv.db.up.return_value = False
+    result = inv.invoke(tmp_path, monkeypatch)
+    assert result.exit_code == 0
+    inv.db.up.assert_called_once()
+    inv.db.is_up.assert_not_called()
 
 
 def test_start_forwards_extra_args(tmp_path, monkeypatch):
     inv = _Invocation()
     inv.invoke(tmp_path, monkeypatch, ["--port", "9000"])
     inv.pixi.run_interactive.assert_called_once_with(*SERVER_ARGS, "--port", "9000")
+
+
+def test_start_uses_daemon_when_running(tmp_path, monkeypatch):
+    inv = _Invocation()
+    client = MagicMock()
+    client.call.return_value = [
+        {
+            "name": "postgres",
+            "display_name": "PostgreSQL",
+            "port": 6543,
+            "env": {"POSTGRES_PORT": "6543"},
+        }
+    ]
+    monkeypatch.setenv("POSTGRES_PORT", "")
+    with patch("djdevx.dev.start.DaemonClient.connect", return_value=client):
+        result = inv.invoke(tmp_path, monkeypatch)
+        port = os.environ.get("POSTGRES_PORT")
+    assert result.exit_code == 0
+    client.call.assert_called_once_with("up")
+    inv.resolve_db.assert_not_called()
+    inv.db.up.assert_not_called()
+    assert port == "6543"
+    assert ("manage", ("migrate",)) in inv.log
+
+
+POOLER_ENV = {
+    "POSTGRES_PORT": "6432",
+    "POSTGRES_SERVER": "localhost",
+    "POSTGRES_CONNECTION": "pgbouncer",
+}
+
+
+def _record_migrate_env(inv):
+    """Make ``migrate`` log the POSTGRES_* env it runs with."""
+    inv.pixi.run_manage_command.side_effect = lambda *a, **k: inv.log.append(
+        (
+            "migrate_env",
+            os.environ.get("POSTGRES_PORT"),
+            os.environ.get("POSTGRES_CONNECTION"),
+        )
+    )
+
+
+def _isolate_postgres_env(monkeypatch):
+    for key in POOLER_ENV:
+        monkeypatch.setenv(key, "")  # restored after the test
+        monkeypatch.delenv(key)
+
+
+def test_start_brings_up_pgbouncer_and_migrates_directly(tmp_path, monkeypatch):
+    _isolate_postgres_env(monkeypatch)
+    inv = _Invocation()
+    inv.pooler = MagicMock()
+    inv.pooler.display_name = "PgBouncer"
+    inv.pooler.connection_env.return_value = POOLER_ENV
+    for service in (inv.db, inv.cache, inv.pooler):
+        service.export_connection_env.side_effect = os.environ.update
+    _record_migrate_env(inv)
+    result = inv.invoke(tmp_path, monkeypatch)
+    assert result.exit_code == 0
+    inv.pooler.up.assert_called_once()
+    assert ("migrate_env", "5432", None) in inv.log
+    # The dev server itself connects through PgBouncer.
+    assert os.environ["POSTGRES_PORT"] == "6432"
+    assert os.environ["POSTGRES_CONNECTION"] == "pgbouncer"
+
+
+def test_start_with_daemon_migrates_directly(tmp_path, monkeypatch):
+    _isolate_postgres_env(monkeypatch)
+    inv = _Invocation()
+    _record_migrate_env(inv)
+    client = MagicMock()
+    client.call.return_value = [
+        {
+            "name": "postgres",
+            "display_name": "PostgreSQL",
+            "port": 5432,
+            "env": {"POSTGRES_PORT": "5432"},
+        },
+        {
+            "name": "pgbouncer",
+            "display_name": "PgBouncer",
+            "port": 6432,
+            "env": POOLER_ENV,
+        },
+    ]
+    with patch("djdevx.dev.start.DaemonClient.connect", return_value=client):
+        result = inv.invoke(tmp_path, monkeypatch)
+        env = {key: os.environ.get(key) for key in POOLER_ENV}
+    assert result.exit_code == 0
+    assert ("migrate_env", "5432", None) in inv.log
+    assert env == POOLER_ENV
@@ -0,0 +1,110 @@
+"""Tests for ddx dev test — parallel tests on per-worker databases."""
+
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from djdevx.main import app
+from djdevx.utils.services import PostgresService
+
+runner = CliRunner()
+
+
+def _invoke(
+    tmp_path,
+    monkeypatch,
+    args,
+    service,
+    provisioned=True,
+    installed=("pytest-django", "pytest-xdist"),
+):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "djdevx.toml").write_text("")
+    with (
+        patch("djdevx.dev.test.resolve_database_dev_service", return_value=service),
+        patch("djdevx.dev.test.PixiRunner") as pixi_cls,
+        patch("djdevx.dev.test.WorkerDatabases") as databases_cls,
+    ):
+        pixi = pixi_cls.return_value
+        pixi.run_interactive.return_value = MagicMock(returncode=0)
+        pixi.has_dependency.side_effect = lambda name: name in installed
+        databases_cls.return_value.provision.return_value = provisioned
+        result = runner.invoke(app, ["dev", "test", *args])
+    return result, pixi, databases_cls
+
+
+def _postgres(is_up=True):
+    service = MagicMock(spec=PostgresService)
+    service.is_up.return_value = is_up
+    return service
+
+
+def test_runs_django_tests_in_parallel_with_keepdb(tmp_path, monkeypatch):
+    service = _postgres(is_up=False)
+    result, pixi, databases_cls = _invoke(
+        tmp_path, monkeypatch, ["-n", "4", "users"], service
+    )
+    assert result.exit_code == 0
+    service.up.assert_called_once()
+    service.is_up.assert_not_called()
+    service.export_connection_env.assert_called_once()
+    assert databases_cls.call_args.args[2:] == (4, "django")
+    pixi.run_interactive.assert_called_once_with(
+        "run", "python", "manage.py", "test", "--keepdb", "--parallel", "4", "users"
+    )
+
+
+def test_runs_pytest_with_reused_databases(tmp_path, monkeypatch):
+    result, pixi, databases_cls = _invoke(
+        tmp_path,
+        monkeypatch,
+        ["-n", "2", "--runner", "pytest", "--rebuild"],
+        _postgres(),
+        provisioned=False,
+    )
+    assert result.exit_code == 0
+    databases_cls.return_value.provision.assert_called_once_with(True)
+    assert "reusing the test databases" in result.output
+    pixi.run_interactive.assert_called_once_with(
+        "run", "pytest", "-n", "2", "--reuse-db"
+    )
+
+
+def test_exit_code_follows_test_run(tmp_path, monkeypatch):
+    service = _postgres()
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "djdevx.toml").write_text("")
+    with (
+        patch("djdevx.dev.test.resolve_database_dev_service", return_value=service),
+        patch("djdevx.dev.test.PixiRunner") as pixi_cls,
+        patch("djdevx.dev.test.WorkerDatabases"),
+    ):
+        pixi_cls.return_value.run_interactive.return_value = MagicMock(returncode=3)
+        result = runner.invoke(app, ["dev", "test", "-n", "1"])
+    assert result.exit_code == 3
+
+
+def test_needs_postgres(tmp_path, monkeypatch):
+    result, _, _ = _invoke(tmp_path, monkeypatch, [], None)
+    assert result.exit_code == 1
+    assert "need the postgres database" in result.output
+
+
+def test_rejects_unknown_runner(tmp_path, monkeypatch):
+    result, _, _ = _invoke(tmp_path, monkeypatch, ["--runner", "nose"], _postgres())
+    assert result.exit_code == 1
+
+
+def test_pytest_runner_requires_its_plugins(tmp_path, monkeypatch):
+    service = _postgres(is_up=False)
+    result, pixi, databases_cls = _invoke(
+        tmp_path,
+        monkeypatch,
+        ["--runner", "pytest"],
+        service,
+        installed=("pytest-django",),
+    )
+    assert result.exit_code == 1
+    assert "pytest-xdist" in result.output
+    service.up.assert_not_called()
+    pixi.run_interactive.assert_not_called()
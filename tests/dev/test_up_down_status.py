@@ -21,6 +21,7 @@ def _make_db(is_up=False):
     db.display_name = "PostgreSQL"
     db.name = "postgres"
     db.is_up.return_value = is_up
+    db.up.return_value = not is_up
     return db
 
 
@@ -29,6 +30,7 @@ def _make_cache(is_up=False):
     cache.display_name = "Redis"
     cache.name = "redis"
     cache.is_up.return_value = is_up
+    cache.up.return_value = not is_up
     return cache
 
 
@@ -57,7 +59,7 @@ def test_up_starts_all_down_services(tmp_path, monkeypatch):
     cache.up.assert_called_once()
 
 
-def test_up_skips_running_services(tmp_path, monkeypatch):
+def test_up_reports_running_services(tmp_path, monkeypatch):
     db = _make_db(is_up=True)
     cache = _make_cache(is_up=True)
     _project(tmp_path, monkeypatch)
@@ -73,8 +75,10 @@ def test_up_skips_running_services(tmp_path, monkeypatch):
     ):
         result = runner.invoke(app, ["dev", "up"])
     assert result.exit_code == 0
-    db.up.assert_not_called()
-    cache.up.assert_not_called()
+    db.is_up.assert_not_called()
+    cache.is_up.assert_not_called()
+    assert "PostgreSQL is already running" in result.output
+    assert "Redis is already running" in result.output
 
 
 # ---------------------------------------------------------------------------
@@ -132,3 +136,86 @@ def test_status_shows_state_and_settings(tmp_path, monkeypatch):
     assert "Redis" in result.output
     list_secrets.assert_called_once_with(DEV)
     list_configs.assert_called_once_with(DEV)
+
+
+# ---------------------------------------------------------------------------
+# with the dev daemon running
+# ---------------------------------------------------------------------------
+
+
+def _daemon_client(result):
+    client = MagicMock()
+    client.call.return_value = result
+    return patch("djdevx.utils.services.DaemonClient.connect", return_value=client)
+
+
+def test_up_goes_through_daemon(tmp_path, monkeypatch):
+    _project(tmp_path, monkeypatch)
+    reply = [{"display_name": "PostgreSQL", "started": True}]
+    with (
+        _daemon_client(reply) as connect,
+        patch("djdevx.dev.up.resolve_dev_services") as resolve,
+    ):
+        result = runner.invoke(app, ["dev", "up"])
+    assert result.exit_code == 0
+    connect.return_value.call.assert_called_once_with("up")
+    resolve.assert_not_called()
+    assert "PostgreSQL started" in result.output
+
+
+def test_down_goes_through_daemon(tmp_path, monkeypatch):
+    _project(tmp_path, monkeypatch)
+    reply = [{"display_name": "Redis", "stopped": True}]
+    with (
+        _daemon_client(reply) as connect,
+        patch("djdevx.dev.down.resolve_dev_services") as resolve,
+    ):
+        result = runner.invoke(app, ["dev", "down"])
+    assert result.exit_code == 0
+    connect.return_value.call.assert_called_once_with("down")
+    resolve.assert_not_called()
+    assert "Redis stopped" in result.output
+
+
+def test_status_reads_services_from_daemon(tmp_path, monkeypatch):
+    _project(tmp_path, monkeypatch)
+    reply = {
+        "pid": 4242,
+        "services": [{"up": True, "display_name": "PostgreSQL", "name": "postgres"}],
+    }
+    with (
+        _daemon_client(reply),
+        patch("djdevx.dev.status.resolve_dev_services") as resolve,
+        patch("djdevx.dev.status.PixiRunner"),
+        patch.object(ManageCommands, "migrations_pending", return_value=False),
+        patch("djdevx.dev.status.list_secrets"),
+        patch("djdevx.dev.status.list_configs"),
+    ):
+        result = runner.invoke(app, ["dev", "status"])
+    assert result.exit_code == 0
+    resolve.assert_not_called()
+    assert "pid 4242" in result.output
+    assert "PostgreSQL" in result.output
+
+
+def test_status_skips_migration_check_while_db_is_down(tmp_path, monkeypatch):
+    db = _make_db(is_up=False)
+    _project(tmp_path, monkeypatch)
+    with (
+        patch(
+            "djdevx.utils.services.resolver.resolve_database_dev_service",
+            return_value=db,
+        ),
+        patch(
+            "djdevx.utils.services.resolver.resolve_cache_dev_service",
+            return_value=None,
+        ),
+        patch("djdevx.dev.status.PixiRunner"),
+        patch.object(ManageCommands, "migrations_pending") as migrations_pending,
+        patch("djdevx.dev.status.list_secrets"),
+        patch("djdevx.dev.status.list_configs"),
+    ):
+        result = runner.invoke(app, ["dev", "status"])
+    assert result.exit_code == 0
+    assert "database is not running" in result.output
+    migrations_pending.assert_not_called()
@@ -12,6 +12,7 @@ from djdevx.utils.installable.types import (
     Variant,
 )
 from djdevx.utils.tracking import Section
+from djdevx.utils.templates.manager import CopyReport
 from djdevx.utils.types.pixi_types import PixiPackageSpec
 
 
@@ -108,8 +109,8 @@ class TestHookOrdering:
             patch("djdevx.utils.installable.tracking.ProjectTracking"),
         ):
             mock_add.side_effect = lambda *a, **kw: call_order.append("pixi_add_all")
-            mock_copy.side_effect = lambda self, variant: call_order.append(
-                "copy_templates"
+            mock_copy.side_effect = lambda self, variant: (
+                call_order.append("copy_templates") or CopyReport()
             )
             mock_gen.side_effect = lambda installable, variant: call_order.append(
                 "gen_secrets"
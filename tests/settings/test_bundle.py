@@ -0,0 +1,130 @@
+"""Tests for the compiled settings bundle and ``ddx settings bundle``."""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from djdevx.main import app
+
+runner = CliRunner()
+
+TEMPLATES = Path(__file__).parents[2] / "djdevx" / "new" / "templates" / "settings"
+
+
+# ── settings/utils/bundle.py (generated project) ───────────────────────────────
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A minimal generated project: the real loader plus three settings files."""
+    settings = tmp_path / "settings"
+    (settings / "utils").mkdir(parents=True)
+    shutil.copy(TEMPLATES / "__init__.py", settings / "__init__.py")
+    shutil.copy(TEMPLATES / "utils" / "bundle.py", settings / "utils" / "bundle.py")
+    (settings / "utils" / "__init__.py").write_text("")
+    for section in ("django", "packages", "apps"):
+        (settings / section).mkdir()
+        (settings / section / "__init__.py").write_text("")
+    (settings / "django" / "base.py").write_text("ORDER = ['django']\n")
+    (settings / "packages" / "b.py").write_text("ORDER.append('packages/b')\n")
+    (settings / "packages" / "a.py").write_text("ORDER.append('packages/a')\n")
+    (settings / "apps" / "app.py").write_text("ORDER.append('apps')\n")
+    return tmp_path
+
+
+def _python(project, *args, write_bytecode=True):
+    env = {"PATH": "/usr/bin:/bin", "PYTHONPATH": str(project)}
+    if not write_bytecode:
+        env["PYTHONDONTWRITEBYTECODE"] = "1"
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=project,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
+def _order(project, **kwargs):
+    result = _python(project, "-c", "import settings; print(settings.ORDER)", **kwargs)
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip()
+
+
+def _bundles(project):
+    return list((project / "settings" / "__pycache__").glob("bundle.*.bin"))
+
+
+def test_settings_run_in_section_then_name_order(project):
+    expected = "['django', 'packages/a', 'packages/b', 'apps']"
+    assert _order(project) == expected
+    assert len(_bundles(project)) == 1
+    assert _order(project) == expected  # from the bundle
+
+
+def test_bundle_is_rebuilt_when_a_settings_file_changes(project):
+    _order(project)
+    (project / "settings" / "apps" / "app.py").write_text("ORDER.append('edited')\n")
+    assert _order(project) == "['django', 'packages/a', 'packages/b', 'edited']"
+    (project / "settings" / "apps" / "extra.py").write_text("ORDER.append('new')\n")
+    assert "'new'" in _order(project)
+
+
+def test_bundle_is_not_written_without_bytecode(project):
+    _order(project, write_bytecode=False)
+    assert _bundles(project) == []
+
+
+def test_script_writes_and_checks_the_bundle(project):
+    script = "settings/utils/bundle.py"
+    assert _python(project, script, "--check").returncode == 1
+    result = _python(project, script, write_bytecode=False)
+    assert result.returncode == 0
+    assert "Compiled 4 settings files" in result.stdout
+    assert _python(project, script, "--check").returncode == 0
+    (project / "settings" / "django" / "base.py").write_text("ORDER = []\n")
+    assert _python(project, script, "--check").returncode == 1
+
+
+# ── ddx settings bundle ────────────────────────────────────────────────────────
+
+
+def _invoke(root, monkeypatch, args, returncode=0, stdout="Compiled 4 settings"):
+    monkeypatch.chdir(root)
+    (root / "djdevx.toml").write_text("")
+    with patch("djdevx.settings.bundle.PixiRunner") as pixi_cls:
+        pixi = pixi_cls.return_value
+        pixi.run_pixi_command.return_value = MagicMock(
+            returncode=returncode, stdout=stdout, stderr=""
+        )
+        result = runner.invoke(app, ["settings", "bundle", *args])
+    return result, pixi
+
+
+def test_bundle_command_runs_the_script_in_pixi(project, monkeypatch):
+    result, pixi = _invoke(project, monkeypatch, [])
+    assert result.exit_code == 0
+    assert pixi.run_pixi_command.call_args.args == (
+        "run",
+        "python",
+        "settings/utils/bundle.py",
+    )
+
+
+def test_bundle_check_fails_when_stale(project, monkeypatch):
+    result, pixi = _invoke(
+        project, monkeypatch, ["--check"], returncode=1, stdout="stale"
+    )
+    assert result.exit_code == 1
+    assert pixi.run_pixi_command.call_args.args[-1] == "--check"
+
+
+def test_bundle_command_needs_the_loader(tmp_path, monkeypatch):
+    result, pixi = _invoke(tmp_path, monkeypatch, [])
+    assert result.exit_code == 1
+    pixi.run_pixi_command.assert_not_called()
@@ -2,13 +2,16 @@
 
 import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from dotenv import set_key
 
+from djdevx.settings import source
 from djdevx.settings.source import (
     ConfigSource,
+    ResolutionContext,
     SecretSource,
     read_env_file,
     read_dot_env,
@@ -118,7 +121,7 @@ class TestResolveConfigSourceDev:
     ) -> None:
         os.environ["TEST_VAR"] = "from_env"
         try:
-            src = resolve_config_source_dev(config_var, backend_root)
+            src = resolve_config_source_dev(config_var, ResolutionContext(backend_root))
             assert src == ConfigSource.OS_ENVIRON
         finally:
             del os.environ["TEST_VAR"]
@@ -127,20 +130,20 @@ class TestResolveConfigSourceDev:
         self, backend_root: Path, config_var: ConfigVarInfo
     ) -> None:
         set_key(backend_root / ".env", "TEST_VAR", "from_dotenv")
-        src = resolve_config_source_dev(config_var, backend_root)
+        src = resolve_config_source_dev(config_var, ResolutionContext(backend_root))
         assert src == ConfigSource.DOT_ENV
 
     def test_dev_default_fallback(
         self, backend_root: Path, config_var: ConfigVarInfo
     ) -> None:
-        src = resolve_config_source_dev(config_var, backend_root)
+        src = resolve_config_source_dev(config_var, ResolutionContext(backend_root))
         assert src == ConfigSource.DEV_DEFAULT
 
     def test_missing_when_no_dev_default(self, backend_root: Path) -> None:
         config_var = ConfigVarInfo(
             name="required", source_file=Path("x.py"), dev_default=None
         )
-        src = resolve_config_source_dev(config_var, backend_root)
+        src = resolve_config_source_dev(config_var, ResolutionContext(backend_root))
         assert src == ConfigSource.MISSING
 
     def test_os_environ_overrides_dot_env(
@@ -149,7 +152,7 @@ class TestResolveConfigSourceDev:
         set_key(backend_root / ".env", "TEST_VAR", "from_dotenv")
         os.environ["TEST_VAR"] = "from_env"
         try:
-            src = resolve_config_source_dev(config_var, backend_root)
+            src = resolve_config_source_dev(config_var, ResolutionContext(backend_root))
             assert src == ConfigSource.OS_ENVIRON
         finally:
             del os.environ["TEST_VAR"]
@@ -164,7 +167,9 @@ class TestResolveConfigSourceProd:
     ) -> None:
         os.environ["TEST_VAR"] = "from_env"
         try:
-            src = resolve_config_source_prod(config_var, backend_root)
+            src = resolve_config_source_prod(
+                config_var, ResolutionContext(backend_root)
+            )
             assert src == ConfigSource.OS_ENVIRON
         finally:
             del os.environ["TEST_VAR"]
@@ -173,20 +178,20 @@ class TestResolveConfigSourceProd:
         self, backend_root: Path, config_var: ConfigVarInfo
     ) -> None:
         set_key(backend_root / ".env.prod", "TEST_VAR", "from_envprod")
-        src = resolve_config_source_prod(config_var, backend_root)
+        src = resolve_config_source_prod(config_var, ResolutionContext(backend_root))
         assert src == ConfigSource.ENV_PROD
 
     def test_prod_default_fallback(
         self, backend_root: Path, config_var: ConfigVarInfo
     ) -> None:
-        src = resolve_config_source_prod(config_var, backend_root)
+        src = resolve_config_source_prod(config_var, ResolutionContext(backend_root))
         assert src == ConfigSource.PROD_DEFAULT
 
     def test_missing_when_no_prod_default(self, backend_root: Path) -> None:
         config_var = ConfigVarInfo(
             name="required", source_file=Path("x.py"), prod_default=None
         )
-        src = resolve_config_source_prod(config_var, backend_root)
+        src = resolve_config_source_prod(config_var, ResolutionContext(backend_root))
         assert src == ConfigSource.MISSING
 
     def test_os_environ_overrides_env_prod(
@@ -195,7 +200,9 @@ class TestResolveConfigSourceProd:
         set_key(backend_root / ".env.prod", "TEST_VAR", "from_envprod")
         os.environ["TEST_VAR"] = "from_env"
         try:
-            src = resolve_config_source_prod(config_var, backend_root)
+            src = resolve_config_source_prod(
+                config_var, ResolutionContext(backend_root)
+            )
             assert src == ConfigSource.OS_ENVIRON
         finally:
             del os.environ["TEST_VAR"]
@@ -210,7 +217,7 @@ class TestResolveConfigValueDev:
     ) -> None:
         os.environ["TEST_VAR"] = "env_value"
         try:
-            val = resolve_config_value_dev(config_var, backend_root)
+            val = resolve_config_value_dev(config_var, ResolutionContext(backend_root))
             assert val == "env_value"
         finally:
             del os.environ["TEST_VAR"]
@@ -219,20 +226,20 @@ class TestResolveConfigValueDev:
         self, backend_root: Path, config_var: ConfigVarInfo
     ) -> None:
         set_key(backend_root / ".env", "TEST_VAR", "dotenv_value")
-        val = resolve_config_value_dev(config_var, backend_root)
+        val = resolve_config_value_dev(config_var, ResolutionContext(backend_root))
         assert val == "dotenv_value"
 
     def test_returns_dev_default(
         self, backend_root: Path, config_var: ConfigVarInfo
     ) -> None:
-        val = resolve_config_value_dev(config_var, backend_root)
+        val = resolve_config_value_dev(config_var, ResolutionContext(backend_root))
         assert val == "dev_fallback"
 
     def test_returns_none_when_missing(self, backend_root: Path) -> None:
         config_var = ConfigVarInfo(
             name="missing", source_file=Path("x.py"), dev_default=None
         )
-        val = resolve_config_value_dev(config_var, backend_root)
+        val = resolve_config_value_dev(config_var, ResolutionContext(backend_root))
         assert val is None
 
 
@@ -245,7 +252,7 @@ class TestResolveConfigValueProd:
     ) -> None:
         os.environ["TEST_VAR"] = "env_value"
         try:
-            val = resolve_config_value_prod(config_var, backend_root)
+            val = resolve_config_value_prod(config_var, ResolutionContext(backend_root))
             assert val == "env_value"
         finally:
             del os.environ["TEST_VAR"]
@@ -254,20 +261,20 @@ class TestResolveConfigValueProd:
         self, backend_root: Path, config_var: ConfigVarInfo
     ) -> None:
         set_key(backend_root / ".env.prod", "TEST_VAR", "prod_value")
-        val = resolve_config_value_prod(config_var, backend_root)
+        val = resolve_config_value_prod(config_var, ResolutionContext(backend_root))
         assert val == "prod_value"
 
     def test_returns_prod_default(
         self, backend_root: Path, config_var: ConfigVarInfo
     ) -> None:
-        val = resolve_config_value_prod(config_var, backend_root)
+        val = resolve_config_value_prod(config_var, ResolutionContext(backend_root))
         assert val == "prod_fallback"
 
     def test_returns_none_when_missing(self, backend_root: Path) -> None:
         config_var = ConfigVarInfo(
             name="missing", source_file=Path("x.py"), prod_default=None
         )
-        val = resolve_config_value_prod(config_var, backend_root)
+        val = resolve_config_value_prod(config_var, ResolutionContext(backend_root))
         assert val is None
 
 
@@ -280,18 +287,18 @@ class TestResolveSecretSourceDev:
     ) -> None:
         (backend_root / ".secrets").mkdir()
         (backend_root / ".secrets" / "test_secret").write_text("sensitive")
-        src = resolve_secret_source_dev(secret_info, backend_root)
+        src = resolve_secret_source_dev(secret_info, ResolutionContext(backend_root))
         assert src == ".secrets/test_secret"
 
     def test_dev_default_fallback(
         self, backend_root: Path, secret_info: SecretInfo
     ) -> None:
-        src = resolve_secret_source_dev(secret_info, backend_root)
+        src = resolve_secret_source_dev(secret_info, ResolutionContext(backend_root))
         assert src == SecretSource.DEV_DEFAULT
 
     def test_missing_when_no_dev_default(self, backend_root: Path) -> None:
         si = SecretInfo(name="required", source_file=Path("x.py"), dev_default=None)
-        src = resolve_secret_source_dev(si, backend_root)
+        src = resolve_secret_source_dev(si, ResolutionContext(backend_root))
         assert src == SecretSource.MISSING
 
     def test_secrets_takes_priority_over_default(
@@ -299,7 +306,7 @@ class TestResolveSecretSourceDev:
     ) -> None:
         (backend_root / ".secrets").mkdir()
         (backend_root / ".secrets" / "test_secret").write_text("sensitive")
-        src = resolve_secret_source_dev(secret_info, backend_root)
+        src = resolve_secret_source_dev(secret_info, ResolutionContext(backend_root))
         assert src == ".secrets/test_secret"
 
 
@@ -312,16 +319,64 @@ class TestResolveSecretSourceProd:
     ) -> None:
         (backend_root / ".secrets.prod").mkdir()
         (backend_root / ".secrets.prod" / "test_secret").write_text("sensitive")
-        src = resolve_secret_source_prod(secret_info, backend_root)
+        src = resolve_secret_source_prod(secret_info, ResolutionContext(backend_root))
         assert src == ".secrets.prod/test_secret"
 
     def test_prod_default_fallback(self, backend_root: Path) -> None:
         si = SecretInfo(name="sec", source_file=Path("x.py"), prod_default="fallback")
-        src = resolve_secret_source_prod(si, backend_root)
+        src = resolve_secret_source_prod(si, ResolutionContext(backend_root))
         assert src == SecretSource.PROD_DEFAULT
 
     def test_missing_when_no_prod_default(
         self, backend_root: Path, secret_info: SecretInfo
     ) -> None:
-        src = resolve_secret_source_prod(secret_info, backend_root)
+        src = resolve_secret_source_prod(secret_info, ResolutionContext(backend_root))
         assert src == SecretSource.MISSING
+
+
+# ── ResolutionContext ──────────────────────────────────────────────────────────
+
+
+class TestResolutionContext:
+    def test_env_file_is_read_once_for_all_vars(self, backend_root: Path) -> None:
+        set_key(backend_root / ".env", "A", "1")
+        set_key(backend_root / ".env", "B", "2")
+        ctx = ResolutionContext(backend_root)
+        names = ["a", "b", "c"]
+        with patch.object(
+            source, "read_env_file", wraps=source.read_env_file
+        ) as mock_read:
+            values = [
+                resolve_config_value_dev(
+                    ConfigVarInfo(name=n, source_file=Path("x.py")), ctx
+                )
+                for n in names
+            ]
+            sources = [
+                resolve_config_source_dev(
+                    ConfigVarInfo(name=n, source_file=Path("x.py")), ctx
+                )
+                for n in names
+            ]
+        assert values == ["1", "2", None]
+        assert sources == [
+            ConfigSource.DOT_ENV,
+            ConfigSource.DOT_ENV,
+            ConfigSource.MISSING,
+        ]
+        mock_read.assert_called_once_with(backend_root / ".env")
+
+    def test_secret_dirs_are_listed_once(self, backend_root: Path) -> None:
+        (backend_root / ".secrets").mkdir()
+        (backend_root / ".secrets" / "one").write_text("x")
+        ctx = ResolutionContext(backend_root)
+        with patch.object(source, "_list_dir", wraps=source._list_dir) as mock_list:
+            for name in ("one", "two", "three"):
+                resolve_secret_source_dev(
+                    SecretInfo(name=name, source_file=Path("x.py")), ctx
+                )
+        assert ctx.dev_secrets == {"one"}
+        assert mock_list.call_count == 2  # .secrets and /run/secrets
+
+    def test_missing_secret_dir_is_empty(self, backend_root: Path) -> None:
+        assert ResolutionContext(backend_root).prod_secrets == frozenset()
@@ -1,6 +1,9 @@
+import importlib.util
 import re
 from pathlib import Path
 import tomllib
+
+import pytest
 from typer.testing import CliRunner
 from djdevx.main import app
 
@@ -236,3 +239,85 @@ def test_new_django_backend(temp_dir):
     assert djade_hook["id"] == "djade"
     assert "args" in djade_hook
     assert "--target-version" in djade_hook["args"]
+
+
+def test_new_rejects_unknown_server(temp_dir):
+    result = runner.invoke(
+        app,
+        [
+            "new",
+            "--project-name",
+            "my_django_project",
+            "--project-description",
+            "A sample Django backend project",
+            "--project-directory",
+            str(temp_dir),
+            "--python-version",
+            "3.14",
+            "--server",
+            "waitress",
+            "--no-git-init",
+        ],
+    )
+    assert result.exit_code == 1
+    assert "waitress" in result.output
+    assert not (temp_dir / "pyproject.toml").exists()
+
+
+# ── docker/serve.py (generated project) ────────────────────────────────────────
+
+SERVE_PY = Path(__file__).parents[1] / "djdevx" / "new" / "templates" / "docker"
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """The production server launcher, with a 4 CPU / 2 GiB container."""
+    spec = importlib.util.spec_from_file_location("serve", SERVE_PY / "serve.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+    monkeypatch.setattr(module, "cpu_limit", lambda: 4)
+    monkeypatch.setattr(module, "memory_limit", lambda: 2 * 1024**3)
+    return module
+
+
+def test_serve_workers_follow_cpu_limit(serve):
+    assert serve.worker_count({}) == 4
+
+
+def test_serve_workers_capped_by_memory(serve):
+    assert serve.worker_count({"worker_memory_mb": 1024}) == 2
+    assert serve.worker_count({"worker_memory_mb": 4096}) == 1
+
+
+def test_serve_workers_without_memory_limit(serve, monkeypatch):
+    monkeypatch.setattr(serve, "memory_limit", lambda: None)
+    assert serve.worker_count({"worker_memory_mb": 4096}) == 4
+
+
+def test_serve_explicit_workers(serve, monkeypatch):
+    assert serve.worker_count({"workers": 9}) == 9
+    monkeypatch.setenv("WEB_CONCURRENCY", "3")
+    assert serve.worker_count({"workers": 9}) == 3
+
+
+def test_serve_read_config(serve, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert serve.read_config() == {}
+    (tmp_path / "djdevx.toml").write_text('[server]\nprofile = "granian"\n')
+    assert serve.read_config() == {"profile": "granian"}
+
+
+@pytest.mark.parametrize(
+    "profile, expected",
+    [
+        ("uvicorn", ["uvicorn", "applications.asgi:application", "--workers", "2"]),
+        ("gunicorn", ["gunicorn", "--worker-class", "uvicorn_worker.UvicornWorker"]),
+        ("granian", ["granian", "--interface", "asgi", "--workers", "2"]),
+    ],
+)
+def test_serve_server_command(serve, profile, expected):
+    command = serve.server_command(profile, 2, "0.0.0.0", 8000)
+    assert command[0] == profile
+    assert all(arg in command for arg in expected)
+    assert "applications.asgi:application" in command
@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from djdevx.utils.tracking import ProjectTracking, Section
+from djdevx.utils.tracking import ProjectTracking, Section, tracking_session
 
 SECTIONS = [Section.CACHE, Section.FEATURES, Section.DATABASE, Section.PACKAGES]
 
@@ -176,6 +176,36 @@ class TestGetVariants:
         assert project.get_variants(section, "redis") == ["base", "mfa"]
 
 
+# ── dev_config ────────────────────────────────────────────────────────────────
+
+
+class TestDevConfig:
+    """Tests for ProjectTracking.dev_config."""
+
+    def test_empty_without_dev_section(self, project: ProjectTracking) -> None:
+        assert project.dev_config("postgres") == {}
+
+    def test_returns_plain_values(self, tmp_path: Path) -> None:
+        (tmp_path / "djdevx.toml").write_text(
+            '[dev.postgres]\nprofile = "fast"\n\n'
+            '[dev.postgres.settings]\nwork_mem = "64MB"\n'
+        )
+        config = ProjectTracking(tmp_path).dev_config("postgres")
+        assert config == {"profile": "fast", "settings": {"work_mem": "64MB"}}
+        assert type(config["settings"]) is dict
+        assert ProjectTracking(tmp_path).dev_config("redis") == {}
+
+    def test_set_and_remove(self, tmp_path: Path) -> None:
+        (tmp_path / "djdevx.toml").write_text('[dev.postgres]\nprofile = "fast"\n')
+        ProjectTracking(tmp_path).set_dev_config("pgbouncer", {"enabled": True})
+        project = ProjectTracking(tmp_path)
+        assert project.dev_config("pgbouncer") == {"enabled": True}
+        assert project.dev_config("postgres") == {"profile": "fast"}
+        project.remove_dev_config("pgbouncer")
+        project.remove_dev_config("postgres")
+        assert "dev" not in ProjectTracking(tmp_path).get_config()
+
+
 # ── persistence ───────────────────────────────────────────────────────────────
 
 
@@ -204,3 +234,55 @@ class TestPersistence:
         assert project.is_installed(Section.CACHE, "redis") is True
         assert project.is_installed(Section.DATABASE, "redis") is False
         assert project.is_installed(Section.DATABASE, "postgres") is True
+
+    def test_save_is_atomic_and_keeps_file_mode(self, tmp_path: Path) -> None:
+        djdevx = tmp_path / "djdevx.toml"
+        djdevx.write_text('project_name = "test"\n')
+        djdevx.chmod(0o640)
+        ProjectTracking(tmp_path).add(Section.CACHE, "redis", "Redis")
+        assert djdevx.stat().st_mode & 0o777 == 0o640
+        assert [p.name for p in tmp_path.iterdir()] == ["djdevx.toml"]
+
+    def test_concurrent_writer_changes_are_kept(self, tmp_path: Path) -> None:
+        djdevx = tmp_path / "djdevx.toml"
+        djdevx.write_text('project_name = "test"\n')
+        ours = ProjectTracking(tmp_path, autosave=False)
+        ours.add(Section.CACHE, "redis", "Redis")
+        ProjectTracking(tmp_path).add(Section.DATABASE, "postgres", "Postgres")
+        ours.save()
+        doc = tomllib.loads(djdevx.read_text())
+        assert "redis" in doc["cache"]
+        assert "postgres" in doc["database"]
+
+
+# ── tracking_session ───────────────────────────────────────────────────────────
+
+
+class TestTrackingSession:
+    """Tests for the shared, batched tracking session."""
+
+    def test_instances_share_one_document(self, tmp_path: Path) -> None:
+        (tmp_path / "djdevx.toml").write_text('project_name = "test"\n')
+        with tracking_session():
+            ProjectTracking(tmp_path).add(Section.CACHE, "redis", "Redis")
+            assert ProjectTracking(tmp_path).is_installed(Section.CACHE, "redis")
+
+    def test_saves_are_deferred_to_the_end(self, tmp_path: Path) -> None:
+        djdevx = tmp_path / "djdevx.toml"
+        djdevx.write_text('project_name = "test"\n')
+        with tracking_session():
+            ProjectTracking(tmp_path).add(Section.CACHE, "redis", "Redis")
+            ProjectTracking(tmp_path).add(Section.DATABASE, "postgres", "Postgres")
+            with tracking_session():
+                ProjectTracking(tmp_path).remove(Section.CACHE, "redis")
+            assert "database" not in tomllib.loads(djdevx.read_text())
+        doc = tomllib.loads(djdevx.read_text())
+        assert "postgres" in doc["database"]
+        assert "redis" not in doc["cache"]
+
+    def test_session_is_written_on_error(self, tmp_path: Path) -> None:
+        (tmp_path / "djdevx.toml").write_text('project_name = "test"\n')
+        with pytest.raises(RuntimeError), tracking_session():
+            ProjectTracking(tmp_path).add(Section.CACHE, "redis", "Redis")
+            raise RuntimeError
+        assert ProjectTracking(tmp_path).is_installed(Section.CACHE, "redis")
@@ -0,0 +1,39 @@
+"""Tests for ddx urls sync."""
+
+from typer.testing import CliRunner
+
+from djdevx.main import app
+
+runner = CliRunner()
+
+
+def _project(root):
+    (root / "djdevx.toml").write_text("")
+    (root / "urls" / "django").mkdir(parents=True)
+    (root / "urls" / "django" / "admin.py").write_text("urlpatterns = []\n")
+    return root / "urls" / "registry.py"
+
+
+def test_sync_creates_the_registry(tmp_path, monkeypatch):
+    registry = _project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(app, ["urls", "sync"])
+    assert result.exit_code == 0
+    assert '"urls.django.admin"' in registry.read_text()
+
+    result = runner.invoke(app, ["urls", "sync"])
+    assert result.exit_code == 0
+    assert "already up to date" in result.output
+
+
+def test_check_fails_on_a_stale_registry(tmp_path, monkeypatch):
+    registry = _project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    assert runner.invoke(app, ["urls", "sync", "--check"]).exit_code == 1
+    assert not registry.exists()
+
+    runner.invoke(app, ["urls", "sync"])
+    assert runner.invoke(app, ["urls", "sync", "--check"]).exit_code == 0
+
+    (tmp_path / "urls" / "django" / "media.py").write_text("urlpatterns = []\n")
+    assert runner.invoke(app, ["urls", "sync", "--check"]).exit_code == 1
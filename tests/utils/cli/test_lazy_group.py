@@ -0,0 +1,65 @@
+"""Tests for lazy sub-app loading of the ddx command tree."""
+
+import subprocess
+import sys
+
+from typer.testing import CliRunner
+
+from djdevx import __version__
+from djdevx.main import SUBCOMMANDS, app
+
+runner = CliRunner()
+
+
+def _modules_after(code: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys; print(*sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_importing_main_loads_no_sub_app():
+    modules = _modules_after("import djdevx.main")
+    assert not {path.partition(":")[0] for path, _ in SUBCOMMANDS.values()} & modules
+    assert "pydantic" not in modules
+
+
+def test_version_loads_only_its_own_sub_app():
+    modules = _modules_after(
+        "from djdevx.main import app\ntry:\n    app(['version'])\nexcept SystemExit:\n    pass"
+    )
+    assert "djdevx.version" in modules
+    assert "djdevx.packages" not in modules
+
+
+def test_help_lists_every_sub_app_with_its_help():
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    for name, sub in SUBCOMMANDS.items():
+        assert name in result.output
+        assert sub.help in result.output
+
+
+def test_invoking_a_sub_app_loads_it():
+    result = runner.invoke(app, ["version"])
+    assert result.exit_code == 0
+    assert __version__ in result.output
+
+
+def test_sub_app_help_keeps_parent_help_text():
+    result = runner.invoke(app, ["packages", "--help"])
+    assert result.exit_code == 0
+    assert "Manage Django packages" in result.output
+    assert "add" in result.output
+
+
+def test_registry_is_populated_on_first_lookup():
+    modules = _modules_after(
+        "from djdevx.packages._registry import PACKAGE_REGISTRY\n"
+        "assert PACKAGE_REGISTRY._entries == {}\n"
+        "assert PACKAGE_REGISTRY.get('whitenoise').__name__"
+    )
+    assert "djdevx.packages.whitenoise" in modules
@@ -7,17 +7,23 @@ from djdevx.utils.django.manage_commands import ManageCommands
 from djdevx.utils.project.pixi_runner import PixiRunner
 
 
+def _runner(project_root):
+    runner = MagicMock(spec=PixiRunner)
+    runner.project_root = project_root
+    return runner
+
+
 class TestRun:
-    def test_delegates_to_pixi_runner(self):
-        runner = MagicMock()
+    def test_delegates_to_pixi_runner(self, tmp_path):
+        runner = _runner(tmp_path)
         commands = ManageCommands(runner)
         commands.run("startapp", "myapp", check=False)
         runner.run_manage_command.assert_called_once_with(
             "startapp", "myapp", check=False
         )
 
-    def test_returns_completed_process(self):
-        runner = MagicMock()
+    def test_returns_completed_process(self, tmp_path):
+        runner = _runner(tmp_path)
         result = subprocess.CompletedProcess([], returncode=0)
         runner.run_manage_command.return_value = result
         commands = ManageCommands(runner)
@@ -25,8 +31,8 @@ class TestRun:
 
 
 class TestMigrationsPending:
-    def test_true_when_returncode_nonzero(self):
-        runner = MagicMock()
+    def test_true_when_returncode_nonzero(self, tmp_path):
+        runner = _runner(tmp_path)
         runner.run_manage_command.return_value = subprocess.CompletedProcess(
             [], returncode=1
         )
@@ -36,8 +42,8 @@ class TestMigrationsPending:
             "migrate", "--check", check=False
         )
 
-    def test_false_when_up_to_date(self):
-        runner = MagicMock()
+    def test_false_when_up_to_date(self, tmp_path):
+        runner = _runner(tmp_path)
         runner.run_manage_command.return_value = subprocess.CompletedProcess(
             [], returncode=0
         )
@@ -57,3 +63,39 @@ class TestWithRealRunner:
     def test_accepts_pixi_runner(self, tmp_path):
         commands = ManageCommands(PixiRunner(project_root=tmp_path))
         assert commands._runner.project_root == tmp_path
+
+
+class TestMigrationStateCache:
+    @staticmethod
+    def _commands(tmp_path, returncode=0):
+        (tmp_path / "djdevx.toml").write_text("")
+        runner = _runner(tmp_path)
+        runner.run_manage_command.return_value = subprocess.CompletedProcess(
+            [], returncode=returncode
+        )
+        return ManageCommands(runner), runner
+
+    def test_clean_check_is_recorded_and_skipped_next_time(self, tmp_path):
+        commands, runner = self._commands(tmp_path)
+        assert commands.migrations_pending() is False
+        assert ManageCommands(runner).migrations_pending() is False
+        runner.run_manage_command.assert_called_once_with(
+            "migrate", "--check", check=False
+        )
+
+    def test_pending_check_is_not_recorded(self, tmp_path):
+        commands, runner = self._commands(tmp_path, returncode=1)
+        assert commands.migrations_pending() is True
+        assert commands.migrations_pending() is True
+        assert runner.run_manage_command.call_count == 2
+
+    def test_migrate_records_state(self, tmp_path):
+        commands, runner = self._commands(tmp_path)
+        commands.migrate()
+        runner.run_manage_command.assert_called_once_with("migrate", check=True)
+        assert commands.migrations_pending() is False
+        assert runner.run_manage_command.call_count == 1
+
+    def test_state_belongs_to_the_runner_project(self, tmp_path):
+        commands = ManageCommands(PixiRunner(project_root=tmp_path))
+        assert commands.migration_state.structure.root == tmp_path
@@ -0,0 +1,76 @@
+"""Tests for MigrationState — the migration-input fingerprint."""
+
+import os
+
+import pytest
+
+from djdevx.utils.django.migration_state import MigrationState
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "djdevx.toml").write_text("")
+    (tmp_path / "pixi.lock").write_text("version: 6\n")
+    (tmp_path / "settings" / "django").mkdir(parents=True)
+    (tmp_path / "settings" / "django" / "base.py").write_text("INSTALLED_APPS = []\n")
+    migrations = tmp_path / "users" / "migrations"
+    migrations.mkdir(parents=True)
+    (migrations / "0001_initial.py").write_text("# initial\n")
+    return tmp_path
+
+
+def _bump(path, content):
+    path.write_text(content)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_not_current_until_recorded(project):
+    state = MigrationState(project)
+    assert not state.is_current()
+    state.record()
+    assert state.is_current()
+    assert state.path == project / ".pixi" / "devdata" / "migration-state.json"
+
+
+def test_new_migration_invalidates(project):
+    state = MigrationState(project)
+    state.record()
+    (project / "users" / "migrations" / "0002_profile.py").write_text("# two\n")
+    assert not state.is_current()
+
+
+@pytest.mark.parametrize(
+    "rel", ["pixi.lock", ".env", "settings/django/base.py"], ids=str
+)
+def test_changed_inputs_invalidate(project, rel):
+    state = MigrationState(project)
+    state.record()
+    _bump(project / rel, "changed = True\n")
+    assert not state.is_current()
+
+
+def test_ignores_hidden_dirs_and_unrelated_files(project):
+    state = MigrationState(project)
+    state.record()
+    hidden = project / ".pixi" / "envs" / "default" / "app" / "migrations"
+    hidden.mkdir(parents=True)
+    (hidden / "0001_initial.py").write_text("")
+    (project / "users" / "models.py").write_text("class User: ...\n")
+    assert state.is_current()
+
+
+def test_clear_forces_a_check(project):
+    state = MigrationState(project)
+    state.record()
+    state.clear()
+    assert not state.is_current()
+
+
+@pytest.mark.parametrize("key", ["POSTGRES_PORT", "POSTGRES_SERVER", "REDIS_SOCKET"])
+def test_connection_env_change_invalidates(project, monkeypatch, key):
+    monkeypatch.delenv(key, raising=False)
+    state = MigrationState(project)
+    state.record()
+    monkeypatch.setenv(key, "/tmp/other")
+    assert not state.is_current()
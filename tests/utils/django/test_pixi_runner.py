@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from djdevx.utils.project.pixi_runner import PixiRunner
+from djdevx.utils.types.pixi_types import PixiPackageSpec
 
 
 # ---------------------------------------------------------------------------
@@ -267,6 +268,78 @@ class TestRemovePackage:
             mock_remove.assert_called_once_with("numpy", "dev")
 
 
+# ---------------------------------------------------------------------------
+# add_package_specs / remove_package_specs_if_exist
+# ---------------------------------------------------------------------------
+
+
+class TestAddPackageSpecs:
+    def test_single_invocation_for_group(self):
+        runner = PixiRunner(project_root=Path("/tmp"))
+        specs = [
+            PixiPackageSpec("django-filter", kind="pypi"),
+            PixiPackageSpec("django-taggit", kind="pypi"),
+        ]
+        with patch.object(runner, "run_pixi_command") as mock_run:
+            runner.add_package_specs(specs, pixi_feature="dev")
+            mock_run.assert_called_once_with(
+                "add",
+                "--pypi",
+                "django-filter",
+                "django-taggit",
+                "--feature",
+                "dev",
+            )
+
+    def test_conda_group(self):
+        runner = PixiRunner(project_root=Path("/tmp"))
+        specs = [PixiPackageSpec("postgresql"), PixiPackageSpec("redis-server")]
+        with patch.object(runner, "run_pixi_command") as mock_run:
+            runner.add_package_specs(specs)
+            mock_run.assert_called_once_with("add", "postgresql", "redis-server")
+
+    def test_empty_is_noop(self):
+        runner = PixiRunner(project_root=Path("/tmp"))
+        with patch.object(runner, "run_pixi_command") as mock_run:
+            assert runner.add_package_specs([]) is None
+            mock_run.assert_not_called()
+
+    def test_mixed_kinds_rejected(self):
+        runner = PixiRunner(project_root=Path("/tmp"))
+        specs = [PixiPackageSpec("a"), PixiPackageSpec("b", kind="pypi")]
+        with pytest.raises(ValueError):
+            runner.add_package_specs(specs)
+
+
+class TestRemovePackageSpecsIfExist:
+    def test_strips_versions_in_single_invocation(self):
+        runner = PixiRunner(project_root=Path("/tmp"))
+        specs = [
+            PixiPackageSpec("django-allauth<66", kind="pypi"),
+            PixiPackageSpec("django-anymail[brevo]", kind="pypi"),
+        ]
+        with patch.object(runner, "run_pixi_command") as mock_run:
+            runner.remove_package_specs_if_exist(specs)
+            mock_run.assert_called_once_with(
+                "remove", "--pypi", "django-allauth", "django-anymail"
+            )
+
+    def test_falls_back_to_one_by_one(self):
+        runner = PixiRunner(project_root=Path("/tmp"))
+        specs = [PixiPackageSpec("present"), PixiPackageSpec("absent")]
+        with (
+            patch.object(
+                runner,
+                "run_pixi_command",
+                side_effect=subprocess.CalledProcessError(1, "pixi"),
+            ),
+            patch.object(runner, "remove_package_spec_if_exists") as mock_single,
+        ):
+            runner.remove_package_specs_if_exist(specs, pixi_feature="dev")
+            assert mock_single.call_count == 2
+            mock_single.assert_any_call(specs[1], pixi_feature="dev")
+
+
 # ---------------------------------------------------------------------------
 # list_dependencies
 # ---------------------------------------------------------------------------
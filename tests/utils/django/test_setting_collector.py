@@ -2,7 +2,9 @@
 
 import ast
 from pathlib import Path
+from unittest.mock import patch
 
+from djdevx.utils.project import setting_collector
 from djdevx.utils.project.setting_collector import (
     _extract_class_default,
     _extract_defaults,
@@ -12,6 +14,7 @@ from djdevx.utils.project.setting_collector import (
     ConfigVarInfo,
     SettingCollector,
     CollectedSettings,
+    ParseCache,
 )
 
 
@@ -583,3 +586,128 @@ class MySettings(AppBaseSettings):
         assert cfg["debug"].has_class_default is True
         assert cfg["csp_default_src"].has_class_default is True
         assert cfg["secret_key_missing"].has_class_default is False
+
+
+# ── ParseCache ─────────────────────────────────────────────────────────────────
+
+SETTINGS_SOURCE = """
+from pydantic import SecretStr
+from settings.utils.base_settings import AppBaseSettings
+
+class MySettings(AppBaseSettings):
+    {field}: SecretStr
+    debug: bool = True
+
+    @classmethod
+    def get_dev_defaults(cls):
+        return {{"debug": (1, 2)}}
+"""
+
+
+class TestParseCache:
+    """Tests for the mtime-keyed parse cache and parallel parsing."""
+
+    def _write(self, path: Path, field: str = "api_key") -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(SETTINGS_SOURCE.format(field=field))
+        return path
+
+    def test_unchanged_files_are_not_reparsed(self, tmp_path: Path) -> None:
+        self._write(tmp_path / "settings" / "apps" / "a.py")
+        self._write(tmp_path / "settings" / "apps" / "b.py", "token")
+        SettingCollector(tmp_path).collect()
+        ParseCache._instances.clear()  # force a reload from disk
+
+        with patch.object(
+            setting_collector,
+            "_parse_settings_file",
+            wraps=setting_collector._parse_settings_file,
+        ) as mock_parse:
+            result = SettingCollector(tmp_path).collect()
+        mock_parse.assert_not_called()
+        assert [s.name for s in result.secrets] == ["api_key", "token"]
+        assert result.config_vars[0].dev_default == (1, 2)
+
+    def test_changed_file_is_reparsed(self, tmp_path: Path) -> None:
+        settings_file = self._write(tmp_path / "settings" / "apps" / "a.py")
+        SettingCollector(tmp_path).collect()
+        self._write(settings_file, "renamed_secret_field")
+
+        result = SettingCollector(tmp_path).collect()
+        assert [s.name for s in result.secrets] == ["renamed_secret_field"]
+
+    def test_deleted_file_is_dropped(self, tmp_path: Path) -> None:
+        self._write(tmp_path / "settings" / "apps" / "a.py")
+        gone = self._write(tmp_path / "settings" / "apps" / "b.py", "token")
+        SettingCollector(tmp_path).collect()
+        gone.unlink()
+
+        result = SettingCollector(tmp_path).collect()
+        assert [s.name for s in result.secrets] == ["api_key"]
+
+    def test_corrupt_cache_is_ignored(self, tmp_path: Path) -> None:
+        self._write(tmp_path / "settings" / "apps" / "a.py")
+        cache = ParseCache(tmp_path.resolve())
+        cache.path.parent.mkdir(parents=True, exist_ok=True)
+        cache.path.write_bytes(b"not a pickle")
+
+        result = ParseCache(tmp_path.resolve()).parse(
+            [tmp_path / "settings" / "apps" / "a.py"]
+        )
+        assert result[0][0][0][0] == "api_key"
+
+    def test_parser_change_invalidates_cache(self, tmp_path: Path) -> None:
+        self._write(tmp_path / "settings" / "apps" / "a.py")
+        SettingCollector(tmp_path).collect()
+        ParseCache._instances.clear()
+
+        with (
+            patch.object(
+                setting_collector, "_collector_source_hash", return_value="changed"
+            ),
+            patch.object(
+                setting_collector,
+                "_parse_settings_file",
+                wraps=setting_collector._parse_settings_file,
+            ) as mock_parse,
+        ):
+            SettingCollector(tmp_path).collect()
+        mock_parse.assert_called_once()
+
+    def test_cache_owned_by_another_user_is_ignored(self, tmp_path: Path) -> None:
+        self._write(tmp_path / "settings" / "apps" / "a.py")
+        SettingCollector(tmp_path).collect()
+        ParseCache._instances.clear()
+
+        with (
+            patch.object(
+                setting_collector, "_owned_by_current_user", return_value=False
+            ),
+            patch.object(
+                setting_collector,
+                "_parse_settings_file",
+                wraps=setting_collector._parse_settings_file,
+            ) as mock_parse,
+        ):
+            SettingCollector(tmp_path).collect()
+        mock_parse.assert_called_once()
+
+    def test_large_batches_are_parsed_in_a_pool(self, tmp_path: Path) -> None:
+        files = [
+            self._write(tmp_path / "settings" / "apps" / f"m{i}.py", f"key_{i}")
+            for i in range(6)
+        ]
+        with (
+            patch.object(setting_collector, "POOL_MIN_FILES", 2),
+            patch.object(setting_collector.os, "cpu_count", return_value=2),
+            patch.object(
+                setting_collector,
+                "ProcessPoolExecutor",
+                wraps=setting_collector.ProcessPoolExecutor,
+            ) as mock_pool,
+        ):
+            parsed = ParseCache(tmp_path.resolve()).parse(files)
+        assert [secrets[0][0] for secrets, _ in parsed] == [
+            f"key_{i}" for i in range(6)
+        ]
+        mock_pool.assert_called_once_with(max_workers=2)
@@ -0,0 +1,78 @@
+"""Tests for WorkerDatabases — per-worker test databases cloned from a template."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from djdevx.utils.django.test_databases import WorkerDatabases, worker_suffixes
+from djdevx.utils.services import PostgresService
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "djdevx.toml").write_text("")
+    migrations = tmp_path / "users" / "migrations"
+    migrations.mkdir(parents=True)
+    (migrations / "0001_initial.py").write_text("# initial\n")
+    return tmp_path
+
+
+def _service(project, existing=()):
+    service = MagicMock(spec=PostgresService)
+    service.structure = MagicMock(root=project)
+    service.database = "postgres"
+    service.database_env_key = "POSTGRES_DB"
+    service.connection_env.return_value = {"POSTGRES_PORT": "6543"}
+    service.databases.return_value = set(existing)
+    return service
+
+
+def test_worker_suffixes():
+    assert worker_suffixes("django", 3) == ["1", "2", "3"]
+    assert worker_suffixes("pytest", 2) == ["gw0", "gw1"]
+    with pytest.raises(ValueError):
+        worker_suffixes("nose", 1)
+
+
+def test_provision_migrates_template_and_clones_workers(project):
+    service, runner = _service(project), MagicMock()
+    databases = WorkerDatabases(service, runner, workers=2, test_runner="pytest")
+    assert databases.provision() is True
+    service.create_database.assert_called_once_with("test_postgres")
+    call = runner.run_manage_command.call_args
+    assert call.args == ("migrate", "--noinput")
+    assert call.kwargs["env"]["POSTGRES_DB"] == "test_postgres"
+    assert call.kwargs["env"]["POSTGRES_PORT"] == "6543"
+    service.clone_databases.assert_called_once_with(
+        "test_postgres", ["test_postgres_gw0", "test_postgres_gw1"]
+    )
+
+
+def test_provision_reuses_databases_while_migrations_unchanged(project):
+    names = {"test_postgres", "test_postgres_1", "test_postgres_2"}
+    service, runner = _service(project, names), MagicMock()
+    WorkerDatabases(service, runner, workers=2).provision()
+    service.reset_mock()
+    runner.reset_mock()
+
+    assert WorkerDatabases(service, runner, workers=2).provision() is False
+    runner.run_manage_command.assert_not_called()
+    service.clone_databases.assert_not_called()
+
+
+def test_new_migration_or_missing_clone_reprovisions(project):
+    names = {"test_postgres", "test_postgres_1"}
+    service, runner = _service(project, names), MagicMock()
+    WorkerDatabases(service, runner, workers=1).provision()
+    service.create_database.assert_not_called()
+
+    (project / "users" / "migrations" / "0002_more.py").write_text("# two\n")
+    assert WorkerDatabases(service, runner, workers=1).provision() is True
+    assert WorkerDatabases(service, runner, workers=2).provision() is True
+
+
+def test_rebuild_forces_provisioning(project):
+    names = {"test_postgres", "test_postgres_1"}
+    service, runner = _service(project, names), MagicMock()
+    WorkerDatabases(service, runner, workers=1).provision()
+    assert WorkerDatabases(service, runner, workers=1).provision(rebuild=True)
@@ -0,0 +1,103 @@
+"""Tests for the installable manifest — caching, invalidation and lazy imports."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from djdevx.features._registry import FEATURE_REGISTRY
+from djdevx.packages._registry import PACKAGE_REGISTRY
+from djdevx.utils.installable.manifest import ManifestEntry, load_manifest
+from djdevx.utils.installable.types import InstallableKind
+from djdevx.utils.project.setting_collector import SettingCollector
+from djdevx.utils.tracking import Section
+
+KIND = InstallableKind("manifest-test", Section.PACKAGES, "manifest_test")
+
+
+@pytest.fixture
+def plugin_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("DJDEVX_CACHE_DIR", str(tmp_path / "cache"))
+    root = tmp_path / "plugins"
+    (root / "alpha").mkdir(parents=True)
+    (root / "alpha" / "__init__.py").write_text("NAME = 'alpha'\n")
+    return root
+
+
+def _builder(calls: list[int]):
+    def build() -> list[ManifestEntry]:
+        calls.append(1)
+        return [ManifestEntry("alpha", "Alpha", "plugins.alpha", {"x": "X"}, ["key"])]
+
+    return build
+
+
+def test_manifest_is_built_once_and_reused(plugin_dir):
+    calls: list[int] = []
+    first = load_manifest(KIND, [str(plugin_dir)], _builder(calls))
+    second = load_manifest(KIND, [str(plugin_dir)], _builder(calls))
+    assert calls == [1]
+    assert first == second
+    assert second["alpha"].variants == {"x": "X"}
+    assert second["alpha"].secret_generators == ["key"]
+
+
+def test_manifest_is_rebuilt_when_a_module_changes(plugin_dir):
+    calls: list[int] = []
+    load_manifest(KIND, [str(plugin_dir)], _builder(calls))
+    module = plugin_dir / "alpha" / "__init__.py"
+    stat = module.stat()
+    os.utime(module, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    load_manifest(KIND, [str(plugin_dir)], _builder(calls))
+    assert calls == [1, 1]
+
+
+def test_manifest_is_rebuilt_when_a_module_is_added(plugin_dir):
+    calls: list[int] = []
+    load_manifest(KIND, [str(plugin_dir)], _builder(calls))
+    (plugin_dir / "beta.py").write_text("")
+    load_manifest(KIND, [str(plugin_dir)], _builder(calls))
+    assert calls == [1, 1]
+
+
+def test_registry_manifest_matches_registered_classes():
+    manifest = PACKAGE_REGISTRY.manifest()
+    allauth = PACKAGE_REGISTRY.get("django-allauth")
+    assert (
+        manifest["django-allauth"].display_name
+        == allauth.model_fields["display_name"].default
+    )
+    assert "account" in manifest["django-allauth"].variants
+    assert PACKAGE_REGISTRY.display_name("no-such-package") == "no-such-package"
+
+
+def test_list_reads_the_manifest_without_importing_plugins():
+    code = (
+        "from djdevx.packages._registry import PACKAGE_REGISTRY\n"
+        "names = PACKAGE_REGISTRY.list()\n"
+        "import sys\n"
+        "print(len(names), sum(m.startswith('djdevx.packages.') and m.count('.') == 2"
+        " and m.rsplit('.', 1)[1] not in ('add', 'remove', 'list', '_base', '_registry')"
+        " for m in sys.modules))"
+    )
+    run = lambda: subprocess.run(  # noqa: E731
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.split()
+    run()  # builds the manifest
+    count, imported = run()
+    assert int(count) > 10
+    assert imported == "0"
+
+
+def test_generators_index_imports_installables_lazily(tmp_path):
+    index = SettingCollector(tmp_path)._build_generators_index()
+    assert "secret_key" in index
+    names = {
+        field
+        for registry in (PACKAGE_REGISTRY, FEATURE_REGISTRY)
+        for entry in registry.manifest().values()
+        for field in entry.secret_generators
+    }
+    for field in names:
+        assert isinstance(index[field](), str)
@@ -0,0 +1,92 @@
+"""Tests for PixiOps batching — grouping, deferral and flushing."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from djdevx.utils.installable.pixi_ops import (
+    PixiOps,
+    group_package_specs,
+    pixi_batch,
+)
+from djdevx.utils.installable.types import Variant
+from djdevx.utils.project.pixi_runner import PixiRunner
+from djdevx.utils.types.pixi_types import PixiPackageSpec
+
+DJANGO_FILTER = PixiPackageSpec("django-filter", kind="pypi")
+DJANGO_TAGGIT = PixiPackageSpec("django-taggit", kind="pypi")
+POSTGRESQL = PixiPackageSpec("postgresql", pixi_feature="dev")
+PSYCOPG = PixiPackageSpec("psycopg2-binary")
+
+
+def test_group_by_kind_and_feature():
+    groups = group_package_specs(
+        [DJANGO_FILTER, POSTGRESQL, DJANGO_TAGGIT, PSYCOPG, DJANGO_FILTER]
+    )
+    assert groups == {
+        ("pypi", None): [DJANGO_FILTER, DJANGO_TAGGIT],
+        ("conda", "dev"): [POSTGRESQL],
+        ("conda", None): [PSYCOPG],
+    }
+
+
+def test_add_without_batch_runs_one_invocation_per_group():
+    variant = Variant(name="v", pixi_packages=[DJANGO_TAGGIT, POSTGRESQL])
+    with patch.object(PixiRunner, "add_package_specs") as mock_add:
+        PixiOps(Path("/tmp")).add_packages([DJANGO_FILTER], variant)
+    assert mock_add.call_count == 2
+    mock_add.assert_any_call([DJANGO_FILTER, DJANGO_TAGGIT], pixi_feature=None)
+    mock_add.assert_any_call([POSTGRESQL], pixi_feature="dev")
+
+
+def test_remove_variant_only_touches_variant_packages():
+    variant = Variant(name="v", pixi_packages=[DJANGO_TAGGIT])
+    with patch.object(PixiRunner, "remove_package_specs_if_exist") as mock_remove:
+        PixiOps(Path("/tmp")).remove_packages([DJANGO_FILTER], variant)
+    mock_remove.assert_called_once_with([DJANGO_TAGGIT], pixi_feature=None)
+
+
+def test_batch_defers_until_outermost_exit():
+    with patch.object(PixiRunner, "add_package_specs") as mock_add:
+        with pixi_batch() as batch:
+            ops = PixiOps(Path("/tmp"))
+            assert ops.deferred
+            ops.add_packages([DJANGO_FILTER])
+            with pixi_batch() as nested:
+                assert nested is batch
+                PixiOps(Path("/tmp")).add_packages([DJANGO_TAGGIT, POSTGRESQL])
+            mock_add.assert_not_called()
+        assert not PixiOps(Path("/tmp")).deferred
+    assert mock_add.call_count == 2
+    mock_add.assert_any_call([DJANGO_FILTER, DJANGO_TAGGIT], pixi_feature=None)
+    mock_add.assert_any_call([POSTGRESQL], pixi_feature="dev")
+
+
+def test_batch_applies_removals_before_additions():
+    calls = []
+    with (
+        patch.object(
+            PixiRunner,
+            "add_package_specs",
+            side_effect=lambda specs, **kw: calls.append("add"),
+        ),
+        patch.object(
+            PixiRunner,
+            "remove_package_specs_if_exist",
+            side_effect=lambda specs, **kw: calls.append("remove"),
+        ),
+    ):
+        with pixi_batch():
+            PixiOps(Path("/tmp")).add_packages([DJANGO_FILTER])
+            PixiOps(Path("/tmp")).remove_packages([PSYCOPG])
+    assert calls == ["remove", "add"]
+
+
+def test_batch_flushes_queued_changes_on_error():
+    with patch.object(PixiRunner, "add_package_specs") as mock_add:
+        try:
+            with pixi_batch():
+                PixiOps(Path("/tmp")).add_packages([DJANGO_FILTER])
+                raise RuntimeError("template copy failed")
+        except RuntimeError:
+            pass
+    mock_add.assert_called_once_with([DJANGO_FILTER], pixi_feature=None)
@@ -0,0 +1,160 @@
+"""Tests for InstallPlan — needs resolution, ordering, dry-run and phased execution."""
+
+from unittest.mock import patch
+
+import pytest
+import tomlkit
+
+from djdevx.packages._base import BasePackage
+from djdevx.utils.installable.orchestrator import add_installable
+from djdevx.utils.installable.plan import InstallPlan, execute_plan
+from djdevx.utils.installable.registry import Registry
+from djdevx.utils.installable.types import InstallableKind, InstallableRef, Variant
+from djdevx.utils.project.pixi_runner import PixiRunner
+from djdevx.utils.tracking import Section
+from djdevx.utils.types.pixi_types import PixiPackageSpec
+
+PLAN_KIND = InstallableKind("plan-test", Section.PACKAGES)
+PLAN_REGISTRY: Registry[BasePackage] = Registry(PLAN_KIND)
+
+
+@PLAN_REGISTRY.register
+class BasePkg(BasePackage):
+    name: str = "base-pkg"
+    display_name: str = "Base"
+    pixi_packages: list[PixiPackageSpec] = [PixiPackageSpec("base", kind="pypi")]
+
+
+@PLAN_REGISTRY.register
+class MiddlePkg(BasePackage):
+    name: str = "middle-pkg"
+    display_name: str = "Middle"
+    pixi_packages: list[PixiPackageSpec] = [PixiPackageSpec("middle", kind="pypi")]
+    needs: list[InstallableRef] = [InstallableRef("base-pkg", PLAN_KIND)]
+
+
+@PLAN_REGISTRY.register
+class TopPkg(BasePackage):
+    name: str = "top-pkg"
+    display_name: str = "Top"
+    pixi_packages: list[PixiPackageSpec] = [PixiPackageSpec("top", kind="pypi")]
+    needs: list[InstallableRef] = [
+        InstallableRef("middle-pkg", PLAN_KIND),
+        InstallableRef("base-pkg", PLAN_KIND),
+    ]
+
+
+@PLAN_REGISTRY.register
+class AdditivePkg(BasePackage):
+    name: str = "additive-pkg"
+    display_name: str = "Additive"
+    variants: dict[str, Variant] = {
+        "core": Variant(name="core", display_name="Core", required=True),
+        "extra": Variant(
+            name="extra",
+            display_name="Extra",
+            pixi_packages=[PixiPackageSpec("extra", pixi_feature="dev")],
+            needs=[InstallableRef("base-pkg", PLAN_KIND)],
+        ),
+    }
+
+
+@PLAN_REGISTRY.register
+class CycleA(BasePackage):
+    name: str = "cycle-a"
+    needs: list[InstallableRef] = [InstallableRef("cycle-b", PLAN_KIND)]
+
+
+@PLAN_REGISTRY.register
+class CycleB(BasePackage):
+    name: str = "cycle-b"
+    needs: list[InstallableRef] = [InstallableRef("cycle-a", PLAN_KIND)]
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    (tmp_path / "djdevx.toml").write_text('project_name = "test"\n')
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _labels(plan: InstallPlan) -> list[str]:
+    return [step.label for step in plan.ordered_steps()]
+
+
+def test_transitive_needs_are_ordered_before_dependents(project):
+    plan = InstallPlan(project)
+    assert add_installable(TopPkg, "top-pkg", plan=plan)
+    assert _labels(plan) == ["Base", "Middle", "Top"]
+
+
+def test_installed_needs_are_skipped(project):
+    (project / "djdevx.toml").write_text(
+        'project_name = "test"\n\n[packages.base-pkg]\ninstalled = true\n'
+    )
+    plan = InstallPlan(project)
+    add_installable(MiddlePkg, "middle-pkg", plan=plan)
+    assert _labels(plan) == ["Middle"]
+
+
+def test_additive_variants_follow_required_and_variant_needs(project):
+    plan = InstallPlan(project)
+    add_installable(AdditivePkg, "additive-pkg", "extra", plan=plan)
+    assert _labels(plan) == ["Additive (Core)", "Base", "Additive (Extra)"]
+
+
+def test_dependency_cycle_is_rejected(project):
+    with pytest.raises(ValueError, match="cycle"):
+        add_installable(CycleA, "cycle-a", plan=InstallPlan(project))
+
+
+def test_dry_run_applies_nothing(project):
+    with patch.object(PixiRunner, "run_pixi_command") as mock_pixi:
+        add_installable(TopPkg, "top-pkg", dry_run=True)
+    mock_pixi.assert_not_called()
+    assert "packages" not in tomlkit.loads((project / "djdevx.toml").read_text())
+
+
+def test_execute_runs_one_pixi_batch_and_one_save(project):
+    plan = InstallPlan(project)
+    add_installable(TopPkg, "top-pkg", plan=plan)
+    add_installable(AdditivePkg, "additive-pkg", "extra", plan=plan)
+    with (
+        patch.object(PixiRunner, "add_package_specs") as mock_add,
+        patch("djdevx.utils.installable.plan.format_files") as mock_format,
+        patch.object(plan.project, "save", wraps=plan.project.save) as mock_save,
+    ):
+        execute_plan(plan)
+
+    assert mock_add.call_count == 2
+    mock_add.assert_any_call(
+        [
+            PixiPackageSpec("base", kind="pypi"),
+            PixiPackageSpec("middle", kind="pypi"),
+            PixiPackageSpec("top", kind="pypi"),
+        ],
+        pixi_feature=None,
+    )
+    mock_add.assert_any_call(
+        [PixiPackageSpec("extra", pixi_feature="dev")], pixi_feature="dev"
+    )
+    mock_format.assert_called_once()
+    mock_save.assert_called_once()
+
+    doc = tomlkit.loads((project / "djdevx.toml").read_text())
+    assert set(doc["packages"]) == {"base-pkg", "middle-pkg", "top-pkg", "additive-pkg"}
+    assert list(doc["packages"]["additive-pkg"]["variants"]) == ["core", "extra"]
+
+
+def test_failure_leaves_tracking_untouched(project):
+    plan = InstallPlan(project)
+    add_installable(TopPkg, "top-pkg", plan=plan)
+    before = (project / "djdevx.toml").read_text()
+    with (
+        patch.object(PixiRunner, "add_package_specs"),
+        patch("djdevx.utils.installable.plan.format_files"),
+        patch.object(TopPkg, "after_copy_templates", side_effect=RuntimeError),
+        pytest.raises(RuntimeError),
+    ):
+        execute_plan(plan)
+    assert (project / "djdevx.toml").read_text() == before
@@ -0,0 +1,57 @@
+"""Tests for deferred formatting — one prek pass per command."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from djdevx.utils.prek.prek import format_files, formatting_queue
+from djdevx.utils.project.pixi_runner import PixiRunner
+
+ROOT = Path("/tmp/project")
+SETTINGS = ROOT / "settings.py"
+URLS = ROOT / "urls.py"
+COMPOSE = ROOT / "compose.yaml"
+
+
+def _commands(mock_run) -> list[tuple[str, ...]]:
+    return [call.args for call in mock_run.call_args_list]
+
+
+def test_format_files_runs_prek_immediately_without_a_queue():
+    with patch.object(PixiRunner, "run_pixi_command") as mock_run:
+        mock_run.return_value.returncode = 0
+        format_files([SETTINGS], ROOT)
+    assert _commands(mock_run) == [("run", "prek", "run", "--files", str(SETTINGS))]
+
+
+def test_queue_collects_files_and_runs_prek_once():
+    with patch.object(PixiRunner, "run_pixi_command") as mock_run:
+        mock_run.return_value.returncode = 0
+        with formatting_queue() as queue:
+            format_files([SETTINGS, URLS], ROOT)
+            with formatting_queue() as nested:
+                assert nested is queue
+                format_files([URLS, COMPOSE], ROOT)
+            mock_run.assert_not_called()
+    assert _commands(mock_run) == [
+        ("run", "prek", "run", "--files", str(SETTINGS), str(URLS), str(COMPOSE))
+    ]
+
+
+def test_ruff_only_formats_python_files_with_ruff():
+    with patch.object(PixiRunner, "run_pixi_command") as mock_run:
+        mock_run.return_value.returncode = 0
+        with formatting_queue(ruff_only=True):
+            format_files([SETTINGS, COMPOSE, URLS], ROOT)
+    assert _commands(mock_run) == [
+        ("run", "ruff", "check", "--fix", "--quiet", str(SETTINGS), str(URLS)),
+        ("run", "ruff", "format", "--quiet", str(SETTINGS), str(URLS)),
+    ]
+
+
+def test_empty_queue_runs_nothing():
+    with patch.object(PixiRunner, "run_pixi_command") as mock_run:
+        with formatting_queue(ruff_only=True):
+            format_files([COMPOSE], ROOT)
+        with formatting_queue():
+            pass
+    mock_run.assert_not_called()
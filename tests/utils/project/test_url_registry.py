@@ -0,0 +1,99 @@
+"""Tests for the generated URL registry (urls/registry.py)."""
+
+from types import SimpleNamespace
+
+from djdevx.utils.installable.scaffold import cleanup_files, copy_templates
+from djdevx.utils.project.project_structure import ProjectStructure
+from djdevx.utils.project.url_registry import (
+    is_url_registry_current,
+    render_registry,
+    sync_url_registry,
+    url_modules,
+)
+
+
+def _project(root, *modules):
+    for module in ("django/__init__.py", "packages/__init__.py", *modules):
+        path = root / "urls" / module
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("urlpatterns = []\n")
+    (root / "urls" / "__init__.py").write_text("")
+    return ProjectStructure(root)
+
+
+def test_url_modules_are_sorted_dotted_names(tmp_path):
+    structure = _project(
+        tmp_path, "packages/silk.py", "django/admin.py", "apps/home.py"
+    )
+    structure.url_registry.write_text("")
+    assert url_modules(structure) == [
+        "urls.apps.home",
+        "urls.django.admin",
+        "urls.packages.silk",
+    ]
+
+
+def test_render_registry():
+    assert render_registry(["urls.django.admin"]).endswith(
+        'URL_MODULES: list[str] = [\n    "urls.django.admin",\n]\n'
+    )
+    assert render_registry([]).endswith("URL_MODULES: list[str] = []\n")
+
+
+def test_sync_rewrites_only_when_stale(tmp_path):
+    structure = _project(tmp_path, "django/admin.py")
+    assert sync_url_registry(structure, create=True) is True
+    assert is_url_registry_current(structure)
+    assert sync_url_registry(structure) is False
+
+    (tmp_path / "urls" / "packages" / "silk.py").write_text("urlpatterns = []\n")
+    assert not is_url_registry_current(structure)
+    assert sync_url_registry(structure) is True
+    assert '"urls.packages.silk"' in structure.url_registry.read_text()
+
+
+def test_projects_without_registry_are_left_alone(tmp_path):
+    structure = _project(tmp_path, "django/admin.py")
+    assert sync_url_registry(structure) is False
+    assert not structure.url_registry.exists()
+    assert not is_url_registry_current(structure)
+
+
+def test_registry_module_imports_the_listed_modules(tmp_path):
+    structure = _project(tmp_path, "django/admin.py")
+    sync_url_registry(structure, create=True)
+    namespace: dict = {}
+    exec(structure.url_registry.read_text(), namespace)
+    assert namespace["URL_MODULES"] == ["urls.django.admin"]
+
+
+# ── Installable scaffolding keeps the registry in sync ─────────────────────────
+
+
+def _installable(root, templates):
+    (templates / "urls" / "packages").mkdir(parents=True)
+    (templates / "urls" / "packages" / "silk.py").write_text("urlpatterns = []\n")
+    return SimpleNamespace(
+        template_dir=templates,
+        template_path=None,
+        _install_context={},
+        structure=ProjectStructure(root),
+        files_to_remove=[],
+        folders_to_remove=[],
+    )
+
+
+def test_copy_and_cleanup_update_the_registry(tmp_path):
+    root = tmp_path / "project"
+    structure = _project(root, "django/admin.py")
+    sync_url_registry(structure, create=True)
+    installable = _installable(root, tmp_path / "templates")
+
+    report = copy_templates(installable)
+    assert structure.url_registry in report.updated
+    assert url_modules(structure) == ["urls.django.admin", "urls.packages.silk"]
+    assert is_url_registry_current(structure)
+
+    cleanup_files(installable)
+    assert is_url_registry_current(structure)
+    assert '"urls.packages.silk"' not in structure.url_registry.read_text()
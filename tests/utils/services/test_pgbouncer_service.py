@@ -0,0 +1,163 @@
+"""Tests for PgBouncerService — pixi-native PgBouncer in front of postgres."""
+
+import itertools
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from djdevx.utils.services.base import BaseDevService
+from djdevx.utils.services.pgbouncer import PgBouncerService, pool_sizes
+from djdevx.utils.services.postgres import PostgresService
+from djdevx.utils.services.scheduler import ServiceScheduler
+from djdevx.utils.tracking import ProjectTracking
+
+
+@pytest.fixture(autouse=True)
+def pixi_probe_only():
+    """Make the native probe inconclusive so ``is_up`` goes through pixi."""
+    with patch.object(PgBouncerService, "_native_probe", return_value=None):
+        yield
+
+
+def make_service(root, returncode=0, dev_config=None):
+    """Build a PgBouncerService backed by a mocked PixiRunner."""
+    ProjectTracking(root).set_dev_config(
+        "pgbouncer", {"enabled": True, **(dev_config or {})}
+    )
+    with patch("djdevx.utils.services.base.PixiRunner") as mock_cls:
+        runner = mock_cls.return_value
+        runner.run_pixi_command.return_value = MagicMock(returncode=returncode)
+        service = PgBouncerService(project_root=root)
+    return service, runner
+
+
+def test_pool_sizes_grow_with_replicas():
+    assert pool_sizes() == {"max_client_conn": 50, "default_pool_size": 10}
+    assert pool_sizes(4) == {"max_client_conn": 200, "default_pool_size": 20}
+    assert pool_sizes(100)["default_pool_size"] == 80
+    assert pool_sizes(0) == pool_sizes(1)
+
+
+def test_enabled_from_dev_config(tmp_path):
+    service, _ = make_service(tmp_path)
+    assert service.enabled is True
+    assert service.service_dir == tmp_path / ".pixi" / "devdata" / "pgbouncer"
+
+
+def test_connection_env_points_django_at_pgbouncer(tmp_path):
+    service, _ = make_service(tmp_path)
+    assert service.connection_env() == {
+        "POSTGRES_PORT": str(service.port),
+        "POSTGRES_SERVER": "localhost",
+        "POSTGRES_CONNECTION": "pgbouncer",
+    }
+
+
+def test_server_settings_defaults(tmp_path):
+    service, _ = make_service(tmp_path)
+    settings = service.server_settings()
+    assert settings["pool_mode"] == "transaction"
+    assert settings["listen_port"] == str(service.port)
+    assert settings["max_client_conn"] == "50"
+    assert settings["default_pool_size"] == "10"
+
+
+def test_server_settings_from_dev_config(tmp_path):
+    service, _ = make_service(
+        tmp_path, dev_config={"pool_mode": "session", "default_pool_size": 3}
+    )
+    settings = service.server_settings()
+    assert settings["pool_mode"] == "session"
+    assert settings["default_pool_size"] == "3"
+
+
+def test_unknown_dev_config_keys_stay_out_of_the_ini(tmp_path):
+    service, _ = make_service(
+        tmp_path,
+        dev_config={"settings": {"server_idle_timeout": 60, "log_connections": False}},
+    )
+    settings = service.server_settings()
+    assert "enabled" not in settings
+    assert "settings" not in settings
+    assert settings["server_idle_timeout"] == "60"
+    assert settings["log_connections"] == "false"
+
+
+def test_unknown_pool_mode_raises(tmp_path):
+    service, _ = make_service(tmp_path, dev_config={"pool_mode": "bogus"})
+    with pytest.raises(RuntimeError, match="pool_mode"):
+        service.server_settings()
+
+
+def test_conf_forwards_to_dev_postgres(tmp_path):
+    service, _ = make_service(tmp_path)
+    service.service_dir.mkdir(parents=True)
+    conf = service._write_conf().read_text()
+    assert f"* = host=localhost port={service.postgres.port}\n" in conf
+    assert "auth_type = scram-sha-256\n" in conf
+    auth = service.service_dir / "userlist.txt"
+    assert auth.read_text() == '"postgres" "password"\n'
+    assert auth.stat().st_mode & 0o777 == 0o600
+
+
+def test_up_starts_daemonized_pgbouncer(tmp_path):
+    service, runner = make_service(tmp_path)
+    with (
+        patch.object(PgBouncerService, "_pixi_probe", return_value=False),
+        patch.object(PgBouncerService, "wait_until_ready"),
+    ):
+        service.up()
+    conf = str(service.service_dir / "pgbouncer.ini")
+    runner.run_pixi_command.assert_called_once_with(
+        "run", "pgbouncer", "-d", conf, check=False
+    )
+
+
+def test_down_signals_pid(tmp_path):
+    service, _ = make_service(tmp_path)
+    service.service_dir.mkdir(parents=True)
+    (service.service_dir / "pgbouncer.pid").write_text("4242\n")
+    with (
+        patch.object(PgBouncerService, "_pixi_probe", return_value=True),
+        patch("djdevx.utils.services.pgbouncer.os.kill") as kill,
+    ):
+        service.down()
+    kill.assert_called_once()
+    assert kill.call_args.args[0] == 4242
+
+
+def test_cold_start_agrees_on_the_postgres_port(tmp_path):
+    """With no port files, the pooler's config names PostgreSQL's real port."""
+    pooler, _ = make_service(tmp_path)
+    db = PostgresService(project_root=tmp_path)
+    ports = itertools.count(41000)
+    generated_on = []
+
+    def generate_port():
+        generated_on.append(threading.current_thread())
+        return next(ports)
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def db_up(self):
+        barrier.wait()
+        return True
+
+    def pooler_up(self):
+        barrier.wait()
+        self._write_conf()
+        return True
+
+    with (
+        patch.object(BaseDevService, "_generate_port", side_effect=generate_port),
+        patch.object(PostgresService, "up", db_up),
+        patch.object(PgBouncerService, "up", pooler_up),
+    ):
+        with ServiceScheduler([db, pooler]):
+            pass
+
+    conf = (pooler.service_dir / "pgbouncer.ini").read_text()
+    assert f"port={db.port}\n" in conf
+    assert db.port != pooler.port
+    assert generated_on == [threading.current_thread()] * 2
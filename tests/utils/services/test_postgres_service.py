@@ -1,8 +1,30 @@
 """Tests for PostgresService — pixi-native local PostgreSQL dev service."""
 
+import os
+import shutil
+import tempfile
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from djdevx.utils.services.postgres import PostgresService
+from djdevx.utils.system.runtime_dir import MAX_SOCKET_PATH
+
+
+@pytest.fixture(autouse=True)
+def pixi_probe_only():
+    """Make the native probe inconclusive so ``is_up`` goes through pixi."""
+    with patch.object(PostgresService, "_native_probe", return_value=None):
+        yield
+
+
+@pytest.fixture
+def short_tmp_path():
+    # pytest's tmp_path can overflow sun_path; keep the socket path short.
+    path = Path(tempfile.mkdtemp(prefix="ddx"))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
 
 
 def make_service(root, returncode=0, stdout="", side_effect=None):
@@ -72,14 +94,14 @@ def test_initdb_command(tmp_path):
 def test_start_command(tmp_path):
     service, runner = make_service(tmp_path)
     service._start()
-    args = runner.run_pixi_command.call_args[0]
+    args = runner.run_pixi_command.call_args_list[0].args
     assert args == (
         "run",
         "pg_ctl",
         "-D",
         str(service.data_dir),
         "-l",
-        str(service._log_file),
+        str(service.log_file),
         "-o",
         f"-p {service.port}",
         "start",
@@ -100,8 +122,8 @@ def test_down_skips_when_not_running(tmp_path):
     assert runner.run_pixi_command.call_args[0] == _pg_isready_args(service.port)
 
 
-def test_reset_flushes_django(tmp_path):
-    service, runner = make_service(tmp_path)
+def test_reset_flushes_django_without_snapshot(tmp_path):
+    service, runner = make_service(tmp_path, stdout="")
     service.reset()
     runner.run_manage_command.assert_called_once_with("flush", "--noinput", check=False)
 
@@ -109,7 +131,8 @@ def test_reset_flushes_django(tmp_path):
 def test_up_initializes_then_starts(tmp_path):
     ok = MagicMock(returncode=0, stdout=b"")
     not_ready = MagicMock(returncode=1, stdout=b"")
-    side_effects = [ok, not_ready, ok]  # initdb, pg_isready, pg_ctl start
+    # initdb, pg_isready, pg_ctl start, pg_isready (wait until ready)
+    side_effects = [ok, not_ready, ok, ok]
     service, runner = make_service(tmp_path, side_effect=side_effects)
     service.up()
     calls = [c.args for c in runner.run_pixi_command.call_args_list]
@@ -117,6 +140,7 @@ def test_up_initializes_then_starts(tmp_path):
     assert calls[1] == _pg_isready_args(service.port)
     assert calls[2][1] == "pg_ctl"
     assert calls[2][-1] == "start"
+    assert calls[3] == _pg_isready_args(service.port)
 
 
 def test_up_skips_start_when_already_running(tmp_path):
@@ -128,15 +152,16 @@ def test_up_skips_start_when_already_running(tmp_path):
     assert runner.run_pixi_command.call_args[0] == _pg_isready_args(service.port)
 
 
-def test_up_sets_port_env(tmp_path):
+def test_up_leaves_port_env_to_the_caller(tmp_path, monkeypatch):
+    monkeypatch.setenv("POSTGRES_PORT", "")  # restored after the test
+    monkeypatch.delenv("POSTGRES_PORT")
     ok = MagicMock(returncode=0, stdout=b"")
     not_ready = MagicMock(returncode=1, stdout=b"")
-    service, _ = make_service(tmp_path, side_effect=[ok, not_ready, ok])
+    service, _ = make_service(tmp_path, side_effect=[ok, not_ready, ok, ok])
     service.up()
-    import os
-
-    assert os.environ.get("POSTGRES_PORT") == str(service.port)
-    del os.environ["POSTGRES_PORT"]
+    assert "POSTGRES_PORT" not in os.environ
+    service.export_connection_env()
+    assert os.environ["POSTGRES_PORT"] == str(service.port)
 
 
 def test_initdb_failure_raises(tmp_path):
@@ -155,3 +180,200 @@ def test_start_failure_raises(tmp_path):
 
     with pytest.raises(RuntimeError, match="pg_ctl start failed"):
         service._start()
+
+
+# ── Dev tuning profile ─────────────────────────────────────────────────────────
+
+
+def _configure(root, toml):
+    (root / "djdevx.toml").write_text(toml)
+
+
+def test_default_profile_writes_empty_conf_and_include(tmp_path):
+    service, _ = make_service(tmp_path)
+    service.data_dir.mkdir(parents=True)
+    (service.data_dir / "postgresql.conf").write_text("port = 5432\n")
+    service._start()
+    assert service.server_settings() == {}
+    assert (service.data_dir / "djdevx.conf").read_text().startswith("# Generated")
+    conf = (service.data_dir / "postgresql.conf").read_text()
+    assert conf.count("include_if_exists = 'djdevx.conf'") == 1
+    service._start()
+    conf = (service.data_dir / "postgresql.conf").read_text()
+    assert conf.count("include_if_exists = 'djdevx.conf'") == 1
+
+
+def test_fast_profile_with_overrides(tmp_path):
+    _configure(
+        tmp_path,
+        '[dev.postgres]\nprofile = "fast"\n\n'
+        '[dev.postgres.settings]\nwork_mem = "64MB"\njit = false\n',
+    )
+    service, _ = make_service(tmp_path)
+    service._start()
+    conf = (service.data_dir / "djdevx.conf").read_text()
+    assert "fsync = 'off'\n" in conf
+    assert "synchronous_commit = 'off'\n" in conf
+    assert "full_page_writes = 'off'\n" in conf
+    assert "work_mem = '64MB'\n" in conf
+    assert "jit = 'false'\n" in conf
+
+
+def test_unknown_profile_raises(tmp_path):
+    _configure(tmp_path, '[dev.postgres]\nprofile = "turbo"\n')
+    service, _ = make_service(tmp_path)
+    with pytest.raises(RuntimeError, match="Unknown \\[dev.postgres\\] profile"):
+        service.server_settings()
+
+
+def test_unix_socket_only_listener(short_tmp_path):
+    _configure(short_tmp_path, "[dev.postgres]\nunix_socket_only = true\n")
+    service, runner = make_service(short_tmp_path)
+    socket_dir = str(service.service_dir)
+    settings = service.server_settings()
+    assert settings["listen_addresses"] == ""
+    assert settings["unix_socket_directories"] == socket_dir
+    assert service.connection_env() == {
+        "POSTGRES_PORT": str(service.port),
+        "POSTGRES_SERVER": socket_dir,
+    }
+    service._pixi_probe()
+    assert runner.run_pixi_command.call_args.args[3] == socket_dir
+
+
+def test_unix_socket_dir_falls_back_for_deep_projects(
+    tmp_path, short_tmp_path, monkeypatch
+):
+    runtime = str(short_tmp_path)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", runtime)
+    deep = tmp_path / ("x" * MAX_SOCKET_PATH)
+    deep.mkdir()
+    _configure(deep, "[dev.postgres]\nunix_socket_only = true\n")
+    service, _ = make_service(deep)
+    socket_dir = service.server_settings()["unix_socket_directories"]
+    assert socket_dir.startswith(runtime)
+    assert len(f"{socket_dir}/.s.PGSQL.{service.port}") <= MAX_SOCKET_PATH
+    assert service.connection_env()["POSTGRES_SERVER"] == socket_dir
+
+
+# ── Snapshots ──────────────────────────────────────────────────────────────────
+
+
+def _psql_service(root, listing=""):
+    """A service whose psql calls succeed; SELECTs return *listing*."""
+
+    def run(*args, **kwargs):
+        select = any(a.startswith("SELECT datname") for a in args)
+        return MagicMock(returncode=0, stdout=listing if select else "", stderr="")
+
+    return make_service(root, side_effect=run)
+
+
+def _statements(runner):
+    return [
+        [c.args[i + 1] for i, a in enumerate(c.args) if a == "-c"]
+        for c in runner.run_pixi_command.call_args_list
+    ]
+
+
+def test_psql_connects_with_password_env(tmp_path):
+    service, runner = _psql_service(tmp_path)
+    service.snapshots()
+    call = runner.run_pixi_command.call_args
+    assert call.args[:2] == ("run", "psql")
+    assert ("-p", str(service.port)) == call.args[
+        call.args.index("-p") : call.args.index("-p") + 2
+    ]
+    assert call.kwargs["env"]["PGPASSWORD"] == "password"
+    assert call.kwargs["check"] is False
+
+
+def test_snapshots_strip_prefix(tmp_path):
+    service, _ = _psql_service(tmp_path, "ddx_snapshot_default\nddx_snapshot_seed\n")
+    assert service.snapshots() == ["default", "seed"]
+
+
+def test_snapshot_clones_project_database_as_template(tmp_path):
+    service, runner = _psql_service(tmp_path)
+    service.snapshot("seed")
+    statements = _statements(runner)[-1]
+    assert statements[0].startswith("SELECT pg_terminate_backend")
+    assert statements[1:] == [
+        'DROP DATABASE IF EXISTS "ddx_saving"',
+        'CREATE DATABASE "ddx_saving" TEMPLATE "postgres"',
+        'ALTER DATABASE "ddx_saving" RENAME TO "ddx_snapshot_seed"',
+        'ALTER DATABASE "ddx_snapshot_seed" WITH IS_TEMPLATE true ALLOW_CONNECTIONS false',
+    ]
+
+
+def test_snapshot_replaces_existing_only_after_cloning(tmp_path):
+    service, runner = _psql_service(tmp_path, "ddx_snapshot_seed\n")
+    service.snapshot("seed")
+    statements = _statements(runner)[-1]
+    clone = statements.index('CREATE DATABASE "ddx_saving" TEMPLATE "postgres"')
+    drop = statements.index('DROP DATABASE "ddx_snapshot_seed"')
+    swap = statements.index('ALTER DATABASE "ddx_saving" RENAME TO "ddx_snapshot_seed"')
+    assert clone < drop < swap
+
+
+def test_database_comes_from_postgres_db(tmp_path, monkeypatch):
+    monkeypatch.delenv("POSTGRES_DB", raising=False)
+    service, _ = make_service(tmp_path)
+    assert service.database == "postgres"
+    (tmp_path / ".env").write_text("POSTGRES_DB=from_dotenv\n")
+    assert service.database == "from_dotenv"
+    monkeypatch.setenv("POSTGRES_DB", "from_env")
+    assert service.database == "from_env"
+
+
+def test_restore_clones_before_dropping(tmp_path, monkeypatch):
+    monkeypatch.setenv("POSTGRES_DB", "app")
+    service, runner = _psql_service(tmp_path, "ddx_snapshot_default\n")
+    service.restore()
+    assert _statements(runner)[-1] == [
+        'DROP DATABASE IF EXISTS "ddx_restoring"',
+        'CREATE DATABASE "ddx_restoring" TEMPLATE "ddx_snapshot_default"',
+        'DROP DATABASE IF EXISTS "app" WITH (FORCE)',
+        'ALTER DATABASE "ddx_restoring" RENAME TO "app"',
+    ]
+
+
+def test_restore_unknown_snapshot_raises(tmp_path):
+    service, _ = _psql_service(tmp_path)
+    with pytest.raises(RuntimeError, match="No PostgreSQL snapshot named 'seed'"):
+        service.restore("seed")
+
+
+def test_invalid_snapshot_name_raises(tmp_path):
+    service, runner = _psql_service(tmp_path)
+    with pytest.raises(RuntimeError, match="Invalid snapshot name"):
+        service.snapshot('x"; DROP')
+    runner.run_pixi_command.assert_not_called()
+
+
+def test_psql_failure_raises(tmp_path):
+    fail = MagicMock(returncode=2, stdout="", stderr="FATAL: nope\n")
+    service, _ = make_service(tmp_path, side_effect=[fail])
+    with pytest.raises(RuntimeError, match="psql failed: FATAL: nope"):
+        service.snapshots()
+
+
+def test_reset_restores_default_snapshot(tmp_path):
+    service, runner = _psql_service(tmp_path, "ddx_snapshot_default\n")
+    service.reset()
+    runner.run_manage_command.assert_not_called()
+    assert (
+        'ALTER DATABASE "ddx_restoring" RENAME TO "postgres"'
+        in (_statements(runner)[-1])
+    )
+
+
+def test_clone_databases_recreates_each_from_template(tmp_path):
+    service, runner = _psql_service(tmp_path)
+    service.clone_databases("test_app", ["test_app_1", "test_app_2"])
+    assert _statements(runner)[-1] == [
+        'DROP DATABASE IF EXISTS "test_app_1" WITH (FORCE)',
+        'CREATE DATABASE "test_app_1" TEMPLATE "test_app"',
+        'DROP DATABASE IF EXISTS "test_app_2" WITH (FORCE)',
+        'CREATE DATABASE "test_app_2" TEMPLATE "test_app"',
+    ]
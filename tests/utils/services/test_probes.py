@@ -0,0 +1,273 @@
+"""Tests for the in-process readiness probes, the pixi fallback and readiness waits."""
+
+import shutil
+import socket
+import struct
+import tempfile
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from djdevx.utils.services.postgres import PostgresService
+from djdevx.utils.services.probes import postgres_ready, redis_ready
+from djdevx.utils.services.redis import RedisService
+
+
+@pytest.fixture
+def fake_server():
+    """Serve one connection on 127.0.0.1 with *handler*; return its port and the bytes received."""
+    servers = []
+
+    def start(handler):
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(1)
+        received = bytearray()
+
+        def serve():
+            conn, _ = listener.accept()
+            with conn:
+                handler(conn, received)
+
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+        servers.append((listener, thread))
+        return listener.getsockname()[1], received
+
+    yield start
+    for listener, thread in servers:
+        thread.join(timeout=2)
+        listener.close()
+
+
+def _closed_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _postgres(ssl_answer: bytes, reply: bytes):
+    def handler(conn, received):
+        received += conn.recv(8)
+        conn.sendall(ssl_answer)
+        if ssl_answer == b"N":
+            received += conn.recv(1024)
+            conn.sendall(reply)
+
+    return handler
+
+
+def _pg_error(sqlstate: bytes) -> bytes:
+    body = b"SFATAL\0C" + sqlstate + b"\0Mnope\0\0"
+    return b"E" + struct.pack("!i", len(body) + 4) + body
+
+
+# ── postgres_ready ─────────────────────────────────────────────────────────────
+
+
+def test_postgres_ready_on_auth_request(fake_server):
+    auth_sasl = b"R" + struct.pack("!ii", 23, 10) + b"SCRAM-SHA-256\0\0"
+    port, received = fake_server(_postgres(b"N", auth_sasl))
+    assert postgres_ready("127.0.0.1", port) is True
+    assert bytes(received[:8]) == struct.pack("!ii", 8, 80877103)
+    assert b"user\0postgres\0" in received
+
+
+def test_postgres_not_ready_while_starting_up(fake_server):
+    port, _ = fake_server(_postgres(b"N", _pg_error(b"57P03")))
+    assert postgres_ready("127.0.0.1", port) is False
+
+
+def test_postgres_ready_on_other_errors(fake_server):
+    port, _ = fake_server(_postgres(b"N", _pg_error(b"28P01")))
+    assert postgres_ready("127.0.0.1", port) is True
+
+
+def test_postgres_tls_only_server_is_inconclusive(fake_server):
+    port, _ = fake_server(_postgres(b"S", b""))
+    assert postgres_ready("127.0.0.1", port) is None
+
+
+def test_postgres_ready_over_unix_socket():
+    directory = tempfile.mkdtemp(prefix="ddx")
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(f"{directory}/.s.PGSQL.5432")
+    listener.listen(1)
+
+    def serve():
+        conn, _ = listener.accept()
+        with conn:
+            _postgres(b"N", b"R" + struct.pack("!ii", 8, 0))(conn, bytearray())
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    try:
+        assert postgres_ready(directory, 5432) is True
+    finally:
+        thread.join(timeout=2)
+        listener.close()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_postgres_not_ready_when_nothing_listens():
+    assert postgres_ready("127.0.0.1", _closed_port()) is False
+
+
+def test_postgres_not_ready_on_timeout(fake_server):
+    stop = threading.Event()
+    port, _ = fake_server(lambda conn, received: stop.wait(2))
+    try:
+        assert postgres_ready("127.0.0.1", port, timeout=0.1) is False
+    finally:
+        stop.set()
+
+
+# ── redis_ready ────────────────────────────────────────────────────────────────
+
+
+def _redis(*replies: bytes):
+    def handler(conn, received):
+        received += conn.recv(1024)
+        conn.sendall(b"".join(replies))
+
+    return handler
+
+
+def test_redis_ready_on_pong(fake_server):
+    port, received = fake_server(_redis(b"+OK\r\n", b"+PONG\r\n"))
+    assert redis_ready("127.0.0.1", port, "pw") is True
+    assert bytes(received) == (b"*2\r\n$4\r\nAUTH\r\n$2\r\npw\r\n*1\r\n$4\r\nPING\r\n")
+
+
+def test_redis_without_password_only_pings(fake_server):
+    port, received = fake_server(_redis(b"+PONG\r\n"))
+    assert redis_ready("127.0.0.1", port) is True
+    assert bytes(received) == b"*1\r\n$4\r\nPING\r\n"
+
+
+def test_redis_not_ready_on_wrong_password(fake_server):
+    port, _ = fake_server(
+        _redis(b"-WRONGPASS invalid password\r\n", b"-NOAUTH required\r\n")
+    )
+    assert redis_ready("127.0.0.1", port, "bad") is False
+
+
+def test_redis_unexpected_reply_is_inconclusive(fake_server):
+    port, _ = fake_server(_redis(b"+OK\r\n", b"$4\r\n"))
+    assert redis_ready("127.0.0.1", port, "pw") is None
+
+
+def test_redis_not_ready_when_nothing_listens():
+    assert redis_ready("127.0.0.1", _closed_port(), "pw") is False
+
+
+def test_redis_ready_over_unix_socket():
+    directory = tempfile.mkdtemp(prefix="ddx")
+    path = f"{directory}/redis.sock"
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(path)
+    listener.listen(1)
+
+    def serve():
+        conn, _ = listener.accept()
+        with conn:
+            _redis(b"+OK\r\n", b"+PONG\r\n")(conn, bytearray())
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    try:
+        assert redis_ready(path, 0, "pw") is True
+    finally:
+        thread.join(timeout=2)
+        listener.close()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+# ── BaseDevService.is_up ───────────────────────────────────────────────────────
+
+
+def _service(cls, root):
+    with patch("djdevx.utils.services.base.PixiRunner") as mock_cls:
+        runner = mock_cls.return_value
+        runner.run_pixi_command.return_value = MagicMock(returncode=0, stdout="PONG")
+        return cls(project_root=root), runner
+
+
+@pytest.mark.parametrize("cls", [PostgresService, RedisService])
+@pytest.mark.parametrize("native", [True, False])
+def test_conclusive_native_probe_skips_pixi(tmp_path, cls, native):
+    service, runner = _service(cls, tmp_path)
+    with patch.object(cls, "_native_probe", return_value=native):
+        assert service.is_up() is native
+    runner.run_pixi_command.assert_not_called()
+
+
+@pytest.mark.parametrize("cls", [PostgresService, RedisService])
+def test_inconclusive_native_probe_falls_back_to_pixi(tmp_path, cls):
+    service, runner = _service(cls, tmp_path)
+    with patch.object(cls, "_native_probe", return_value=None):
+        assert service.is_up() is True
+    runner.run_pixi_command.assert_called_once()
+
+
+def test_native_probe_targets_service_port(tmp_path):
+    service, _ = _service(RedisService, tmp_path)
+    with patch("djdevx.utils.services.redis.redis_ready") as mock_ready:
+        service._native_probe()
+    mock_ready.assert_called_once_with(
+        "localhost", service.port, "redis_password", service.probe_timeout
+    )
+
+
+def test_native_probe_targets_redis_unix_socket(tmp_path):
+    (tmp_path / "djdevx.toml").write_text("[dev.redis]\nunix_socket = true\n")
+    service, _ = _service(RedisService, tmp_path)
+    with patch("djdevx.utils.services.redis.redis_ready") as mock_ready:
+        service._native_probe()
+    mock_ready.assert_called_once_with(
+        str(service.unix_socket),
+        service.port,
+        "redis_password",
+        service.probe_timeout,
+    )
+
+
+# ── BaseDevService.wait_until_ready ────────────────────────────────────────────
+
+
+def test_wait_until_ready_backs_off_with_jitter(tmp_path):
+    service, _ = _service(PostgresService, tmp_path)
+    with (
+        patch.object(PostgresService, "probe", side_effect=[False, False, False, True]),
+        patch("djdevx.utils.services.base.random.uniform", return_value=1.0),
+        patch("djdevx.utils.services.base.time.sleep") as mock_sleep,
+    ):
+        service.wait_until_ready(timeout=10, interval=0.1)
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.1, 0.2, 0.4]
+
+
+def test_wait_until_ready_timeout_includes_log_tail(tmp_path):
+    service, _ = _service(PostgresService, tmp_path)
+    service.log_file.parent.mkdir(parents=True, exist_ok=True)
+    service.log_file.write_text(
+        "".join(f"line {i}\n" for i in range(30)) + "FATAL: lock file exists\n"
+    )
+    with (
+        patch.object(PostgresService, "probe", return_value=False),
+        pytest.raises(RuntimeError, match="did not become ready") as excinfo,
+    ):
+        service.wait_until_ready(timeout=0.05, interval=0.01)
+    message = str(excinfo.value)
+    assert message.endswith("FATAL: lock file exists")
+    assert "line 10\n" not in message
+    assert "line 11\n" in message
+
+
+def test_wait_until_ready_without_log(tmp_path):
+    service, _ = _service(RedisService, tmp_path)
+    with (
+        patch.object(RedisService, "probe", return_value=False),
+        pytest.raises(RuntimeError, match=r"within 0.01s$"),
+    ):
+        service.wait_until_ready(timeout=0.01, interval=0.01)
@@ -1,8 +1,29 @@
 """Tests for RedisService — pixi-native local Redis dev service."""
 
+import shutil
+import tempfile
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from djdevx.utils.services.redis import RedisService
+from djdevx.utils.system.runtime_dir import MAX_SOCKET_PATH
+
+
+@pytest.fixture(autouse=True)
+def pixi_probe_only():
+    """Make the native probe inconclusive so ``is_up`` goes through pixi."""
+    with patch.object(RedisService, "_native_probe", return_value=None):
+        yield
+
+
+@pytest.fixture
+def short_tmp_path():
+    # pytest's tmp_path can overflow sun_path; keep the socket path short.
+    path = Path(tempfile.mkdtemp(prefix="ddx"))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
 
 
 def make_service(root, returncode=0, stdout="PONG"):
@@ -55,9 +76,10 @@ def test_is_up_false_without_pong(tmp_path):
 def test_up_starts_redis_server(tmp_path):
     not_running = MagicMock(returncode=1, stdout="")
     ok = MagicMock(returncode=0, stdout="")
+    pong = MagicMock(returncode=0, stdout="PONG")
     with patch("djdevx.utils.services.base.PixiRunner") as mock_cls:
         runner = mock_cls.return_value
-        runner.run_pixi_command.side_effect = [not_running, ok]
+        runner.run_pixi_command.side_effect = [not_running, ok, pong]
         service = RedisService(project_root=tmp_path)
     service.up()
     args = runner.run_pixi_command.call_args_list[1].args
@@ -69,10 +91,18 @@ def test_up_starts_redis_server(tmp_path):
         "redis_password",
         "--dir",
         str(service.data_dir),
+        "--logfile",
+        str(service.log_file),
         "--daemonize",
         "yes",
+        "--save",
+        "",
         "--appendonly",
-        "yes",
+        "no",
+        "--maxmemory",
+        "256mb",
+        "--maxmemory-policy",
+        "allkeys-lru",
     )
     assert service.data_dir.exists()
 
@@ -123,3 +153,88 @@ def test_reset_flushall(tmp_path):
         "redis_password",
         "FLUSHALL",
     )
+
+
+# ── Persistence and memory cap ─────────────────────────────────────────────────
+
+
+def _configure(root, toml):
+    (root / "djdevx.toml").write_text(toml)
+
+
+def test_default_is_capped_non_persistent_lru(tmp_path):
+    service, _ = make_service(tmp_path)
+    assert service.server_settings() == {
+        "save": "",
+        "appendonly": "no",
+        "maxmemory": "256mb",
+        "maxmemory-policy": "allkeys-lru",
+    }
+
+
+def test_aof_persistence_fsyncs_every_second(tmp_path):
+    _configure(
+        tmp_path,
+        '[dev.redis]\npersistence = "aof"\nmaxmemory = "1gb"\n'
+        'maxmemory_policy = "volatile-lru"\n',
+    )
+    service, _ = make_service(tmp_path)
+    settings = service.server_settings()
+    assert settings["appendonly"] == "yes"
+    assert settings["appendfsync"] == "everysec"
+    assert settings["save"] == ""
+    assert settings["maxmemory"] == "1gb"
+    assert settings["maxmemory-policy"] == "volatile-lru"
+
+
+def test_rdb_persistence_uses_save_points(tmp_path):
+    _configure(tmp_path, '[dev.redis]\npersistence = "rdb"\nmaxmemory = 0\n')
+    service, _ = make_service(tmp_path)
+    settings = service.server_settings()
+    assert settings["appendonly"] == "no"
+    assert settings["save"] == "3600 1 300 100 60 10000"
+    assert settings["maxmemory"] == "0"
+
+
+def test_unknown_persistence_raises(tmp_path):
+    _configure(tmp_path, '[dev.redis]\npersistence = "always"\n')
+    service, _ = make_service(tmp_path)
+    with pytest.raises(RuntimeError, match="Unknown \\[dev.redis\\] persistence"):
+        service.server_settings()
+
+
+# ── Unix socket ────────────────────────────────────────────────────────────────
+
+
+def test_tcp_only_by_default(tmp_path):
+    service, _ = make_service(tmp_path)
+    assert service.unix_socket is None
+    assert service.connection_env() == {"REDIS_PORT": str(service.port)}
+    assert "unixsocket" not in service.server_settings()
+
+
+def test_unix_socket_listener_and_env(short_tmp_path):
+    _configure(short_tmp_path, "[dev.redis]\nunix_socket = true\n")
+    service, _ = make_service(short_tmp_path)
+    socket_file = short_tmp_path / ".pixi" / "devdata" / "redis" / "redis.sock"
+    assert service.unix_socket == socket_file
+    settings = service.server_settings()
+    assert settings["unixsocket"] == str(socket_file)
+    assert settings["unixsocketperm"] == "700"
+    assert service.connection_env() == {
+        "REDIS_PORT": str(service.port),
+        "REDIS_SOCKET": str(socket_file),
+    }
+
+
+def test_unix_socket_falls_back_for_deep_projects(
+    tmp_path, short_tmp_path, monkeypatch
+):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(short_tmp_path))
+    deep = tmp_path / ("x" * MAX_SOCKET_PATH)
+    deep.mkdir()
+    _configure(deep, "[dev.redis]\nunix_socket = true\n")
+    service, _ = make_service(deep)
+    assert service.unix_socket.is_relative_to(short_tmp_path)
+    assert len(str(service.unix_socket)) <= MAX_SOCKET_PATH
+    assert service.connection_env()["REDIS_SOCKET"] == str(service.unix_socket)
@@ -1,11 +1,13 @@
 """Tests for resolve_database_dev_service / resolve_cache_dev_service."""
 
 from djdevx.utils.services import (
+    PgBouncerService,
     PostgresService,
     RedisService,
     resolve_cache_dev_service,
     resolve_database_dev_service,
     resolve_dev_services,
+    resolve_pgbouncer_dev_service,
 )
 from djdevx.utils.tracking import ProjectTracking, Section
 
@@ -89,3 +91,29 @@ def test_dev_services_passes_verbose(tmp_path):
     _track_db(tmp_path)
     services = resolve_dev_services(project_root=tmp_path, verbose=True)
     assert all(s.verbose is True for s in services)
+
+
+def _enable_pgbouncer(tmp_path):
+    ProjectTracking(tmp_path).set_dev_config("pgbouncer", {"enabled": True})
+
+
+def test_pgbouncer_none_unless_enabled(tmp_path):
+    _track_db(tmp_path)
+    assert resolve_pgbouncer_dev_service(project_root=tmp_path) is None
+
+
+def test_pgbouncer_none_without_postgres(tmp_path):
+    _enable_pgbouncer(tmp_path)
+    assert resolve_pgbouncer_dev_service(project_root=tmp_path) is None
+
+
+def test_dev_services_put_pgbouncer_last(tmp_path):
+    _track_db(tmp_path)
+    _track_cache(tmp_path)
+    _enable_pgbouncer(tmp_path)
+    services = resolve_dev_services(project_root=tmp_path)
+    assert [type(s) for s in services] == [
+        PostgresService,
+        RedisService,
+        PgBouncerService,
+    ]
@@ -0,0 +1,74 @@
+"""Tests for ServiceScheduler — concurrent startup and error propagation."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from djdevx.utils.services.scheduler import ServiceScheduler
+
+
+def _service(name, is_up=False):
+    service = MagicMock()
+    service.display_name = name
+    service.up.return_value = not is_up
+    return service
+
+
+def test_services_start_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+    db, cache = _service("db"), _service("cache")
+
+    def up():
+        barrier.wait()
+        return True
+
+    db.up.side_effect = up
+    cache.up.side_effect = up
+    with ServiceScheduler([db, cache]) as scheduler:
+        pass
+    assert scheduler.wait_all() == {db: True, cache: True}
+    assert not barrier.broken
+
+
+def test_running_services_are_reported_without_a_second_probe():
+    db = _service("db", is_up=True)
+    with ServiceScheduler([db]) as scheduler:
+        assert scheduler.wait(db) is False
+    db.up.assert_called_once()
+    db.is_up.assert_not_called()
+    db.export_connection_env.assert_called_once()
+
+
+def test_startup_error_surfaces_on_wait():
+    db, cache = _service("db"), _service("cache")
+    db.up.side_effect = RuntimeError("pg_ctl start failed")
+    with pytest.raises(RuntimeError, match="pg_ctl"):
+        with ServiceScheduler([db, cache]) as scheduler:
+            scheduler.wait(db)
+    cache.up.assert_called_once()
+
+
+def test_connection_env_exported_in_given_order():
+    """The pooler's env must win over the database's, whatever starts first."""
+    exported = []
+    db, pooler = _service("db"), _service("pooler")
+    db.export_connection_env.side_effect = lambda env: exported.append("db")
+    pooler.export_connection_env.side_effect = lambda env: exported.append("pooler")
+    db.up.side_effect = lambda: threading.Event().wait(0.05)
+    with ServiceScheduler([db, pooler]) as scheduler:
+        scheduler.wait(db)
+    assert exported == ["db", "pooler"]
+
+
+def test_env_is_exported_on_the_waiting_thread():
+    threads = []
+    db = _service("db")
+    db.connection_env.return_value = {"POSTGRES_PORT": "5433"}
+    db.export_connection_env.side_effect = lambda env: threads.append(
+        threading.current_thread()
+    )
+    with ServiceScheduler([db]) as scheduler:
+        scheduler.wait(db)
+    db.export_connection_env.assert_called_once_with({"POSTGRES_PORT": "5433"})
+    assert threads == [threading.current_thread()]
@@ -0,0 +1,265 @@
+"""Tests for the dev daemon: Supervisor control API, crash restarts and DaemonClient."""
+
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from djdevx.utils.project.project_structure import ProjectStructure
+from djdevx.utils.system.runtime_dir import MAX_SOCKET_PATH
+from djdevx.utils.services.daemon_client import DaemonClient, DaemonError, socket_path
+from djdevx.utils.services.supervisor import Supervisor
+
+
+def _service(name, up=True, log_file=None):
+    service = MagicMock()
+    service.name = name
+    service.display_name = name.title()
+    service.port = 5000 + len(name)
+    service.connection_env.return_value = {f"{name.upper()}_PORT": str(service.port)}
+    service.log_file = log_file
+    service.probe.return_value = up
+    service.is_up.return_value = up
+
+    def start():
+        started = not service.probe.return_value
+        service.probe.return_value = service.is_up.return_value = True
+        return started
+
+    service.up.side_effect = start
+    return service
+
+
+@pytest.fixture
+def sock_dir():
+    # pytest's tmp_path can overflow sun_path; keep the socket path short.
+    path = Path(tempfile.mkdtemp(prefix="ddx"))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture
+def daemon(sock_dir):
+    """Serve a Supervisor on a background thread; yield (supervisor, client)."""
+    running = []
+
+    def start(*services, bring_up=False):
+        supervisor = Supervisor(services, sock_dir / "ddx.sock", monitor_interval=0.02)
+        thread = threading.Thread(
+            target=supervisor.serve, kwargs={"bring_up": bring_up}, daemon=True
+        )
+        thread.start()
+        running.append((supervisor, thread))
+        client = DaemonClient(supervisor.path)
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            try:
+                client.call("ping", timeout=1)
+                break
+            except OSError:
+                time.sleep(0.01)
+        return supervisor, client
+
+    yield start
+    for supervisor, thread in running:
+        supervisor.shutdown()
+        thread.join(timeout=5)
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+# ── Control API ────────────────────────────────────────────────────────────────
+
+
+def test_serve_brings_services_up_and_supervises_them(daemon):
+    db = _service("postgres", up=False)
+    supervisor, client = daemon(db, bring_up=True)
+    _wait_for(lambda: "postgres" in supervisor.supervised)
+    db.up.assert_called_once()
+
+
+def test_up_starts_and_supervises_services(daemon):
+    db = _service("postgres", up=False)
+    supervisor, client = daemon(db)
+    result = client.call("up")
+    db.up.assert_called_once()
+    assert result == [
+        {
+            "name": "postgres",
+            "display_name": "Postgres",
+            "port": db.port,
+            "env": {"POSTGRES_PORT": str(db.port)},
+            "supervised": True,
+            "restarts": 0,
+            "up": True,
+            "started": True,
+        }
+    ]
+
+
+def test_status_reports_each_service(daemon):
+    supervisor, client = daemon(_service("postgres"), _service("redis", up=False))
+    state = client.call("status")
+    assert state["pid"] > 0
+    assert [(s["name"], s["up"]) for s in state["services"]] == [
+        ("postgres", True),
+        ("redis", False),
+    ]
+
+
+def test_down_stops_running_services_and_ends_supervision(daemon):
+    db, cache = _service("postgres"), _service("redis", up=False)
+    supervisor, client = daemon(db, cache)
+    client.call("up", services=["postgres"])
+    result = client.call("down")
+    db.down.assert_called_once()
+    cache.down.assert_not_called()
+    assert [(s["name"], s["stopped"]) for s in result] == [
+        ("postgres", True),
+        ("redis", False),
+    ]
+    assert supervisor.supervised == set()
+
+
+def test_down_selects_services_by_name(daemon):
+    db, cache = _service("postgres"), _service("redis")
+    supervisor, client = daemon(db, cache, bring_up=True)
+    _wait_for(lambda: len(supervisor.supervised) == 2)
+    client.call("down", services=["redis"])
+    db.down.assert_not_called()
+    cache.down.assert_called_once()
+    assert supervisor.supervised == {"postgres"}
+
+
+def test_unknown_service_and_command_are_errors(daemon):
+    supervisor, client = daemon(_service("postgres"))
+    with pytest.raises(DaemonError, match="no service redis"):
+        client.call("up", services=["redis"])
+    with pytest.raises(DaemonError, match="Unknown dev daemon command"):
+        client.call("reboot")
+
+
+def test_failed_initial_start_keeps_daemon_alive(daemon):
+    db = _service("postgres", up=False)
+    db.up.side_effect = RuntimeError("initdb failed")
+    supervisor, client = daemon(db, bring_up=True)
+    with pytest.raises(DaemonError, match="initdb failed"):
+        client.call("up")
+    assert client.call("ping")["pid"] > 0
+
+
+def test_shutdown_stops_serving_and_removes_socket(daemon):
+    db = _service("postgres")
+    supervisor, client = daemon(db)
+    client.call("shutdown")
+    _wait_for(lambda: not supervisor.path.exists())
+    db.down.assert_not_called()
+
+
+# ── Supervision ────────────────────────────────────────────────────────────────
+
+
+def test_crashed_service_is_restarted(daemon):
+    db = _service("postgres")
+    supervisor, client = daemon(db)
+    client.call("up")
+    db.up.reset_mock()
+    db.probe.return_value = False
+    _wait_for(lambda: db.up.called)
+    assert client.call("status")["services"][0]["restarts"] == 1
+
+
+def test_stopped_service_is_not_restarted(daemon):
+    db = _service("postgres")
+    supervisor, client = daemon(db)
+    client.call("up")
+    client.call("down")
+    db.up.reset_mock()
+    db.probe.return_value = False
+    time.sleep(0.1)
+    db.up.assert_not_called()
+
+
+# ── Logs ───────────────────────────────────────────────────────────────────────
+
+
+def test_logs_tail_every_service_log(daemon, tmp_path):
+    pg_log, redis_log = tmp_path / "postgres.log", tmp_path / "redis.log"
+    pg_log.write_text("pg 1\npg 2\n")
+    redis_log.write_text("redis 1\n")
+    supervisor, client = daemon(
+        _service("postgres", log_file=pg_log), _service("redis", log_file=redis_log)
+    )
+    entries = list(client.stream("logs", lines=1))
+    assert entries == [
+        {"service": "postgres", "line": "pg 2"},
+        {"service": "redis", "line": "redis 1"},
+    ]
+
+
+def test_logs_follow_streams_appended_lines(daemon, tmp_path):
+    log = tmp_path / "redis.log"
+    log.write_text("old\n")
+    supervisor, client = daemon(_service("redis", log_file=log))
+    stream = client.stream("logs", follow=True, lines=1)
+    assert next(stream) == {"service": "redis", "line": "old"}
+    with log.open("a") as fh:
+        fh.write("new line\npartial")
+    assert next(stream) == {"service": "redis", "line": "new line"}
+    stream.close()
+
+
+# ── Binding and client ─────────────────────────────────────────────────────────
+
+
+def test_second_daemon_refuses_to_start(daemon):
+    supervisor, client = daemon(_service("postgres"))
+    with pytest.raises(DaemonError, match="already running"):
+        Supervisor([], supervisor.path).serve()
+
+
+def test_stale_socket_is_replaced(daemon, sock_dir):
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(sock_dir / "ddx.sock"))
+    stale.close()
+    supervisor, client = daemon(_service("postgres"))
+    assert client.call("ping")["pid"] > 0
+
+
+def test_connect_without_daemon_returns_none(tmp_path):
+    assert DaemonClient.connect(tmp_path) is None
+
+
+def test_socket_path_falls_back_for_deep_projects(sock_dir, monkeypatch):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(sock_dir))
+    assert socket_path(ProjectStructure(Path("/srv/app"))) == Path(
+        "/srv/app/.pixi/devdata/ddx.sock"
+    )
+    deep = ProjectStructure(Path("/" + "x" * MAX_SOCKET_PATH))
+    path = socket_path(deep)
+    assert path.name == "ddx.sock" and len(str(path)) <= MAX_SOCKET_PATH
+    assert path.is_relative_to(sock_dir / "djdevx")
+    assert path.parent.stat().st_mode & 0o777 == 0o700
+
+
+def test_socket_is_created_private(daemon):
+    supervisor, client = daemon(_service("postgres"))
+    assert supervisor.path.stat().st_mode & 0o777 == 0o600
+
+
+def test_socket_of_another_user_is_not_trusted(daemon, monkeypatch):
+    supervisor, client = daemon(_service("postgres"))
+    monkeypatch.setattr(os, "getuid", lambda: supervisor.path.stat().st_uid + 1)
+    with pytest.raises(DaemonError, match="not the current user"):
+        client.call("ping")
@@ -0,0 +1,92 @@
+"""Tests for TemplateManager's shared environments and bytecode cache."""
+
+import os
+from unittest.mock import patch
+
+from djdevx.utils.templates import manager
+from djdevx.utils.templates.manager import TemplateManager, get_environment
+
+
+def test_environment_is_shared_per_loader_root(tmp_path):
+    assert get_environment(tmp_path) is get_environment(tmp_path / ".")
+    assert get_environment(tmp_path) is not get_environment(tmp_path / "other")
+    assert get_environment() is get_environment()
+
+
+def test_compiled_templates_are_persisted(tmp_path):
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "settings.py.j2").write_text("NAME = '{{ project_name }}'\n")
+
+    TemplateManager().copy_templates(source, tmp_path / "out", {"project_name": "a"})
+
+    cache_dir = manager.user_cache_dir("jinja")
+    assert any(cache_dir.glob("__jinja2_*.cache"))
+    assert (tmp_path / "out" / "settings.py").read_text() == "NAME = 'a'\n"
+
+
+def test_changed_template_is_recompiled(tmp_path):
+    source = tmp_path / "src"
+    source.mkdir()
+    template = source / "f.txt.j2"
+    template.write_text("one {{ x }}")
+    TemplateManager().copy_templates(source, tmp_path / "out", {"x": 1})
+
+    template.write_text("two {{ x }}")
+    stat = template.stat()
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+    TemplateManager().copy_templates(source, tmp_path / "out", {"x": 2})
+
+    assert (tmp_path / "out" / "f.txt").read_text() == "two 2\n"
+
+
+def test_path_components_are_rendered_once_per_copy(tmp_path):
+    source = tmp_path / "src"
+    app_dir = source / "{{ app }}"
+    app_dir.mkdir(parents=True)
+    for name in ("a.py", "b.py", "c.py"):
+        (app_dir / name).write_text("")
+
+    tm = TemplateManager()
+    with patch.object(
+        TemplateManager,
+        "render_template_string",
+        wraps=TemplateManager.render_template_string,
+    ) as render:
+        paths = tm.scan_templates(source, {"app": "blog"})
+
+    assert sorted(map(str, paths)) == ["blog/a.py", "blog/b.py", "blog/c.py"]
+    assert [c.args[0] for c in render.call_args_list].count("{{ app }}") == 1
+
+
+def test_incremental_copy_reports_and_skips_unchanged(tmp_path):
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "a.py.j2").write_text("A = {{ value }}\n")
+    (source / "static.txt").write_text("static\n")
+    dest = tmp_path / "out"
+
+    first = TemplateManager().copy_templates(source, dest, {"value": 1})
+    assert sorted(p.name for p in first.created) == ["a.py", "static.txt"]
+    assert first.updated == first.unchanged == []
+
+    mtime = (dest / "a.py").stat().st_mtime_ns
+    second = TemplateManager().copy_templates(source, dest, {"value": 1})
+    assert second.changed == []
+    assert sorted(p.name for p in second.unchanged) == ["a.py", "static.txt"]
+    assert (dest / "a.py").stat().st_mtime_ns == mtime
+
+    third = TemplateManager().copy_templates(source, dest, {"value": 2})
+    assert third.updated == [dest / "a.py"]
+    assert (dest / "a.py").read_text() == "A = 2\n"
+
+
+def test_non_incremental_copy_rewrites_everything(tmp_path):
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "a.py.j2").write_text("A = 1\n")
+    TemplateManager().copy_templates(source, tmp_path / "out")
+    report = TemplateManager().copy_templates(
+        source, tmp_path / "out", incremental=False
+    )
+    assert report.updated == [tmp_path / "out" / "a.py"]